@@ -0,0 +1,84 @@
+import argparse
+import time
+import typing as t
+
+from synthetic import fake_droplets
+
+from dolib import Client
+from dolib.hooks import Hooks, ResponseEvent
+from dolib.simulator import Simulator
+
+
+class Transferred(Hooks):
+    def __init__(self) -> None:
+        self.pages = 0
+        self.bytes = 0
+        self.seconds = 0.0
+
+    def on_response(self, event: ResponseEvent) -> None:
+        self.pages += 1
+        self.bytes += event.response_bytes
+        self.seconds += event.elapsed
+
+
+def listing(
+    simulator: Simulator, compression: bool, repeat: int
+) -> t.Tuple[Transferred, float]:
+    transferred = Transferred()
+    with Client(
+        token="fake_token",
+        transport=simulator,
+        rate_limiter=False,
+        compression=compression,
+        hooks=[transferred],
+    ) as client:
+        best = float("inf")
+        for _ in range(repeat):
+            start = time.perf_counter()
+            client.fetch_all(endpoint="droplets", key="droplets")
+            best = min(best, time.perf_counter() - start)
+    return transferred, best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Listings with and without gzip")
+    parser.add_argument("--count", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--latency", type=float, default=0.02)
+    parser.add_argument(
+        "--bandwidth",
+        type=float,
+        default=50.0,
+        help="simulated bandwidth in Mbit/s, 0 for unlimited",
+    )
+    args = parser.parse_args()
+
+    simulator = Simulator(
+        latency=args.latency,
+        ratelimit=None,
+        bandwidth=args.bandwidth * 1e6 / 8 or None,
+    )
+    for droplet in fake_droplets(args.count):
+        simulator.add("droplets", droplet)
+
+    print(
+        "{count} droplets, {latency}s latency, {bandwidth} Mbit/s".format(
+            count=args.count,
+            latency=args.latency,
+            bandwidth=args.bandwidth or "unlimited",
+        )
+    )
+    for compression in (False, True):
+        transferred, seconds = listing(simulator, compression, args.repeat)
+        print(
+            "  {name:8} {size:8.2f} MB {page_ms:8.2f} ms/page {seconds:8.3f}s".format(
+                name="gzip" if compression else "identity",
+                size=transferred.bytes / args.repeat / 1e6,
+                page_ms=transferred.seconds / transferred.pages * 1000,
+                seconds=seconds,
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+import argparse
+import time
+import typing as t
+
+from dolib import Client
+from dolib.models import Domain
+from dolib.simulator import Simulator
+
+
+def account(count: int) -> Simulator:
+    simulator = Simulator(ratelimit=None)
+    simulator.add("domains", {"name": "example.com"})
+    for i in range(count):
+        simulator.add(
+            "domains/example.com/records",
+            {"type": "A", "name": "host-{i}".format(i=i), "data": "10.0.0.1"},
+        )
+    return simulator
+
+
+def desired(count: int, changed: int) -> t.List[Domain.Record]:
+    # changed records get new data, as many are removed and added
+    records = []
+    for i in range(changed, count):
+        data = "10.0.0.2" if i < 2 * changed else "10.0.0.1"
+        records.append(Domain.Record(type="A", name="host-{i}".format(i=i), data=data))
+    for i in range(changed):
+        records.append(Domain.Record(type="A", name="new-{i}".format(i=i), data="1"))
+    return records
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="domains.sync() of a large zone")
+    parser.add_argument("--count", type=int, default=5000)
+    parser.add_argument("--changed", type=int, default=250)
+    parser.add_argument("--latency", type=float, default=0.02)
+    args = parser.parse_args()
+
+    records = desired(args.count, args.changed)
+    print(
+        "{count} records, {changed} changed, removed and added, "
+        "{latency}s latency".format(
+            count=args.count, changed=args.changed, latency=args.latency
+        )
+    )
+    for concurrency in (1, 10, 50):
+        simulator = account(args.count)
+        with Client(
+            token="fake_token",
+            transport=simulator,
+            rate_limiter=False,
+            validate=False,
+            page_concurrency=8,
+        ) as client:
+            simulator.latency = args.latency
+            start = time.perf_counter()
+            result = client.domains.sync(
+                "example.com", records, concurrency=concurrency
+            )
+            print(
+                "  concurrency={concurrency:<3} {seconds:8.3f}s {requests:6} requests "
+                "{changes} changes".format(
+                    concurrency=concurrency,
+                    seconds=time.perf_counter() - start,
+                    requests=simulator.requests,
+                    changes=result.changes,
+                )
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+import argparse
+import asyncio
+import time
+
+from synthetic import fake_droplets
+
+from dolib import AsyncClient, Client
+from dolib.simulator import Simulator
+
+
+def report(name: str, seconds: float, simulator: Simulator) -> None:
+    print(
+        "  {name:34} {seconds:8.3f}s {requests:6} requests".format(
+            name=name, seconds=seconds, requests=simulator.requests
+        )
+    )
+    simulator.requests = 0
+
+
+async def async_cases(simulator: Simulator, ids: list, callers: int) -> None:
+    async with AsyncClient(
+        token="fake_token", transport=simulator, rate_limiter=False, validate=False
+    ) as client:
+        start = time.perf_counter()
+        await client.droplets.get_many(ids)
+        report("async get_many()", time.perf_counter() - start, simulator)
+
+        # callers asking for the same droplets at the same time
+        for coalesce in (False, True):
+            client.coalesce = coalesce
+            start = time.perf_counter()
+            await asyncio.gather(
+                *[client.droplets.get_many(ids) for _ in range(callers)]
+            )
+            report(
+                "{callers} x get_many(), coalesce={coalesce}".format(
+                    callers=callers, coalesce=coalesce
+                ),
+                time.perf_counter() - start,
+                simulator,
+            )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="get() vs get_many()")
+    parser.add_argument("--count", type=int, default=300)
+    parser.add_argument("--latency", type=float, default=0.05)
+    parser.add_argument("--callers", type=int, default=5)
+    args = parser.parse_args()
+
+    simulator = Simulator(latency=args.latency, ratelimit=None)
+    for droplet in fake_droplets(args.count):
+        simulator.add("droplets", droplet)
+    ids = [str(droplet["id"]) for droplet in simulator.items("droplets")]
+    print(
+        "{count} droplets, {latency}s latency".format(
+            count=args.count, latency=args.latency
+        )
+    )
+
+    with Client(
+        token="fake_token", transport=simulator, rate_limiter=False, validate=False
+    ) as client:
+        start = time.perf_counter()
+        for id in ids:
+            client.droplets.get(id)
+        report("get() loop", time.perf_counter() - start, simulator)
+
+        start = time.perf_counter()
+        client.droplets.get_many(ids)
+        report("get_many()", time.perf_counter() - start, simulator)
+
+        start = time.perf_counter()
+        client.droplets.get_many(ids, max_workers=50)
+        report("get_many(max_workers=50)", time.perf_counter() - start, simulator)
+
+    asyncio.run(async_cases(simulator, ids, args.callers))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+import argparse
+import asyncio
+import statistics
+import time
+import typing as t
+
+from server import Server
+from synthetic import fake_droplets
+
+from dolib import AsyncClient
+from dolib.hooks import Hooks, ResponseEvent
+from dolib.simulator import Simulator
+
+
+class Latencies(Hooks):
+    def __init__(self) -> None:
+        self.elapsed: t.List[float] = []
+
+    def on_response(self, event: ResponseEvent) -> None:
+        self.elapsed.append(event.elapsed)
+
+
+async def polls(
+    server: Server, http2: bool, ids: t.List[str], concurrency: int
+) -> t.Dict[str, t.Any]:
+    # concurrent droplets.get() of all ids like action or status polling
+    latencies = Latencies()
+    connections = server.connections
+    async with AsyncClient(
+        token="fake_token",
+        base_url=server.base_url,
+        rate_limiter=False,
+        max_connections=concurrency,
+        max_keepalive_connections=concurrency,
+        http2=http2,
+        hooks=[latencies],
+    ) as client:
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def get(droplet_id: str) -> None:
+            async with semaphore:
+                await client.droplets.get(droplet_id)
+
+        start = time.perf_counter()
+        await asyncio.gather(*(get(droplet_id) for droplet_id in ids))
+        seconds = time.perf_counter() - start
+
+    elapsed = sorted(latencies.elapsed)
+    return {
+        "connections": server.connections - connections,
+        "seconds": seconds,
+        "requests_per_second": len(ids) / seconds,
+        "p50_ms": statistics.median(elapsed) * 1000,
+        "p95_ms": elapsed[int(len(elapsed) * 0.95) - 1] * 1000,
+    }
+
+
+async def run(args: argparse.Namespace) -> None:
+    simulator = Simulator(latency=args.latency, ratelimit=None, compression=False)
+    ids = [
+        str(simulator.add("droplets", droplet)["id"])
+        for droplet in fake_droplets(args.requests)
+    ]
+    server = Server(simulator)
+    await server.start()
+    print(
+        "{requests} droplets.get(), concurrency {concurrency}, "
+        "{latency}s server latency".format(
+            requests=args.requests, concurrency=args.concurrency, latency=args.latency
+        )
+    )
+    try:
+        for http2 in (False, True):
+            result = await polls(server, http2, ids, args.concurrency)
+            print(
+                "  {name:9} {connections:4} connections {rps:8.1f} req/s "
+                "p50 {p50:7.2f} ms p95 {p95:7.2f} ms".format(
+                    name="HTTP/2" if http2 else "HTTP/1.1",
+                    connections=result["connections"],
+                    rps=result["requests_per_second"],
+                    p50=result["p50_ms"],
+                    p95=result["p95_ms"],
+                )
+            )
+    finally:
+        await server.stop()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="HTTP/1.1 pool vs HTTP/2")
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=200)
+    parser.add_argument("--latency", type=float, default=0.02)
+    args = parser.parse_args()
+    asyncio.get_event_loop().run_until_complete(run(args))
+
+
+if __name__ == "__main__":
+    main()
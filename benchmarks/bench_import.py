@@ -0,0 +1,57 @@
+import argparse
+import statistics
+import subprocess
+import sys
+import typing as t
+
+# modules which must not be imported by "import dolib" and creating a client
+LAZY_MODULES = ["pkg_resources", "pydantic", "asyncio", "dolib.models"]
+
+SCRIPT = """
+import sys
+import dolib
+client = dolib.Client(token="fake_token")
+print(",".join(name for name in {modules!r} if name in sys.modules))
+"""
+
+
+def import_time() -> t.Tuple[float, t.List[str]]:
+    # cumulative import time of dolib in ms and lazy modules which were imported
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", SCRIPT.format(modules=LAZY_MODULES)],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        universal_newlines=True,
+        check=True,
+    )
+    cumulative = 0.0
+    for line in process.stderr.splitlines():
+        # "import time: <self us> | <cumulative us> | <module>"
+        if line.endswith("| dolib"):
+            cumulative = int(line.split("|")[1]) / 1000
+    imported = [name for name in process.stdout.strip().split(",") if name]
+    return cumulative, imported
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="import time of dolib")
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument("--max-ms", type=float, default=None)
+    args = parser.parse_args()
+
+    times = []
+    imported: t.List[str] = []
+    for _ in range(args.repeat):
+        cumulative, imported = import_time()
+        times.append(cumulative)
+    median = statistics.median(times)
+
+    print("import dolib: median {median:.1f} ms".format(median=median))
+    if imported:
+        print("eagerly imported: {modules}".format(modules=", ".join(imported)))
+    if imported or (args.max_ms is not None and median > args.max_ms):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
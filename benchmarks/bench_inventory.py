@@ -0,0 +1,111 @@
+import argparse
+import os
+import tempfile
+import time
+
+from common import measure
+from synthetic import fake_droplets
+
+from dolib import Client
+from dolib.inventory import Inventory, InventoryStore
+from dolib.simulator import Simulator
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="SQLite inventory refresh and reads")
+    parser.add_argument("--count", type=int, default=10000)
+    parser.add_argument("--changed", type=int, default=100)
+    args = parser.parse_args()
+
+    simulator = Simulator(ratelimit=None)
+    for i, droplet in enumerate(fake_droplets(args.count)):
+        private = dict(
+            droplet["networks"]["v4"][0],
+            ip_address="10.{0}.{1}.{2}".format(i >> 16, i >> 8 & 255, i & 255),
+        )
+        droplet["networks"] = dict(droplet["networks"], v4=[private])
+        simulator.add("droplets", droplet)
+
+    with tempfile.TemporaryDirectory() as directory, Client(
+        token="fake_token", transport=simulator, rate_limiter=False
+    ) as client:
+        store = InventoryStore(os.path.join(directory, "inventory.db"))
+        print("{count} droplets".format(count=args.count))
+
+        start = time.perf_counter()
+        changes = store.refresh(client, types=["droplets"])
+        print(
+            "  first refresh:    {seconds:8.3f}s {changes} changes".format(
+                seconds=time.perf_counter() - start, changes=len(changes)
+            )
+        )
+
+        for droplet in simulator.items("droplets")[: args.changed]:
+            droplet["status"] = "off"
+        start = time.perf_counter()
+        changes = store.refresh(client, types=["droplets"])
+        print(
+            "  refresh:          {seconds:8.3f}s {changes} changes".format(
+                seconds=time.perf_counter() - start, changes=len(changes)
+            )
+        )
+
+        start = time.perf_counter()
+        client.droplets.all()
+        print(
+            "  droplets.all():   {seconds:8.3f}s".format(
+                seconds=time.perf_counter() - start
+            )
+        )
+        print(
+            "  store.get():      {us:8.1f}us".format(
+                us=measure(lambda: store.get("droplets", 100000 + args.count // 2))
+                * 1e6
+            )
+        )
+        print(
+            "  store.all():      {seconds:8.3f}s".format(
+                seconds=measure(lambda: store.all("droplets"))
+            )
+        )
+        print(
+            "  store.changes():  {ms:8.3f}ms".format(
+                ms=measure(lambda: store.changes(since=args.count)) * 1000
+            )
+        )
+
+        droplets = client.droplets.all()
+        inventory = Inventory()
+        print(
+            "  Inventory.update: {seconds:8.3f}s".format(
+                seconds=measure(lambda: Inventory().update("droplets", droplets), 1)
+            )
+        )
+        inventory.update("droplets", droplets)
+        ip = droplets[-1].networks.v4[0].ip_address
+        print(
+            "  find(ip=...):     {us:8.1f}us, scan {scan:8.1f}us".format(
+                us=measure(lambda: inventory.find("droplets", ip=ip)) * 1e6,
+                scan=measure(
+                    lambda: [
+                        droplet
+                        for droplet in droplets
+                        for network in droplet.networks.v4
+                        if network.ip_address == ip
+                    ]
+                )
+                * 1e6,
+            )
+        )
+        start = time.perf_counter()
+        inventory.apply(store.changes(since=args.count))
+        print(
+            "  apply changes:    {ms:8.3f}ms".format(
+                ms=(time.perf_counter() - start) * 1000
+            )
+        )
+        store.close()
+
+
+if __name__ == "__main__":
+    main()
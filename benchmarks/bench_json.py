@@ -0,0 +1,84 @@
+import argparse
+import glob
+import json
+import os
+import typing as t
+
+import yaml
+from common import droplets, measure
+
+from dolib.codec import CODECS, get_codec
+
+CASSETTES = os.path.join(os.path.dirname(__file__), "..", "tests", "cassettes")
+
+
+def cassette_bodies() -> t.Tuple[t.List[bytes], t.List[t.Any]]:
+    # response bodies and decoded request bodies of all recorded interactions
+    responses, requests = [], []
+    for path in glob.glob(os.path.join(CASSETTES, "**", "*.yaml"), recursive=True):
+        with open(path, encoding="utf-8") as fp:
+            cassette = yaml.safe_load(fp)
+        for interaction in cassette["interactions"]:
+            body = interaction["request"].get("body")
+            if body:
+                requests.append(json.loads(body))
+            response = interaction["response"]
+            content = response.get("content") or response.get("body", {}).get("string")
+            if isinstance(content, str):
+                content = content.encode("utf-8")
+            try:
+                json.loads(content or b"")
+            except ValueError:
+                continue
+            responses.append(content)
+    return responses, requests
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="JSON codecs over cassettes")
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    responses, requests = cassette_bodies()
+    page = json.dumps({"droplets": droplets(200)}).encode("utf-8")
+    print(
+        "{responses} responses ({size:.1f} MB), {requests} request bodies".format(
+            responses=len(responses),
+            size=sum(map(len, responses)) / 1e6,
+            requests=len(requests),
+        )
+    )
+
+    for name, (_, module) in CODECS.items():
+        if module is None:
+            print("  {name:7} not installed".format(name=name))
+            continue
+        codec = get_codec(name)
+
+        def decode() -> None:
+            for _ in range(args.repeat):
+                for content in responses:
+                    codec.loads(content)
+
+        def encode() -> None:
+            for _ in range(args.repeat):
+                for body in requests:
+                    codec.dumps(body)
+
+        def decode_page() -> None:
+            for _ in range(args.repeat):
+                codec.loads(page)
+
+        print(
+            "  {name:7} decode {decode:.3f}s  encode {encode:.3f}s  "
+            "200 droplets page {page:.4f}s".format(
+                name=name,
+                decode=measure(decode),
+                encode=measure(encode),
+                page=measure(decode_page) / args.repeat,
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
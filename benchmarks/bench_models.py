@@ -0,0 +1,29 @@
+import argparse
+
+from common import droplets, measure, mock_client, paginated_transport
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="droplets.all() parse time")
+    parser.add_argument("--count", type=int, default=10000)
+    args = parser.parse_args()
+
+    client = mock_client(paginated_transport("droplets", droplets(args.count)))
+    validated = measure(lambda: client.droplets.all())
+    trusted = measure(lambda: client.droplets.all(validate=False))
+    lazy_client = mock_client(
+        paginated_transport("droplets", droplets(args.count)), lazy=True
+    )
+    lazy = measure(lambda: [(d.id, d.name) for d in lazy_client.droplets.all()])
+    raw = measure(lambda: client.fetch_all(endpoint="droplets", key="droplets"))
+
+    print("droplets.all() with {count} droplets".format(count=args.count))
+    print("  validated:       {time:.3f}s".format(time=validated))
+    print("  validate=False:  {time:.3f}s".format(time=trusted))
+    print("  lazy, id + name: {time:.3f}s".format(time=lazy))
+    print("  raw fetch_all:   {time:.3f}s".format(time=raw))
+    print("  speedup:         {ratio:.1f}x".format(ratio=validated / trusted))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+import argparse
+import tracemalloc
+import typing as t
+from collections import defaultdict
+
+from common import droplets, measure
+
+from dolib.models import Droplet
+from dolib.table import DropletTable
+
+REGIONS = ["ams3", "fra1", "lon1", "nyc1", "nyc3", "sfo3", "sgp1", "tor1"]
+TAGS = ["web", "db", "cache", "prod", "staging"]
+
+
+def fleet(count: int) -> t.List[t.Dict[str, t.Any]]:
+    items = droplets(count)
+    for i, item in enumerate(items):
+        item["region"] = dict(item["region"], slug=REGIONS[i % len(REGIONS)])
+        item["vcpus"] = 1 + i % 4
+        item["tags"] = [TAGS[i % len(TAGS)], TAGS[i % 2 + 3]]
+    return items
+
+
+def allocated(func: t.Callable[[], t.Any]) -> t.Tuple[t.Any, int]:
+    tracemalloc.start()
+    result = func()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, size
+
+
+def vcpus_by_region(items: t.List[Droplet]) -> t.Dict[str, int]:
+    totals: t.Dict[str, int] = defaultdict(int)
+    for droplet in items:
+        totals[droplet.region.slug] += droplet.vcpus
+    return totals
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="DropletTable vs list of models")
+    parser.add_argument("--count", type=int, default=50000)
+    args = parser.parse_args()
+
+    items = fleet(args.count)
+    models, models_size = allocated(lambda: [Droplet(**item) for item in items])
+    table, table_size = allocated(lambda: DropletTable.from_droplets(items))
+    assert vcpus_by_region(models) == table.sum("vcpus", by="region")
+
+    print("{count} droplets".format(count=args.count))
+    print("  memory, models: {size:.1f} MB".format(size=models_size / 1e6))
+    print("  memory, table:  {size:.1f} MB".format(size=table_size / 1e6))
+    print(
+        "  vcpus by region, models: {time:.4f}s".format(
+            time=measure(lambda: vcpus_by_region(models))
+        )
+    )
+    print(
+        "  vcpus by region, table:  {time:.4f}s".format(
+            time=measure(lambda: table.sum("vcpus", by="region"))
+        )
+    )
+    print(
+        "  active web droplets, models: {time:.4f}s".format(
+            time=measure(
+                lambda: [
+                    droplet
+                    for droplet in models
+                    if droplet.status == "active" and "web" in droplet.tags
+                ]
+            )
+        )
+    )
+    print(
+        "  active web droplets, table:  {time:.4f}s".format(
+            time=measure(lambda: len(table.filter(status="active", tag="web")))
+        )
+    )
+    print(
+        "  4 vcpus in fra1, models: {time:.4f}s".format(
+            time=measure(
+                lambda: [
+                    droplet
+                    for droplet in models
+                    if droplet.vcpus == 4 and droplet.region.slug == "fra1"
+                ]
+            )
+        )
+    )
+    print(
+        "  4 vcpus in fra1, table:  {time:.4f}s".format(
+            time=measure(lambda: len(table.filter(vcpus=4, region="fra1")))
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
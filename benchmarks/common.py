@@ -0,0 +1,121 @@
+import time
+import typing as t
+
+import httpx
+
+from dolib import Client
+
+DROPLET = {
+    "name": "dolib-droplet",
+    "memory": 1024,
+    "vcpus": 1,
+    "disk": 25,
+    "locked": False,
+    "status": "active",
+    "kernel": None,
+    "created_at": "2021-05-25T16:50:47Z",
+    "features": ["private_networking"],
+    "backup_ids": [],
+    "next_backup_window": None,
+    "snapshot_ids": [],
+    "image": {
+        "id": 83501654,
+        "name": "18.04 (LTS) x64",
+        "distribution": "Ubuntu",
+        "slug": "ubuntu-18-04-x64",
+        "public": True,
+        "regions": ["nyc3", "nyc1", "sfo1", "nyc2", "ams2", "sgp1", "lon1"],
+        "created_at": "2021-05-14T18:15:50Z",
+        "min_disk_size": 15,
+        "type": "base",
+        "size_gigabytes": 0.42,
+        "description": "Ubuntu 18.04 x86 image",
+        "tags": [],
+        "status": "available",
+    },
+    "volume_ids": [],
+    "size": {
+        "slug": "s-1vcpu-1gb",
+        "memory": 1024,
+        "vcpus": 1,
+        "disk": 25,
+        "transfer": 1.0,
+        "price_monthly": 5.0,
+        "price_hourly": 0.00744,
+        "regions": ["ams2", "ams3", "blr1", "fra1", "lon1", "nyc1", "nyc2"],
+        "available": True,
+    },
+    "size_slug": "s-1vcpu-1gb",
+    "networks": {
+        "v4": [
+            {
+                "ip_address": "10.135.125.214",
+                "netmask": "255.255.0.0",
+                "gateway": "10.135.0.1",
+                "type": "private",
+            },
+            {
+                "ip_address": "46.101.238.104",
+                "netmask": "255.255.192.0",
+                "gateway": "46.101.192.1",
+                "type": "public",
+            },
+        ],
+        "v6": [],
+    },
+    "region": {
+        "name": "Frankfurt 1",
+        "slug": "fra1",
+        "features": ["backups", "ipv6", "metadata", "install_agent", "storage"],
+        "available": True,
+        "sizes": ["s-1vcpu-1gb", "s-1vcpu-2gb", "s-2vcpu-2gb", "s-2vcpu-4gb"],
+    },
+    "tags": ["web"],
+    "vpc_uuid": "b21d4ee5-5e72-4056-b6f2-82e364789990",
+}
+
+
+def droplets(count: int) -> t.List[t.Dict[str, t.Any]]:
+    return [
+        dict(DROPLET, id=100000 + i, name="droplet-{i}".format(i=i))
+        for i in range(count)
+    ]
+
+
+def paginated_transport(
+    key: str, items: t.List[t.Dict[str, t.Any]]
+) -> httpx.MockTransport:
+    def handler(request: httpx.Request) -> httpx.Response:
+        page = int(request.url.params.get("page", 1))
+        per_page = int(request.url.params.get("per_page", 20))
+        last = max((len(items) - 1) // per_page + 1, 1)
+        pages = {}
+        if page < last:
+            pages["next"] = str(request.url.copy_set_param("page", page + 1))
+            pages["last"] = str(request.url.copy_set_param("page", last))
+        start = (page - 1) * per_page
+        end = start + per_page
+        return httpx.Response(
+            200,
+            json={
+                key: items[start:end],
+                "links": {"pages": pages},
+                "meta": {"total": len(items)},
+            },
+        )
+
+    return httpx.MockTransport(handler)
+
+
+def mock_client(transport: httpx.MockTransport, **kwargs: t.Any) -> Client:
+    return Client(token="fake_token", rate_limiter=False, transport=transport, **kwargs)
+
+
+def measure(func: t.Callable[[], t.Any], repeat: int = 3) -> float:
+    # best wall time of several runs
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
@@ -0,0 +1,58 @@
+import argparse
+import json
+import sys
+import typing as t
+
+
+def load(path: str) -> t.Dict[t.Tuple[str, t.Any], t.Dict[str, t.Any]]:
+    with open(path, encoding="utf-8") as fp:
+        report = json.load(fp)
+    return {
+        (result["name"], result.get("size") or result.get("source")): result
+        for result in report["results"]
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="compare two run.py reports")
+    parser.add_argument("baseline")
+    parser.add_argument("current")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=1.2,
+        help="ratio of seconds or peak memory which is a regression",
+    )
+    args = parser.parse_args()
+
+    baseline, current = load(args.baseline), load(args.current)
+    regressions = 0
+    for key, result in current.items():
+        if key not in baseline:
+            continue
+        previous = baseline[key]
+        for metric in ("seconds", "peak_mb", "requests"):
+            if not previous[metric]:
+                continue
+            ratio = result[metric] / previous[metric]
+            regressed = ratio > args.threshold
+            regressions += regressed
+            print(
+                "{flag} {name:34} {size:>9} {metric:8} {old:>10} -> {new:>10} "
+                "({ratio:.2f}x)".format(
+                    flag="!" if regressed else " ",
+                    name=key[0],
+                    size=key[1],
+                    metric=metric,
+                    old=previous[metric],
+                    new=result[metric],
+                    ratio=ratio,
+                )
+            )
+    if regressions:
+        print("{count} regressions".format(count=regressions))
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,228 @@
+import argparse
+import asyncio
+import datetime
+import inspect
+import json
+import platform
+import sys
+import time
+import tracemalloc
+import typing as t
+
+import httpx
+from cassettes import CassetteTransport
+from common import measure
+from synthetic import DOMAIN, SyntheticAccount
+
+import dolib
+from dolib import AsyncClient, Client
+from dolib import managers as mn
+
+Transport = t.Union[CassetteTransport, SyntheticAccount]
+
+
+def sync_client(transport: Transport, **kwargs: t.Any) -> Client:
+    return Client(
+        token="fake_token",
+        rate_limiter=False,
+        retry=False,
+        transport=transport,
+        **kwargs,
+    )
+
+
+def async_client(transport: Transport, **kwargs: t.Any) -> AsyncClient:
+    return AsyncClient(
+        token="fake_token",
+        rate_limiter=False,
+        retry=False,
+        transport=transport,
+        **kwargs,
+    )
+
+
+def run_case(
+    name: str,
+    func: t.Callable[[], t.Any],
+    transport: Transport,
+    repeat: int,
+    **extra: t.Any,
+) -> t.Dict[str, t.Any]:
+    # one traced run for memory and request count, best of repeat for time
+    transport.requests = 0
+    tracemalloc.start()
+    result = func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    requests = transport.requests
+
+    seconds = measure(func, repeat=repeat)
+    return dict(
+        {
+            "name": name,
+            "items": len(result) if isinstance(result, list) else None,
+            "requests": requests,
+            "seconds": round(seconds, 6),
+            "page_ms": round(seconds / requests * 1000, 3) if requests else None,
+            "peak_mb": round(peak / 1e6, 3),
+        },
+        **extra,
+    )
+
+
+def manager_cases(
+    client: Client, transport: Transport, repeat: int
+) -> t.List[t.Dict[str, t.Any]]:
+    # all() of every manager which can be listed without arguments
+    results = []
+    for manager_name in mn.__sync_managers__:
+        manager = getattr(client, getattr(mn, manager_name).endpoint)
+        if not hasattr(manager, "all"):
+            continue
+        parameters = inspect.signature(manager.all).parameters.values()
+        if any(parameter.default is parameter.empty for parameter in parameters):
+            continue
+        try:
+            manager.all()
+        except httpx.HTTPStatusError:
+            continue
+        results.append(
+            run_case(
+                "{endpoint}.all".format(endpoint=manager.endpoint),
+                manager.all,
+                transport,
+                repeat,
+            )
+        )
+    return results
+
+
+def cassette_cases(repeat: int) -> t.List[t.Dict[str, t.Any]]:
+    transport = CassetteTransport()
+    results = manager_cases(sync_client(transport), transport, repeat)
+    for result in results:
+        result["source"] = "cassettes"
+    return results
+
+
+def synthetic_cases(size: int, repeat: int) -> t.List[t.Dict[str, t.Any]]:
+    transport = SyntheticAccount(droplets=size, records=size, images=size, tags=size)
+    client = sync_client(transport)
+    cases: t.List[t.Tuple[str, t.Callable[[], t.Any]]] = [
+        ("droplets.all", client.droplets.all),
+        ("droplets.all(validate=False)", lambda: client.droplets.all(validate=False)),
+        (
+            "droplets.fetch_all",
+            lambda: client.fetch_all(endpoint="droplets", key="droplets"),
+        ),
+        ("droplets.table", client.droplets.table),
+        ("images.all", client.images.all),
+        ("tags.all", client.tags.all),
+        ("domains.records", lambda: client.domains.records(DOMAIN)),
+    ]
+    results = [
+        run_case(name, func, transport, repeat, source="synthetic", size=size)
+        for name, func in cases
+    ]
+
+    # model parse time is the difference with raw pages
+    raw = next(r for r in results if r["name"] == "droplets.fetch_all")
+    for result in results:
+        if result["name"].startswith("droplets.all"):
+            result["parse_seconds"] = round(result["seconds"] - raw["seconds"], 6)
+    return results
+
+
+def throughput_cases(
+    size: int, latency: float, workers: int
+) -> t.List[t.Dict[str, t.Any]]:
+    # pages per second of concurrent sync (threads) and async pagination
+    transport = SyntheticAccount(droplets=size, latency=latency)
+    client = sync_client(transport)
+    aclient = async_client(transport)
+
+    def sync_fetch(max_workers: t.Optional[int]) -> t.Callable[[], t.Any]:
+        return lambda: client.fetch_all(
+            endpoint="droplets", key="droplets", max_workers=max_workers
+        )
+
+    def async_fetch(concurrency: t.Optional[int]) -> t.Callable[[], t.Any]:
+        return lambda: asyncio.get_event_loop().run_until_complete(
+            aclient.fetch_all(
+                endpoint="droplets", key="droplets", concurrency=concurrency
+            )
+        )
+
+    results = []
+    for name, func in [
+        ("sync serial", sync_fetch(None)),
+        ("sync threads", sync_fetch(workers)),
+        ("async serial", async_fetch(None)),
+        ("async concurrent", async_fetch(workers)),
+    ]:
+        result = run_case(
+            "throughput " + name,
+            func,
+            transport,
+            1,
+            source="synthetic",
+            size=size,
+            latency=latency,
+            workers=workers,
+        )
+        result["pages_per_second"] = round(result["requests"] / result["seconds"], 1)
+        results.append(result)
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="dolib benchmark suite")
+    parser.add_argument(
+        "--sizes",
+        default="10000",
+        help="comma separated sizes of synthetic accounts, e.g. 10000,100000",
+    )
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--latency", type=float, default=0.02)
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--output", help="write results to a json file")
+    args = parser.parse_args()
+    sizes = [int(size) for size in args.sizes.split(",")]
+
+    asyncio.set_event_loop(asyncio.new_event_loop())
+    results = cassette_cases(args.repeat)
+    for size in sizes:
+        results += synthetic_cases(size, args.repeat)
+    results += throughput_cases(min(sizes), args.latency, args.workers)
+
+    report = {
+        "meta": {
+            "dolib": dolib.__version__,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "date": datetime.datetime.utcnow().isoformat() + "Z",
+            "argv": sys.argv[1:],
+        },
+        "results": results,
+    }
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as fp:
+            json.dump(report, fp, indent=2)
+
+    for result in results:
+        print(
+            "{name:34} {size:>7} {requests:>5} req {seconds:9.4f}s "
+            "{peak_mb:9.2f} MB".format(
+                name=result["name"],
+                size=result.get("size") or result["source"],
+                requests=result["requests"],
+                seconds=result["seconds"],
+                peak_mb=result["peak_mb"],
+            )
+        )
+
+
+if __name__ == "__main__":
+    start = time.perf_counter()
+    main()
+    print("done in {seconds:.1f}s".format(seconds=time.perf_counter() - start))
@@ -0,0 +1,191 @@
+import asyncio
+import typing as t
+
+import h2.config
+import h2.connection
+import h2.events
+import h11
+import httpx
+
+from dolib.simulator import Simulator
+
+PREFACE = b"PRI * HTTP/2.0\r\n\r\nSM\r\n\r\n"
+
+
+class Server:
+    # local HTTP/1.1 and cleartext HTTP/2 (prior knowledge) server over a simulator
+    def __init__(self, simulator: Simulator, host: str = "127.0.0.1") -> None:
+        self.simulator = simulator
+        self.host = host
+        self.port = 0
+        self.connections = 0
+        self.streams = 0
+        self._server: t.Optional[asyncio.AbstractServer] = None
+
+    @property
+    def base_url(self) -> str:
+        return "http://{host}:{port}/v2".format(host=self.host, port=self.port)
+
+    async def start(self) -> None:
+        self._server = await asyncio.start_server(
+            self._handle, self.host, 0, backlog=4096
+        )
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def stop(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+
+    async def _respond(
+        self,
+        method: str,
+        target: str,
+        headers: t.List[t.Tuple[str, str]],
+        body: bytes,
+    ) -> httpx.Response:
+        request = httpx.Request(
+            method,
+            "http://{host}:{port}{target}".format(
+                host=self.host, port=self.port, target=target
+            ),
+            headers=headers,
+            content=body,
+        )
+        return await self.simulator.handle_async_request(request)
+
+    async def _handle(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        self.connections += 1
+        try:
+            first = await reader.readexactly(len(PREFACE))
+            if first == PREFACE:
+                await self._handle_h2(first, reader, writer)
+            else:
+                await self._handle_h11(first, reader, writer)
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    async def _handle_h11(
+        self, data: bytes, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        conn = h11.Connection(h11.SERVER)
+        conn.receive_data(data)
+        request: t.Optional[h11.Request] = None
+        body = b""
+        while True:
+            event = conn.next_event()
+            if event is h11.NEED_DATA:
+                conn.receive_data(await reader.read(65536))
+            elif isinstance(event, h11.Request):
+                request, body = event, b""
+            elif isinstance(event, h11.Data):
+                body += event.data
+            elif isinstance(event, h11.EndOfMessage) and request is not None:
+                self.streams += 1
+                response = await self._respond(
+                    request.method.decode(),
+                    request.target.decode(),
+                    [
+                        (name.decode(), value.decode())
+                        for name, value in request.headers
+                    ],
+                    body,
+                )
+                content = b"".join(response.stream)  # type: ignore
+                writer.write(
+                    b"".join(
+                        [
+                            conn.send(
+                                h11.Response(
+                                    status_code=response.status_code,
+                                    headers=list(response.headers.raw),
+                                )
+                            ),
+                            conn.send(h11.Data(data=content)),
+                            conn.send(h11.EndOfMessage()),
+                        ]
+                    )
+                )
+                await writer.drain()
+                conn.start_next_cycle()
+            elif isinstance(event, h11.ConnectionClosed):
+                return
+
+    async def _handle_h2(
+        self, data: bytes, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        conn = h2.connection.H2Connection(
+            h2.config.H2Configuration(client_side=False, header_encoding="utf-8")
+        )
+        conn.initiate_connection()
+        requests: t.Dict[int, t.Tuple[t.List[t.Tuple[str, str]], bytearray]] = {}
+        window_updated = asyncio.Event()
+        tasks: t.Set[asyncio.Future] = set()
+
+        async def send(stream_id: int, headers: t.List[t.Any], content: bytes) -> None:
+            conn.send_headers(stream_id, headers, end_stream=not content)
+            while content:
+                size = min(
+                    conn.local_flow_control_window(stream_id),
+                    conn.max_outbound_frame_size,
+                    len(content),
+                )
+                if size <= 0:
+                    writer.write(conn.data_to_send())
+                    window_updated.clear()
+                    await window_updated.wait()
+                    continue
+                chunk, content = content[:size], content[size:]
+                conn.send_data(stream_id, chunk, end_stream=not content)
+            writer.write(conn.data_to_send())
+
+        async def respond(stream_id: int) -> None:
+            headers, body = requests.pop(stream_id)
+            pseudo = dict(headers)
+            self.streams += 1
+            response = await self._respond(
+                pseudo[":method"],
+                pseudo[":path"],
+                [(name, value) for name, value in headers if not name.startswith(":")],
+                bytes(body),
+            )
+            content = b"".join(response.stream)  # type: ignore
+            await send(
+                stream_id,
+                [(":status", str(response.status_code))]
+                + [
+                    (name.decode().lower(), value.decode())
+                    for name, value in response.headers.raw
+                    if name.lower() not in (b"connection", b"transfer-encoding")
+                ],
+                content,
+            )
+
+        while True:
+            for event in conn.receive_data(data):
+                if isinstance(event, h2.events.RequestReceived):
+                    requests[event.stream_id] = (list(event.headers), bytearray())
+                elif isinstance(event, h2.events.DataReceived):
+                    requests[event.stream_id][1].extend(event.data)
+                    conn.acknowledge_received_data(
+                        event.flow_controlled_length, event.stream_id
+                    )
+                elif isinstance(event, h2.events.StreamEnded):
+                    task = asyncio.ensure_future(respond(event.stream_id))
+                    tasks.add(task)
+                    task.add_done_callback(tasks.discard)
+                elif isinstance(event, h2.events.WindowUpdated):
+                    window_updated.set()
+                elif isinstance(event, h2.events.ConnectionTerminated):
+                    return
+            writer.write(conn.data_to_send())
+            await writer.drain()
+            data = await reader.read(65536)
+            if not data:
+                for task in tasks:
+                    task.cancel()
+                return
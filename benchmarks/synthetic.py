@@ -0,0 +1,130 @@
+import asyncio
+import json
+import time
+import typing as t
+
+import httpx
+from common import DROPLET
+
+DOMAIN = "example.com"
+REGIONS = ["ams3", "fra1", "lon1", "nyc1", "nyc3", "sfo3", "sgp1", "tor1"]
+RECORD_TYPES = ["A", "AAAA", "CNAME", "TXT", "MX"]
+
+
+def fake_droplets(count: int) -> t.List[t.Dict[str, t.Any]]:
+    return [
+        dict(
+            DROPLET,
+            id=100000 + i,
+            name="droplet-{i}".format(i=i),
+            region=dict(DROPLET["region"], slug=REGIONS[i % len(REGIONS)]),
+            tags=["tag-{i}".format(i=i % 100)],
+        )
+        for i in range(count)
+    ]
+
+
+def fake_records(count: int) -> t.List[t.Dict[str, t.Any]]:
+    return [
+        {
+            "id": 1000000 + i,
+            "type": RECORD_TYPES[i % len(RECORD_TYPES)],
+            "name": "host-{i}".format(i=i),
+            "data": "10.0.{a}.{b}".format(a=i // 256 % 256, b=i % 256),
+            "priority": 10 if i % len(RECORD_TYPES) == 4 else None,
+            "port": None,
+            "ttl": 1800,
+            "weight": None,
+            "flags": None,
+            "tag": None,
+        }
+        for i in range(count)
+    ]
+
+
+def fake_images(count: int) -> t.List[t.Dict[str, t.Any]]:
+    return [
+        dict(DROPLET["image"], id=90000000 + i, name="image-{i}".format(i=i))
+        for i in range(count)
+    ]
+
+
+def fake_tags(count: int) -> t.List[t.Dict[str, t.Any]]:
+    counts = {"count": 0, "last_tagged_uri": None}
+    return [
+        {
+            "name": "tag-{i}".format(i=i),
+            "resources": {
+                "count": 0,
+                "last_tagged_uri": None,
+                "droplets": counts,
+                "images": counts,
+                "volumes": counts,
+                "volume_snapshots": counts,
+                "databases": counts,
+            },
+        }
+        for i in range(count)
+    ]
+
+
+class SyntheticAccount(httpx.BaseTransport, httpx.AsyncBaseTransport):
+    # paginated listings of a generated account with optional network latency
+    def __init__(
+        self,
+        droplets: int = 0,
+        records: int = 0,
+        images: int = 0,
+        tags: int = 0,
+        latency: float = 0.0,
+    ) -> None:
+        self.listings = {
+            "/v2/droplets": ("droplets", fake_droplets(droplets)),
+            "/v2/images": ("images", fake_images(images)),
+            "/v2/tags": ("tags", fake_tags(tags)),
+            "/v2/domains": ("domains", [{"name": DOMAIN, "ttl": 1800}]),
+            "/v2/domains/{domain}/records".format(domain=DOMAIN): (
+                "domain_records",
+                fake_records(records),
+            ),
+        }
+        self.latency = latency
+        self.requests = 0
+
+    def _response(self, request: httpx.Request) -> httpx.Response:
+        self.requests += 1
+        if request.url.path not in self.listings:
+            return httpx.Response(404, json={"message": "not found"}, request=request)
+        key, items = self.listings[request.url.path]
+        page = int(request.url.params.get("page", 1))
+        per_page = int(request.url.params.get("per_page", 20))
+        last = max((len(items) - 1) // per_page + 1, 1)
+        pages = {}
+        if page < last:
+            pages["next"] = str(request.url.copy_set_param("page", page + 1))
+            pages["last"] = str(request.url.copy_set_param("page", last))
+        start = (page - 1) * per_page
+        end = start + per_page
+        content = json.dumps(
+            {
+                key: items[start:end],
+                "links": {"pages": pages},
+                "meta": {"total": len(items)},
+            }
+        ).encode("utf-8")
+        return httpx.Response(
+            200,
+            content=content,
+            headers={"Content-Type": "application/json"},
+            request=request,
+        )
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        if self.latency:
+            time.sleep(self.latency)
+        return self._response(request)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        return self._response(request)
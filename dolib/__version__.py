@@ -1,6 +1,10 @@
-from pkg_resources import DistributionNotFound, get_distribution
+try:
+    from importlib.metadata import PackageNotFoundError, version
+except ImportError:  # pragma: no cover
+    # python < 3.8
+    from importlib_metadata import PackageNotFoundError, version  # type: ignore
 
 try:
-    __version__ = get_distribution("dolib").version
-except DistributionNotFound:
+    __version__ = version("dolib")
+except PackageNotFoundError:
     __version__ = None
@@ -0,0 +1,208 @@
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+import typing as t
+from collections import OrderedDict
+
+import httpx
+
+# near-static catalog endpoints and their time to live in seconds
+DEFAULT_TTLS = {
+    r"regions$": 3600.0,
+    r"sizes$": 3600.0,
+    r"1-clicks$": 3600.0,
+    r"kubernetes/options$": 3600.0,
+    r"images\?(.*&)?type=(distribution|application)(&|$)": 3600.0,
+}
+
+
+class CacheEntry:
+    def __init__(
+        self,
+        endpoint: str,
+        content: str,
+        expires_at: float,
+        etag: t.Optional[str] = None,
+    ) -> None:
+        self.endpoint = endpoint
+        self.content = content
+        self.expires_at = expires_at
+        self.etag = etag
+
+    @property
+    def is_fresh(self) -> bool:
+        return time.time() < self.expires_at
+
+    def to_dict(self) -> t.Dict[str, t.Any]:
+        return {
+            "endpoint": self.endpoint,
+            "content": self.content,
+            "expires_at": self.expires_at,
+            "etag": self.etag,
+        }
+
+    @classmethod
+    def from_dict(cls, data: t.Dict[str, t.Any]) -> "CacheEntry":
+        return cls(**data)
+
+    def to_response(self, request: httpx.Request) -> httpx.Response:
+        headers = {"Content-Type": "application/json"}
+        if self.etag is not None:
+            headers["ETag"] = self.etag
+        return httpx.Response(
+            200,
+            headers=headers,
+            content=self.content.encode("utf-8"),
+            request=request,
+        )
+
+
+class BaseCacheBackend:
+    def get(self, key: str) -> t.Optional[CacheEntry]:
+        raise NotImplementedError("get must be implemented.")
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        raise NotImplementedError("set must be implemented.")
+
+    def delete(self, key: str) -> None:
+        raise NotImplementedError("delete must be implemented.")
+
+    def items(self) -> t.Iterator[t.Tuple[str, CacheEntry]]:
+        raise NotImplementedError("items must be implemented.")
+
+    def clear(self) -> None:
+        for key, _ in list(self.items()):
+            self.delete(key)
+
+
+class MemoryCacheBackend(BaseCacheBackend):
+    def __init__(self, maxsize: int = 256) -> None:
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> t.Optional[CacheEntry]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def items(self) -> t.Iterator[t.Tuple[str, CacheEntry]]:
+        with self._lock:
+            return iter(list(self._entries.items()))
+
+
+class FileCacheBackend(BaseCacheBackend):
+    def __init__(self, directory: str) -> None:
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, key: str) -> str:
+        name = hashlib.sha256(key.encode("utf-8")).hexdigest()
+        return os.path.join(self.directory, name + ".json")
+
+    def _read(self, path: str) -> t.Optional[t.Dict[str, t.Any]]:
+        try:
+            with open(path, "r", encoding="utf-8") as fp:
+                return json.load(fp)
+        except (OSError, ValueError):
+            return None
+
+    def get(self, key: str) -> t.Optional[CacheEntry]:
+        data = self._read(self._path(key))
+        if data is None or data.get("key") != key:
+            return None
+        return CacheEntry.from_dict(data["entry"])
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        path = self._path(key)
+        tmp_path = "{path}.{pid}.tmp".format(path=path, pid=os.getpid())
+        with open(tmp_path, "w", encoding="utf-8") as fp:
+            json.dump({"key": key, "entry": entry.to_dict()}, fp)
+        os.replace(tmp_path, path)
+
+    def delete(self, key: str) -> None:
+        try:
+            os.remove(self._path(key))
+        except FileNotFoundError:
+            pass
+
+    def items(self) -> t.Iterator[t.Tuple[str, CacheEntry]]:
+        for name in os.listdir(self.directory):
+            if not name.endswith(".json"):
+                continue
+            data = self._read(os.path.join(self.directory, name))
+            if data is not None:
+                yield data["key"], CacheEntry.from_dict(data["entry"])
+
+
+class ResponseCache:
+    def __init__(
+        self,
+        backend: BaseCacheBackend = None,
+        ttls: t.Dict[str, float] = None,
+    ) -> None:
+        self.backend = backend if backend is not None else MemoryCacheBackend()
+        # regexps matched against endpoint with query string, like "images?type=x"
+        self.ttls = [
+            (re.compile(pattern), ttl)
+            for pattern, ttl in (DEFAULT_TTLS if ttls is None else ttls).items()
+        ]
+
+    def get_ttl(self, endpoint: str) -> t.Optional[float]:
+        # per_page is added by fetch_all and doesn't change the resource
+        path, _, query = endpoint.partition("?")
+        query = "&".join(
+            param
+            for param in query.split("&")
+            if param and not param.startswith("per_page=")
+        )
+        if query:
+            path = "{path}?{query}".format(path=path, query=query)
+        for pattern, ttl in self.ttls:
+            if pattern.match(path):
+                return ttl
+        return None
+
+    def get(self, key: str) -> t.Optional[CacheEntry]:
+        return self.backend.get(key)
+
+    def set(
+        self, key: str, endpoint: str, response: httpx.Response, ttl: float
+    ) -> None:
+        entry = CacheEntry(
+            endpoint=endpoint,
+            content=response.text,
+            expires_at=time.time() + ttl,
+            etag=response.headers.get("ETag"),
+        )
+        self.backend.set(key, entry)
+
+    def refresh(self, key: str, entry: CacheEntry, ttl: float) -> None:
+        entry.expires_at = time.time() + ttl
+        self.backend.set(key, entry)
+
+    def invalidate(self, endpoint: str = None) -> None:
+        if endpoint is None:
+            self.backend.clear()
+            return
+        for key, entry in list(self.backend.items()):
+            if entry.endpoint == endpoint or entry.endpoint.startswith(
+                (endpoint + "/", endpoint + "?")
+            ):
+                self.backend.delete(key)
@@ -1,36 +1,370 @@
+import hashlib
+import math
+import threading
+import time
 import typing as t
+from concurrent.futures import Future, ThreadPoolExecutor
 from types import TracebackType
 
 import httpx
 
-from . import managers as mn
 from .__version__ import __version__
+from .cache import CacheEntry, ResponseCache
+from .codec import JSONCodec, get_codec
+from .hooks import (
+    Hooks,
+    PageEvent,
+    RequestEvent,
+    ResponseEvent,
+    RetryEvent,
+    endpoint_template,
+)
+from .ratelimit import RateLimiter
+from .retry import Retry
+
+if t.TYPE_CHECKING:  # pragma: no cover
+    from . import managers as mn
+
+ManagerT = t.TypeVar("ManagerT")
+
+# requests in flight of fetch_many by default
+MANY_CONCURRENCY = 10
+
+
+async def _sleep(delay: float) -> None:
+    # asyncio is imported only by async code, it's slow to import
+    import asyncio
+
+    await asyncio.sleep(delay)
+
+
+class LazyManager(t.Generic[ManagerT]):
+    # manager module is imported and manager created on first access
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.attr = name
+
+    def __set_name__(self, owner: type, attr: str) -> None:
+        self.attr = attr
+
+    @t.overload
+    def __get__(self, obj: None, objtype: type = None) -> "LazyManager[ManagerT]": ...
+
+    @t.overload
+    def __get__(self, obj: "BaseClient", objtype: type = None) -> ManagerT: ...
+
+    def __get__(self, obj: t.Any, objtype: type = None) -> t.Any:
+        if obj is None:
+            return self
+        from . import managers
+
+        manager = getattr(managers, self.name)(client=obj)
+        obj.__dict__[self.attr] = manager
+        return manager
 
 
 class BaseClient:
     API_DOMAIN = "api.digitalocean.com"
     API_VERSION = "v2"
 
-    def __init__(self, token: str = None):
+    def __init__(
+        self,
+        token: str = None,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        keepalive_expiry: float = 5.0,
+        timeout: float = 5.0,
+        page_concurrency: int = None,
+        rate_limiter: t.Union[RateLimiter, bool] = True,
+        retry: t.Union[Retry, bool] = True,
+        cache: t.Union[ResponseCache, bool] = False,
+        validate: bool = True,
+        lazy: bool = False,
+        json_codec: t.Union[str, JSONCodec] = "auto",
+        base_url: str = None,
+        transport: t.Union[httpx.BaseTransport, httpx.AsyncBaseTransport] = None,
+        hooks: t.Iterable[Hooks] = None,
+        compression: bool = True,
+        http2: bool = False,
+        coalesce: bool = True,
+    ):
         if token is None:
             raise ValueError("API token must be specified.")
         self._token = token
+        self._limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self._timeout = httpx.Timeout(timeout)
+        # e.g. a mock transport or dolib.simulator.Simulator
+        self._transport: t.Any = transport
+        if base_url is None:
+            base_url = "https://{domain}/{version}".format(
+                domain=self.API_DOMAIN, version=self.API_VERSION
+            )
+        self.base_url = base_url.rstrip("/")
+        # multiplex requests over one connection, needs the h2 package
+        self.http2 = http2
+        self._base_path = httpx.URL(self.base_url).path.rstrip("/")
+        self.hooks: t.List[Hooks] = list(hooks or [])
+        self.page_concurrency = page_concurrency
+        # AsyncClient sends one request for identical concurrent GETs
+        self.coalesce = coalesce
+        self._inflight: t.Dict[str, t.Any] = {}
+        if rate_limiter is True:
+            rate_limiter = RateLimiter()
+        self.rate_limiter: t.Optional[RateLimiter] = rate_limiter or None
+        if retry is True:
+            retry = Retry()
+        self.retry: t.Optional[Retry] = retry or None
+        if cache is True:
+            cache = ResponseCache()
+        self.cache: t.Optional[ResponseCache] = cache or None
+        # build models without validation for trusted responses, much faster
+        self.validate = validate
+        # validate model fields on first access instead of all at once
+        self.lazy = lazy
+        self.json_codec = get_codec(json_codec)
+        self._http_lock = threading.Lock()
         self._ratelimit_limit: t.Optional[int] = None
         self._ratelimit_remaining: t.Optional[int] = None
         self._ratelimit_reset: t.Optional[int] = None
-        self._load_managers()
 
         self.headers = {
             "Authorization": f"Bearer {self._token}",
             "Content-Type": "application/json",
             "User-Agent": f"dolib/{__version__}",
-            # FIXME:  our test lib(vcrpy) for httpx have bugs with gzip and deflate
-            # https://github.com/kevin1024/vcrpy/issues/550
-            "Accept-Encoding": "",
         }
+        # httpx negotiates gzip and deflate, and brotli or zstd if installed
+        if not compression:
+            self.headers["Accept-Encoding"] = "identity"
+
+    def _decode(self, response: httpx.Response) -> t.Any:
+        return self.json_codec.loads(response.content)
+
+    def _http_options(self) -> t.Dict[str, t.Any]:
+        return dict(
+            limits=self._limits,
+            timeout=self._timeout,
+            transport=self._transport,
+            # plain http has no ALPN negotiation, use HTTP/2 with prior knowledge
+            http1=not (self.http2 and self.base_url.startswith("http:")),
+            http2=self.http2,
+        )
+
+    def _build_url(self, endpoint: str) -> str:
+        return "{base_url}/{endpoint}".format(base_url=self.base_url, endpoint=endpoint)
+
+    @staticmethod
+    def _get_next_page(result: t.Dict[str, t.Any] = None) -> t.Optional[str]:
+        if (
+            result is None
+            or "links" not in result
+            or "pages" not in result["links"]
+            or "next" not in result["links"]["pages"]
+        ):
+            return None
+        return result["links"]["pages"]["next"]
+
+    @staticmethod
+    def _get_page_items(result: t.Dict[str, t.Any], key: str) -> t.List[t.Any]:
+        # in case of strange result like " "firewalls": null "
+        if result[key] is None:
+            return []
+        elif isinstance(result[key], list):
+            return result[key]
+        return list(result[key])
+
+    @classmethod
+    def _get_page_urls(
+        cls, result: t.Dict[str, t.Any], per_page: int
+    ) -> t.Optional[t.List[str]]:
+        # urls of all pages after the first one or None if response doesn't
+        # have enough information (links.pages.last or meta.total) to build them
+        next_url = cls._get_next_page(result)
+        if next_url is None:
+            return []
+
+        next_page = httpx.URL(next_url)
+        last_url = result["links"]["pages"].get("last")
+        total = result.get("meta", {}).get("total")
+        if last_url is not None:
+            last_page = int(httpx.URL(last_url).params.get("page", 1))
+        elif total is not None:
+            last_page = math.ceil(total / per_page)
+        else:
+            return None
+
+        first_page = int(next_page.params.get("page", 2))
+        return [
+            str(next_page.copy_set_param("page", str(page)))
+            for page in range(first_page, last_page + 1)
+        ]
+
+    @staticmethod
+    def _merge_pages(
+        result: t.List[t.Any], pages: t.Iterable[t.List[t.Any]]
+    ) -> t.List[t.Any]:
+        # items can move between pages while they are fetched concurrently,
+        # so skip the ones we already have
+        seen = {
+            item["id"] for item in result if isinstance(item, dict) and "id" in item
+        }
+        for page in pages:
+            for item in page:
+                if isinstance(item, dict) and "id" in item:
+                    if item["id"] in seen:
+                        continue
+                    seen.add(item["id"])
+                result.append(item)
+        return result
+
+    def _is_retryable(
+        self,
+        method: str,
+        attempt: int,
+        response: httpx.Response = None,
+        exc: Exception = None,
+    ) -> bool:
+        if self.retry is None:
+            return False
+        return self.retry.is_retryable(method, attempt, response=response, exc=exc)
+
+    def _get_endpoint(self, url: httpx.URL) -> t.Optional[str]:
+        base_url = self._build_url("")
+        url_str = str(url)
+        if not url_str.startswith(base_url):
+            return None
+        return url_str.replace(base_url, "", 1)
+
+    def _get_cache_key(self, request: httpx.Request) -> str:
+        # responses are cached per token, they can differ between accounts
+        token_hash = hashlib.sha256(self._token.encode("utf-8")).hexdigest()[:16]
+        return "{token}:{url}".format(token=token_hash, url=request.url)
+
+    def _get_cached_response(
+        self, request: httpx.Request
+    ) -> t.Tuple[t.Optional[httpx.Response], t.Optional[CacheEntry]]:
+        if self.cache is None or request.method != "GET":
+            return None, None
+        endpoint = self._get_endpoint(request.url)
+        if endpoint is None or self.cache.get_ttl(endpoint) is None:
+            return None, None
+
+        entry = self.cache.get(self._get_cache_key(request))
+        if entry is None:
+            return None, None
+        if entry.is_fresh:
+            return entry.to_response(request), entry
+        if entry.etag is not None:
+            request.headers["If-None-Match"] = entry.etag
+        return None, entry
+
+    def _cache_response(
+        self,
+        request: httpx.Request,
+        response: httpx.Response,
+        entry: t.Optional[CacheEntry],
+    ) -> httpx.Response:
+        if self.cache is None or request.method != "GET":
+            return response
+        endpoint = self._get_endpoint(request.url)
+        ttl = None if endpoint is None else self.cache.get_ttl(endpoint)
+        if ttl is None:
+            return response
+
+        key = self._get_cache_key(request)
+        if response.status_code == httpx.codes.NOT_MODIFIED and entry is not None:
+            self.cache.refresh(key, entry, ttl)
+            return entry.to_response(request)
+        if response.status_code == httpx.codes.OK:
+            self.cache.set(key, endpoint, response, ttl)
+        return response
+
+    def _get_template(self, url: httpx.URL) -> str:
+        # templated endpoint of url for hooks, like "droplets/{id}"
+        path = url.path
+        if path.startswith(self._base_path):
+            path = path.replace(self._base_path, "", 1)
+        return endpoint_template(path)
+
+    def _on_request(
+        self, request: httpx.Request, attempt: int
+    ) -> t.Optional[RequestEvent]:
+        if not self.hooks:
+            return None
+        event = RequestEvent(
+            method=request.method,
+            endpoint=self._get_template(request.url),
+            url=str(request.url),
+            attempt=attempt,
+        )
+        for hook in self.hooks:
+            hook.on_request(event)
+        return event
 
-    def _load_managers(self) -> None:
-        raise NotImplementedError("_load_managers must be implemented.")
+    def _on_response(
+        self,
+        event: t.Optional[RequestEvent],
+        request: httpx.Request,
+        started: float,
+        response: httpx.Response = None,
+        cached: bool = False,
+        error: Exception = None,
+    ) -> None:
+        if event is None:
+            return
+        response_event = ResponseEvent(
+            event,
+            status_code=None if response is None else response.status_code,
+            elapsed=time.perf_counter() - started,
+            request_bytes=len(request.content),
+            response_bytes=self._response_bytes(response, cached),
+            ratelimit_remaining=self._ratelimit_remaining,
+            cached=cached,
+            error=error,
+        )
+        for hook in self.hooks:
+            hook.on_response(response_event)
+
+    @staticmethod
+    def _response_bytes(response: t.Optional[httpx.Response], cached: bool) -> int:
+        if response is None or cached:
+            return 0
+        # in-process transports set content without downloading it
+        return response.num_bytes_downloaded or len(response.content)
+
+    def _on_retry(
+        self,
+        event: t.Optional[RequestEvent],
+        delay: float,
+        response: httpx.Response = None,
+        error: Exception = None,
+    ) -> None:
+        if event is None:
+            return
+        retry_event = RetryEvent(
+            event,
+            delay=delay,
+            status_code=None if response is None else response.status_code,
+            error=error,
+        )
+        for hook in self.hooks:
+            hook.on_retry(retry_event)
+
+    def _on_page(self, url: str, key: str, items: t.List[t.Any]) -> None:
+        if not self.hooks:
+            return
+        page_url = httpx.URL(url)
+        event = PageEvent(
+            endpoint=self._get_template(page_url),
+            key=key,
+            page=int(page_url.params.get("page", 1)),
+            items=len(items),
+        )
+        for hook in self.hooks:
+            hook.on_page(event)
 
     def _process_response(self, response: httpx.Response) -> None:
         if "Ratelimit-Limit" in response.headers:
@@ -39,38 +373,118 @@ class BaseClient:
             self._ratelimit_remaining = int(response.headers.get("Ratelimit-Remaining"))
         if "Ratelimit-Reset" in response.headers:
             self._ratelimit_reset = int(response.headers.get("Ratelimit-Reset"))
+        if self.rate_limiter is not None and "Ratelimit-Remaining" in response.headers:
+            self.rate_limiter.update(
+                limit=self._ratelimit_limit,
+                remaining=self._ratelimit_remaining,
+                reset=self._ratelimit_reset,
+            )
 
 
 class Client(BaseClient):
 
-    account: t.Optional[mn.AccountManager] = None
-    actions: t.Optional[mn.ActionsManager] = None
-    cdn_endpoints: t.Optional[mn.CDNEndpointsManager] = None
-    certificates: t.Optional[mn.CertificatesManager] = None
-    databases: t.Optional[mn.DatabasesManager] = None
-    domains: t.Optional[mn.DomainsManager] = None
-    droplets: t.Optional[mn.DropletsManager] = None
-    firewalls: t.Optional[mn.FirewallsManager] = None
-    floating_ips: t.Optional[mn.FloatingIPsManager] = None
-    images: t.Optional[mn.ImagesManager] = None
-    invoices: t.Optional[mn.InvoicesManager] = None
-    kubernetes: t.Optional[mn.KubernetesManager] = None
-    load_balancers: t.Optional[mn.LoadBalancersManager] = None
-    one_clicks: t.Optional[mn.OneClicksManager] = None
-    projects: t.Optional[mn.ProjectsManager] = None
-    regions: t.Optional[mn.RegionsManager] = None
-    registry: t.Optional[mn.RegistryManager] = None
-    snapshots: t.Optional[mn.SnapshotsManager] = None
-    ssh_keys: t.Optional[mn.SSHKeysManager] = None
-    tags: t.Optional[mn.TagsManager] = None
-    volumes: t.Optional[mn.VolumesManager] = None
-    vpcs: t.Optional[mn.VPCsManager] = None
-
-    def _load_managers(self) -> None:
-        for manager in mn.__sync_managers__:
-            klass = getattr(mn, manager)
-            obj = klass(client=self)
-            setattr(self, klass.endpoint, obj)
+    account: "LazyManager[mn.AccountManager]" = LazyManager("AccountManager")
+    actions: "LazyManager[mn.ActionsManager]" = LazyManager("ActionsManager")
+    cdn_endpoints: "LazyManager[mn.CDNEndpointsManager]" = LazyManager(
+        "CDNEndpointsManager"
+    )
+    certificates: "LazyManager[mn.CertificatesManager]" = LazyManager(
+        "CertificatesManager"
+    )
+    databases: "LazyManager[mn.DatabasesManager]" = LazyManager("DatabasesManager")
+    domains: "LazyManager[mn.DomainsManager]" = LazyManager("DomainsManager")
+    droplets: "LazyManager[mn.DropletsManager]" = LazyManager("DropletsManager")
+    firewalls: "LazyManager[mn.FirewallsManager]" = LazyManager("FirewallsManager")
+    floating_ips: "LazyManager[mn.FloatingIPsManager]" = LazyManager(
+        "FloatingIPsManager"
+    )
+    images: "LazyManager[mn.ImagesManager]" = LazyManager("ImagesManager")
+    invoices: "LazyManager[mn.InvoicesManager]" = LazyManager("InvoicesManager")
+    kubernetes: "LazyManager[mn.KubernetesManager]" = LazyManager("KubernetesManager")
+    load_balancers: "LazyManager[mn.LoadBalancersManager]" = LazyManager(
+        "LoadBalancersManager"
+    )
+    one_clicks: "LazyManager[mn.OneClicksManager]" = LazyManager("OneClicksManager")
+    projects: "LazyManager[mn.ProjectsManager]" = LazyManager("ProjectsManager")
+    regions: "LazyManager[mn.RegionsManager]" = LazyManager("RegionsManager")
+    registry: "LazyManager[mn.RegistryManager]" = LazyManager("RegistryManager")
+    snapshots: "LazyManager[mn.SnapshotsManager]" = LazyManager("SnapshotsManager")
+    ssh_keys: "LazyManager[mn.SSHKeysManager]" = LazyManager("SSHKeysManager")
+    tags: "LazyManager[mn.TagsManager]" = LazyManager("TagsManager")
+    volumes: "LazyManager[mn.VolumesManager]" = LazyManager("VolumesManager")
+    vpcs: "LazyManager[mn.VPCsManager]" = LazyManager("VPCsManager")
+
+    _http: t.Optional[httpx.Client] = None
+
+    @property
+    def http(self) -> httpx.Client:
+        if self._http is None or self._http.is_closed:
+            with self._http_lock:
+                if self._http is None or self._http.is_closed:
+                    self._http = httpx.Client(**self._http_options())
+        return self._http
+
+    def close(self) -> None:
+        if self._http is not None:
+            self._http.close()
+            self._http = None
+
+    def _send(
+        self,
+        method: str,
+        url: str,
+        params: dict = None,
+        json: dict = None,
+        data: t.Union[str, bytes] = None,
+    ) -> httpx.Response:
+        if json is not None:
+            data = self.json_codec.dumps(json)
+        request = self.http.build_request(
+            method=method,
+            url=url,
+            headers=self.headers,
+            params=params,
+            content=data,
+        )
+        response, cache_entry = self._get_cached_response(request)
+        if response is not None:
+            event = self._on_request(request, 0)
+            self._on_response(
+                event, request, time.perf_counter(), response, cached=True
+            )
+            return response
+
+        attempt = 0
+        while True:
+            if self.rate_limiter is not None:
+                self.rate_limiter.wait()
+
+            event = self._on_request(request, attempt)
+            started = time.perf_counter()
+            try:
+                response = self.http.send(request)
+            except httpx.TransportError as exc:
+                self._on_response(event, request, started, error=exc)
+                if not self._is_retryable(method, attempt, exc=exc):
+                    raise
+                delay = self.retry.get_backoff(attempt)
+                self._on_retry(event, delay, error=exc)
+            else:
+                # save data to client from response
+                self._process_response(response)
+                self._on_response(event, request, started, response)
+
+                if not self._is_retryable(method, attempt, response=response):
+                    response = self._cache_response(request, response, cache_entry)
+
+                    # raise exceptions in case of errors
+                    response.raise_for_status()
+                    return response
+                delay = self.retry.get_backoff(attempt, response)
+                self._on_retry(event, delay, response=response)
+
+            attempt += 1
+            time.sleep(delay)
 
     def request_raw(
         self,
@@ -78,7 +492,7 @@ class Client(BaseClient):
         method: str = "get",
         params: dict = {},
         json: dict = None,
-        data: str = None,
+        data: t.Union[str, bytes] = None,
     ) -> httpx.Response:
         assert method in [
             "get",
@@ -88,36 +502,21 @@ class Client(BaseClient):
             "head",
         ], "Invalid method {method}".format(method=method)
 
-        url = "https://{domain}/{version}/{endpoint}".format(
-            domain=self.API_DOMAIN,
-            version=self.API_VERSION,
-            endpoint=endpoint,
-        )
-
-        response = httpx.request(
+        return self._send(
             method=method,
-            url=url,
-            headers=self.headers,
+            url=self._build_url(endpoint),
             params=params,
             json=json,
-            content=data,
+            data=data,
         )
 
-        # raise exceptions in case of errors
-        response.raise_for_status()
-
-        # save data to client from response
-        self._process_response(response)
-
-        return response
-
     def request(
         self,
         endpoint: str = "account",
         method: str = "get",
         params: dict = {},
         json: dict = None,
-        data: str = None,
+        data: t.Union[str, bytes] = None,
     ) -> t.Dict[str, t.Any]:
         response = self.request_raw(endpoint, method, params, json, data)
         if response.status_code in [httpx.codes.NO_CONTENT]:
@@ -126,77 +525,271 @@ class Client(BaseClient):
         elif response.status_code == httpx.codes.ACCEPTED and response.content == b"":
             return {}
 
-        return response.json()
+        return self._decode(response)
 
     def fetch_all(
         self,
         endpoint: str,
         key: str,
         params: dict = {},
+        max_workers: int = None,
     ) -> t.List[t.Dict[str, t.Any]]:
-        def get_next_page(result: t.Dict[str, t.Any] = None) -> t.Optional[str]:
-            if (
-                result is None
-                or "links" not in result
-                or "pages" not in result["links"]
-                or "next" not in result["links"]["pages"]
-            ):
-                return None
-            return result["links"]["pages"]["next"]
+        if max_workers is None:
+            max_workers = self.page_concurrency
 
         params["per_page"] = 200
         response = self.request(endpoint=endpoint, params=params)
 
-        # in case of strange result like " "firewalls": null "
-        if response[key] is None:
-            result = []
-        elif isinstance(response[key], list):
-            result = response[key]
-        else:
-            result = list(response[key])
+        result = self._get_page_items(response, key)
+        self._on_page(self._build_url(endpoint), key, result)
+
+        page_urls = None
+        if max_workers is not None and max_workers > 1:
+            page_urls = self._get_page_urls(response, params["per_page"])
+        if page_urls is not None:
+
+            def fetch_page(url: str) -> t.List[t.Dict[str, t.Any]]:
+                items = self._decode(self._send(method="get", url=url))[key] or []
+                self._on_page(url, key, items)
+                return items
+
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                pages = list(executor.map(fetch_page, page_urls))
+            return self._merge_pages(result, pages)
+
         while True:
-            next_url = get_next_page(response)
+            next_url = self._get_next_page(response)
             if next_url is None:
                 break
-            res = httpx.get(next_url, headers=self.headers)
-            res.raise_for_status()
-            self._process_response(res)
-            response = res.json()
+            response = self._decode(self._send(method="get", url=next_url))
             result += response[key]
+            self._on_page(next_url, key, response[key] or [])
 
         return result
 
+    def fetch_many(
+        self, endpoints: t.Iterable[str], max_workers: int = None
+    ) -> t.List[t.Dict[str, t.Any]]:
+        # GET endpoints with a thread pool, results are in order of endpoints
+        if max_workers is None:
+            max_workers = MANY_CONCURRENCY
+        endpoints = list(endpoints)
+        unique = list(dict.fromkeys(endpoints))
+        if max_workers > 1 and len(unique) > 1:
+            with ThreadPoolExecutor(
+                max_workers=min(max_workers, len(unique))
+            ) as executor:
+                results = list(
+                    executor.map(lambda endpoint: self.request(endpoint), unique)
+                )
+        else:
+            results = [self.request(endpoint) for endpoint in unique]
+        fetched = dict(zip(unique, results))
+        return [fetched[endpoint] for endpoint in endpoints]
+
+    def iter_pages(
+        self,
+        endpoint: str,
+        key: str,
+        params: dict = None,
+    ) -> t.Iterator[t.List[t.Dict[str, t.Any]]]:
+        params = dict(params or {})
+        params["per_page"] = 200
+        response = self.request(endpoint=endpoint, params=params)
+        url = self._build_url(endpoint)
+
+        # next page is downloaded in background while current one is consumed
+        executor = ThreadPoolExecutor(max_workers=1)
+        future: t.Optional[Future] = None
+        try:
+            while True:
+                next_url = self._get_next_page(response)
+                if next_url is not None:
+                    future = executor.submit(
+                        lambda url: self._decode(self._send(method="get", url=url)),
+                        next_url,
+                    )
+                items = self._get_page_items(response, key)
+                self._on_page(url, key, items)
+                yield items
+                if future is None:
+                    return
+                response = future.result()
+                url, future = next_url, None
+        finally:
+            if future is not None:
+                future.cancel()
+            executor.shutdown(wait=False)
+
+    def __enter__(self) -> "Client":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: t.Type[BaseException] = None,
+        exc_value: BaseException = None,
+        traceback: TracebackType = None,
+    ) -> None:
+        self.close()
+
 
 class AsyncClient(BaseClient):
 
-    account: t.Optional[mn.AsyncAccountManager] = None
-    actions: t.Optional[mn.AsyncActionsManager] = None
-    cdn_endpoints: t.Optional[mn.AsyncCDNEndpointsManager] = None
-    certificates: t.Optional[mn.AsyncCertificatesManager] = None
-    databases: t.Optional[mn.AsyncDatabasesManager] = None
-    domains: t.Optional[mn.AsyncDomainsManager] = None
-    droplets: t.Optional[mn.AsyncDropletsManager] = None
-    firewalls: t.Optional[mn.AsyncFirewallsManager] = None
-    floating_ips: t.Optional[mn.AsyncFloatingIPsManager] = None
-    images: t.Optional[mn.AsyncImagesManager] = None
-    invoices: t.Optional[mn.AsyncInvoicesManager] = None
-    kubernetes: t.Optional[mn.AsyncKubernetesManager] = None
-    load_balancers: t.Optional[mn.AsyncLoadBalancersManager] = None
-    one_clicks: t.Optional[mn.AsyncOneClicksManager] = None
-    projects: t.Optional[mn.AsyncProjectsManager] = None
-    regions: t.Optional[mn.AsyncRegionsManager] = None
-    registry: t.Optional[mn.AsyncRegistryManager] = None
-    snapshots: t.Optional[mn.AsyncSnapshotsManager] = None
-    ssh_keys: t.Optional[mn.AsyncSSHKeysManager] = None
-    tags: t.Optional[mn.AsyncTagsManager] = None
-    volumes: t.Optional[mn.AsyncVolumesManager] = None
-    vpcs: t.Optional[mn.AsyncVPCsManager] = None
-
-    def _load_managers(self) -> None:
-        for manager in mn.__async_managers__:
-            klass = getattr(mn, manager)
-            obj = klass(client=self)
-            setattr(self, klass.endpoint, obj)
+    account: "LazyManager[mn.AsyncAccountManager]" = LazyManager("AsyncAccountManager")
+    actions: "LazyManager[mn.AsyncActionsManager]" = LazyManager("AsyncActionsManager")
+    cdn_endpoints: "LazyManager[mn.AsyncCDNEndpointsManager]" = LazyManager(
+        "AsyncCDNEndpointsManager"
+    )
+    certificates: "LazyManager[mn.AsyncCertificatesManager]" = LazyManager(
+        "AsyncCertificatesManager"
+    )
+    databases: "LazyManager[mn.AsyncDatabasesManager]" = LazyManager(
+        "AsyncDatabasesManager"
+    )
+    domains: "LazyManager[mn.AsyncDomainsManager]" = LazyManager("AsyncDomainsManager")
+    droplets: "LazyManager[mn.AsyncDropletsManager]" = LazyManager(
+        "AsyncDropletsManager"
+    )
+    firewalls: "LazyManager[mn.AsyncFirewallsManager]" = LazyManager(
+        "AsyncFirewallsManager"
+    )
+    floating_ips: "LazyManager[mn.AsyncFloatingIPsManager]" = LazyManager(
+        "AsyncFloatingIPsManager"
+    )
+    images: "LazyManager[mn.AsyncImagesManager]" = LazyManager("AsyncImagesManager")
+    invoices: "LazyManager[mn.AsyncInvoicesManager]" = LazyManager(
+        "AsyncInvoicesManager"
+    )
+    kubernetes: "LazyManager[mn.AsyncKubernetesManager]" = LazyManager(
+        "AsyncKubernetesManager"
+    )
+    load_balancers: "LazyManager[mn.AsyncLoadBalancersManager]" = LazyManager(
+        "AsyncLoadBalancersManager"
+    )
+    one_clicks: "LazyManager[mn.AsyncOneClicksManager]" = LazyManager(
+        "AsyncOneClicksManager"
+    )
+    projects: "LazyManager[mn.AsyncProjectsManager]" = LazyManager(
+        "AsyncProjectsManager"
+    )
+    regions: "LazyManager[mn.AsyncRegionsManager]" = LazyManager("AsyncRegionsManager")
+    registry: "LazyManager[mn.AsyncRegistryManager]" = LazyManager(
+        "AsyncRegistryManager"
+    )
+    snapshots: "LazyManager[mn.AsyncSnapshotsManager]" = LazyManager(
+        "AsyncSnapshotsManager"
+    )
+    ssh_keys: "LazyManager[mn.AsyncSSHKeysManager]" = LazyManager("AsyncSSHKeysManager")
+    tags: "LazyManager[mn.AsyncTagsManager]" = LazyManager("AsyncTagsManager")
+    volumes: "LazyManager[mn.AsyncVolumesManager]" = LazyManager("AsyncVolumesManager")
+    vpcs: "LazyManager[mn.AsyncVPCsManager]" = LazyManager("AsyncVPCsManager")
+
+    _http: t.Optional[httpx.AsyncClient] = None
+
+    @property
+    def http(self) -> httpx.AsyncClient:
+        if self._http is None or self._http.is_closed:
+            self._http = httpx.AsyncClient(**self._http_options())
+        return self._http
+
+    async def close(self) -> None:
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
+
+    async def _send(
+        self,
+        method: str,
+        url: str,
+        params: dict = None,
+        json: dict = None,
+        data: t.Union[str, bytes] = None,
+    ) -> httpx.Response:
+        if json is not None:
+            data = self.json_codec.dumps(json)
+        request = self.http.build_request(
+            method=method,
+            url=url,
+            headers=self.headers,
+            params=params,
+            content=data,
+        )
+        response, cache_entry = self._get_cached_response(request)
+        if response is not None:
+            event = self._on_request(request, 0)
+            self._on_response(
+                event, request, time.perf_counter(), response, cached=True
+            )
+            return response
+
+        if method.lower() != "get" or not self.coalesce:
+            return await self._send_request(request, cache_entry)
+
+        # identical GETs in flight share the response of the first one
+        import asyncio
+
+        key = str(request.url)
+        while key in self._inflight:
+            future = self._inflight[key]
+            try:
+                return await asyncio.shield(future)
+            except asyncio.CancelledError:
+                # the first request was cancelled, not this one
+                if not future.cancelled():
+                    raise
+        future = asyncio.get_event_loop().create_future()
+        self._inflight[key] = future
+        try:
+            response = await self._send_request(request, cache_entry)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as exc:
+            future.set_exception(exc)
+            # mark as retrieved, there may be no other waiters
+            future.exception()
+            raise
+        else:
+            future.set_result(response)
+        finally:
+            del self._inflight[key]
+        return response
+
+    async def _send_request(
+        self, request: httpx.Request, cache_entry: t.Optional[CacheEntry]
+    ) -> httpx.Response:
+        method = request.method.lower()
+        attempt = 0
+        while True:
+            if self.rate_limiter is not None:
+                await self.rate_limiter.async_wait()
+
+            event = self._on_request(request, attempt)
+            started = time.perf_counter()
+            try:
+                response = await self.http.send(request)
+            except httpx.TransportError as exc:
+                self._on_response(event, request, started, error=exc)
+                if not self._is_retryable(method, attempt, exc=exc):
+                    raise
+                delay = self.retry.get_backoff(attempt)
+                self._on_retry(event, delay, error=exc)
+            else:
+                # save data to client from response
+                self._process_response(response)
+                self._on_response(event, request, started, response)
+
+                if not self._is_retryable(method, attempt, response=response):
+                    response = self._cache_response(request, response, cache_entry)
+
+                    # raise exceptions in case of errors
+                    response.raise_for_status()
+                    return response
+                delay = self.retry.get_backoff(attempt, response)
+                self._on_retry(event, delay, response=response)
+
+            attempt += 1
+            await _sleep(delay)
 
     async def request_raw(
         self,
@@ -204,7 +797,7 @@ class AsyncClient(BaseClient):
         method: str = "get",
         params: dict = {},
         json: dict = None,
-        data: str = None,
+        data: t.Union[str, bytes] = None,
     ) -> httpx.Response:
         assert method in [
             "get",
@@ -214,37 +807,21 @@ class AsyncClient(BaseClient):
             "head",
         ], "Invalid method {method}".format(method=method)
 
-        url = "https://{domain}/{version}/{endpoint}".format(
-            domain=self.API_DOMAIN,
-            version=self.API_VERSION,
-            endpoint=endpoint,
+        return await self._send(
+            method=method,
+            url=self._build_url(endpoint),
+            params=params,
+            json=json,
+            data=data,
         )
 
-        async with httpx.AsyncClient() as async_client:
-            response = await async_client.request(
-                method=method,
-                url=url,
-                headers=self.headers,
-                params=params,
-                json=json,
-                content=data,
-            )
-
-        # raise exceptions in case of errors
-        response.raise_for_status()
-
-        # save data to client from response
-        self._process_response(response)
-
-        return response
-
     async def request(
         self,
         endpoint: str = "account",
         method: str = "get",
         params: dict = {},
         json: dict = None,
-        data: str = None,
+        data: t.Union[str, bytes] = None,
     ) -> t.Dict[str, t.Any]:
         response = await self.request_raw(endpoint, method, params, json, data)
         if response.status_code in [httpx.codes.NO_CONTENT]:
@@ -252,49 +829,105 @@ class AsyncClient(BaseClient):
         # PUT to /v2/databases/$DATABASE_ID/migrate return 202 with empty body
         elif response.status_code == httpx.codes.ACCEPTED and response.content == b"":
             return {}
-        return response.json()
+        return self._decode(response)
 
     async def fetch_all(
         self,
         endpoint: str,
         key: str,
         params: dict = {},
+        concurrency: int = None,
     ) -> t.List[t.Dict[str, t.Any]]:
-        def get_next_page(result: t.Dict[str, t.Any] = None) -> t.Optional[str]:
-            if (
-                result is None
-                or "links" not in result
-                or "pages" not in result["links"]
-                or "next" not in result["links"]["pages"]
-            ):
-                return None
-            return result["links"]["pages"]["next"]
+        if concurrency is None:
+            concurrency = self.page_concurrency
 
         params["per_page"] = 200
         response = await self.request(endpoint=endpoint, params=params)
 
-        # in case of strange result like " "firewalls": null "
-        if response[key] is None:
-            result = []
-        elif isinstance(response[key], list):
-            result = response[key]
-        else:
-            result = list(response[key])
+        result = self._get_page_items(response, key)
+        self._on_page(self._build_url(endpoint), key, result)
+
+        page_urls = None
+        if concurrency is not None and concurrency > 1:
+            page_urls = self._get_page_urls(response, params["per_page"])
+        if page_urls is not None:
+            import asyncio
+
+            semaphore = asyncio.Semaphore(concurrency)
+
+            async def fetch_page(url: str) -> t.List[t.Dict[str, t.Any]]:
+                async with semaphore:
+                    res = await self._send(method="get", url=url)
+                items = self._decode(res)[key] or []
+                self._on_page(url, key, items)
+                return items
+
+            pages = await asyncio.gather(*[fetch_page(url) for url in page_urls])
+            return self._merge_pages(result, pages)
+
         while True:
-            next_url = get_next_page(response)
+            next_url = self._get_next_page(response)
             if next_url is None:
                 break
-
-            async with httpx.AsyncClient() as async_client:
-                res = await async_client.get(next_url, headers=self.headers)
-            res.raise_for_status()
-            self._process_response(res)
-            response = res.json()
+            response = self._decode(await self._send(method="get", url=next_url))
             result += response[key]
+            self._on_page(next_url, key, response[key] or [])
 
         return result
 
+    async def fetch_many(
+        self, endpoints: t.Iterable[str], concurrency: int = None
+    ) -> t.List[t.Dict[str, t.Any]]:
+        # GET endpoints with at most concurrency requests in flight
+        import asyncio
+
+        if concurrency is None:
+            concurrency = MANY_CONCURRENCY
+        semaphore = asyncio.Semaphore(max(concurrency, 1))
+
+        async def fetch(endpoint: str) -> t.Dict[str, t.Any]:
+            async with semaphore:
+                return await self.request(endpoint)
+
+        endpoints = list(endpoints)
+        unique = list(dict.fromkeys(endpoints))
+        results = await asyncio.gather(*[fetch(endpoint) for endpoint in unique])
+        fetched = dict(zip(unique, results))
+        return [fetched[endpoint] for endpoint in endpoints]
+
+    async def iter_pages(
+        self,
+        endpoint: str,
+        key: str,
+        params: dict = None,
+    ) -> t.AsyncIterator[t.List[t.Dict[str, t.Any]]]:
+        params = dict(params or {})
+        params["per_page"] = 200
+        response = await self.request(endpoint=endpoint, params=params)
+        url = self._build_url(endpoint)
+
+        import asyncio
+
+        # next page is downloaded in background while current one is consumed
+        task: t.Optional[asyncio.Future] = None
+        try:
+            while True:
+                next_url = self._get_next_page(response)
+                if next_url is not None:
+                    task = asyncio.ensure_future(self._send(method="get", url=next_url))
+                items = self._get_page_items(response, key)
+                self._on_page(url, key, items)
+                yield items
+                if task is None:
+                    return
+                response = self._decode(await task)
+                url, task = next_url, None
+        finally:
+            if task is not None:
+                task.cancel()
+
     async def __aenter__(self) -> "AsyncClient":
+        await self.http.__aenter__()
         return self
 
     async def __aexit__(
@@ -303,4 +936,4 @@ class AsyncClient(BaseClient):
         exc_value: BaseException = None,
         traceback: TracebackType = None,
     ) -> None:
-        pass
+        await self.close()
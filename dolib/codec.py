@@ -0,0 +1,91 @@
+import json
+import typing as t
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore
+
+try:
+    import ujson
+except ImportError:  # pragma: no cover
+    ujson = None  # type: ignore
+
+
+def pydantic_encoder(obj: t.Any) -> t.Any:
+    # pydantic is imported on first use, it's slow to import
+    from pydantic.json import pydantic_encoder
+
+    return pydantic_encoder(obj)
+
+
+class JSONCodec:
+    name = "base"
+
+    def loads(self, content: t.Union[bytes, str]) -> t.Any:
+        raise NotImplementedError("loads must be implemented.")
+
+    def dumps(self, obj: t.Any) -> bytes:
+        raise NotImplementedError("dumps must be implemented.")
+
+
+class StdlibCodec(JSONCodec):
+    name = "json"
+
+    def loads(self, content: t.Union[bytes, str]) -> t.Any:
+        return json.loads(content)
+
+    def dumps(self, obj: t.Any) -> bytes:
+        return json.dumps(obj, default=pydantic_encoder).encode("utf-8")
+
+
+class OrjsonCodec(JSONCodec):
+    name = "orjson"
+
+    def loads(self, content: t.Union[bytes, str]) -> t.Any:
+        return orjson.loads(content)
+
+    def dumps(self, obj: t.Any) -> bytes:
+        return orjson.dumps(
+            obj, default=pydantic_encoder, option=orjson.OPT_NON_STR_KEYS
+        )
+
+
+class UjsonCodec(JSONCodec):
+    name = "ujson"
+
+    def loads(self, content: t.Union[bytes, str]) -> t.Any:
+        return ujson.loads(content)
+
+    def dumps(self, obj: t.Any) -> bytes:
+        return ujson.dumps(
+            obj, default=pydantic_encoder, escape_forward_slashes=False
+        ).encode("utf-8")
+
+
+# fastest first
+CODECS: t.Dict[str, t.Tuple[t.Type[JSONCodec], t.Any]] = {
+    "orjson": (OrjsonCodec, orjson),
+    "ujson": (UjsonCodec, ujson),
+    "json": (StdlibCodec, json),
+}
+
+
+def get_codec(codec: t.Union[str, JSONCodec] = "auto") -> JSONCodec:
+    # "auto" picks the fastest installed codec
+    if isinstance(codec, JSONCodec):
+        return codec
+    if codec == "auto":
+        for codec_cls, module in CODECS.values():
+            if module is not None:
+                return codec_cls()
+    if codec not in CODECS:
+        raise ValueError(
+            "Unknown JSON codec {codec!r}, use one of: auto, {codecs}".format(
+                codec=codec, codecs=", ".join(CODECS)
+            )
+        )
+    codec_cls, module = CODECS[codec]
+    if module is None:
+        raise ValueError("JSON codec {codec!r} is not installed".format(codec=codec))
+    return codec_cls()
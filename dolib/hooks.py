@@ -0,0 +1,142 @@
+import functools
+import re
+import typing as t
+
+# path segments after these ones are identifiers, e.g. droplets/{id}/actions
+ID_COLLECTIONS = frozenset(
+    [
+        "actions",
+        "certificates",
+        "clusters",
+        "databases",
+        "dbs",
+        "domains",
+        "droplets",
+        "endpoints",
+        "firewalls",
+        "floating_ips",
+        "images",
+        "invoices",
+        "keys",
+        "load_balancers",
+        "node_pools",
+        "nodes",
+        "pools",
+        "projects",
+        "records",
+        "registry",
+        "replicas",
+        "repositories",
+        "snapshots",
+        "tags",
+        "users",
+        "volumes",
+        "vpcs",
+    ]
+)
+# static endpoints which follow a collection name
+STATIC_SEGMENTS = frozenset(
+    ["actions", "docker-credentials", "options", "subscription", "validate-name"]
+)
+ID_PATTERN = re.compile(
+    r"^(\d+|[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12})$"
+)
+
+
+@functools.lru_cache(maxsize=1024)
+def endpoint_template(endpoint: str) -> str:
+    # "droplets/123/actions/456" -> "droplets/{id}/actions/{id}"
+    segments = endpoint.strip("/").split("/")
+    for i, segment in enumerate(segments):
+        after_collection = i > 0 and segments[i - 1] in ID_COLLECTIONS
+        if ID_PATTERN.match(segment) or (
+            after_collection and segment not in STATIC_SEGMENTS
+        ):
+            segments[i] = "{id}"
+    return "/".join(segments)
+
+
+class RequestEvent:
+    def __init__(self, method: str, endpoint: str, url: str, attempt: int) -> None:
+        self.method = method
+        # templated endpoint like "droplets/{id}/actions"
+        self.endpoint = endpoint
+        self.url = url
+        self.attempt = attempt
+        # place for hooks to keep state between request and response
+        self.context: t.Dict[str, t.Any] = {}
+
+
+class ResponseEvent:
+    def __init__(
+        self,
+        request: RequestEvent,
+        status_code: t.Optional[int],
+        elapsed: float,
+        request_bytes: int = 0,
+        response_bytes: int = 0,
+        ratelimit_remaining: t.Optional[int] = None,
+        cached: bool = False,
+        error: Exception = None,
+    ) -> None:
+        self.request = request
+        # None if the request failed without response, see error
+        self.status_code = status_code
+        self.elapsed = elapsed
+        self.request_bytes = request_bytes
+        # bytes received from network, compressed ones and 0 for cached responses
+        self.response_bytes = response_bytes
+        self.ratelimit_remaining = ratelimit_remaining
+        self.cached = cached
+        self.error = error
+
+    @property
+    def method(self) -> str:
+        return self.request.method
+
+    @property
+    def endpoint(self) -> str:
+        return self.request.endpoint
+
+
+class RetryEvent:
+    def __init__(
+        self,
+        request: RequestEvent,
+        delay: float,
+        status_code: int = None,
+        error: Exception = None,
+    ) -> None:
+        self.request = request
+        self.delay = delay
+        self.status_code = status_code
+        self.error = error
+
+    @property
+    def reason(self) -> str:
+        if self.error is not None:
+            return self.error.__class__.__name__
+        return str(self.status_code)
+
+
+class PageEvent:
+    def __init__(self, endpoint: str, key: str, page: int, items: int) -> None:
+        self.endpoint = endpoint
+        self.key = key
+        self.page = page
+        self.items = items
+
+
+class Hooks:
+    # base class of client hooks, override the events you need
+    def on_request(self, event: RequestEvent) -> None:
+        pass
+
+    def on_response(self, event: ResponseEvent) -> None:
+        pass
+
+    def on_retry(self, event: RetryEvent) -> None:
+        pass
+
+    def on_page(self, event: PageEvent) -> None:
+        pass
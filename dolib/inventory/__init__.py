@@ -0,0 +1,14 @@
+from .memory import Inventory
+from .resources import RESOURCES, Resource
+from .store import ADDED, CHANGED, REMOVED, Change, InventoryStore
+
+__all__ = [
+    "ADDED",
+    "CHANGED",
+    "REMOVED",
+    "RESOURCES",
+    "Change",
+    "Inventory",
+    "InventoryStore",
+    "Resource",
+]
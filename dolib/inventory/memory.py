@@ -0,0 +1,247 @@
+import threading
+import typing as t
+
+from .. import models
+from .resources import RESOURCES
+from .store import REMOVED, Change
+
+# resource types held by Inventory
+TYPES = ("droplets", "volumes", "firewalls", "load_balancers", "floating_ips", "vpcs")
+INDEXES = ("name", "tag", "region", "vpc", "ip", "droplet")
+
+# ordered set of resource ids
+IDs = t.Dict[str, None]
+
+
+def _get(obj: t.Any, name: str) -> t.Any:
+    # field of a model or of a dict left by unvalidated models
+    if isinstance(obj, dict):
+        return obj.get(name)
+    return getattr(obj, name, None)
+
+
+def _region(item: t.Any) -> t.Optional[str]:
+    region = _get(item, "region")
+    if region is None or isinstance(region, str):
+        return region
+    return _get(region, "slug")
+
+
+def _ips(item: t.Any) -> t.List[str]:
+    ips = [ip for ip in (_get(item, "ip"), _get(item, "ipv4")) if ip]
+    networks = _get(item, "networks")
+    if networks is not None:
+        for version in ("v4", "v6"):
+            for network in _get(networks, version) or []:
+                ips.append(_get(network, "ip_address"))
+    return ips
+
+
+def _droplet_ids(item: t.Any) -> t.List[str]:
+    ids = [str(droplet_id) for droplet_id in _get(item, "droplet_ids") or []]
+    droplet = _get(item, "droplet")
+    if droplet is not None:
+        ids.append(str(_get(droplet, "id")))
+    return ids
+
+
+def _index_keys(item: t.Any) -> t.Dict[str, t.List[str]]:
+    tags = list(_get(item, "tags") or [])
+    if _get(item, "tag"):
+        tags.append(_get(item, "tag"))
+    vpc = _get(item, "vpc_uuid")
+    keys = {
+        "name": [_get(item, "name")],
+        "tag": tags,
+        "region": [_region(item)],
+        "vpc": [str(vpc) if vpc else None],
+        "ip": _ips(item),
+        "droplet": _droplet_ids(item),
+    }
+    return {
+        index: [key for key in index_keys if key is not None]
+        for index, index_keys in keys.items()
+    }
+
+
+class Inventory:
+    # resources in memory with hash indexes and joins between them
+    def __init__(self) -> None:
+        self._lock = threading.RLock()
+        self._items: t.Dict[str, t.Dict[str, t.Any]] = {type: {} for type in TYPES}
+        self._keys: t.Dict[str, t.Dict[str, t.Dict[str, t.List[str]]]] = {
+            type: {} for type in TYPES
+        }
+        self._indexes: t.Dict[t.Tuple[str, str], t.Dict[str, IDs]] = {
+            (type, index): {} for type in TYPES for index in INDEXES
+        }
+
+    @classmethod
+    def from_client(cls, client: t.Any, types: t.Iterable[str] = TYPES) -> "Inventory":
+        inventory = cls()
+        inventory.refresh(client, types)
+        return inventory
+
+    def _check_type(self, type: str) -> None:
+        if type not in self._items:
+            raise ValueError(
+                "Unknown resource type {type!r}, use one of: {types}".format(
+                    type=type, types=", ".join(TYPES)
+                )
+            )
+
+    def _add(self, type: str, id: str, item: t.Any) -> None:
+        self._remove(type, id)
+        keys = _index_keys(item)
+        for index, index_keys in keys.items():
+            entries = self._indexes[(type, index)]
+            for key in index_keys:
+                entries.setdefault(key, {})[id] = None
+        self._items[type][id] = item
+        self._keys[type][id] = keys
+
+    def _remove(self, type: str, id: str) -> None:
+        keys = self._keys[type].pop(id, None)
+        if keys is None:
+            return
+        for index, index_keys in keys.items():
+            entries = self._indexes[(type, index)]
+            for key in index_keys:
+                ids = entries.get(key)
+                if ids is not None:
+                    ids.pop(id, None)
+                    if not ids:
+                        del entries[key]
+        del self._items[type][id]
+
+    def update(self, type: str, items: t.Iterable[t.Any]) -> t.Tuple[int, int, int]:
+        # replace resources of type with items, only changed ones are reindexed
+        self._check_type(type)
+        resource = RESOURCES[type]
+        added = changed = 0
+        with self._lock:
+            current = self._items[type]
+            seen = set()
+            for item in items:
+                id = resource.get_id(item)
+                seen.add(id)
+                old = current.get(id)
+                if old is None:
+                    added += 1
+                elif old == item:
+                    continue
+                else:
+                    changed += 1
+                self._add(type, id, item)
+            removed = [id for id in current if id not in seen]
+            for id in removed:
+                self._remove(type, id)
+        return added, changed, len(removed)
+
+    def apply(self, changes: t.Iterable[Change]) -> None:
+        # follow the change feed of an InventoryStore
+        with self._lock:
+            for change in changes:
+                if change.type not in self._items:
+                    continue
+                if change.kind == REMOVED:
+                    self._remove(change.type, change.id)
+                else:
+                    model = RESOURCES[change.type].model
+                    self._add(
+                        change.type, change.id, models.construct(model, change.data)
+                    )
+
+    def refresh(self, client: t.Any, types: t.Iterable[str] = TYPES) -> None:
+        for type in types:
+            self._check_type(type)
+            self.update(type, RESOURCES[type].fetch(client, validate=client.validate))
+
+    async def async_refresh(
+        self, client: t.Any, types: t.Iterable[str] = TYPES
+    ) -> None:
+        import asyncio
+
+        types = list(types)
+        for type in types:
+            self._check_type(type)
+        results = await asyncio.gather(
+            *(
+                RESOURCES[type].async_fetch(client, validate=client.validate)
+                for type in types
+            )
+        )
+        for type, items in zip(types, results):
+            self.update(type, items)
+
+    def get(self, type: str, id: t.Any) -> t.Any:
+        self._check_type(type)
+        return self._items[type].get(str(id))
+
+    def all(self, type: str) -> t.List[t.Any]:
+        self._check_type(type)
+        return list(self._items[type].values())
+
+    def count(self, type: str) -> int:
+        self._check_type(type)
+        return len(self._items[type])
+
+    def _ids(self, type: str, **conditions: t.Any) -> t.Iterable[str]:
+        sets: t.List[t.Collection[str]] = []
+        for index, key in conditions.items():
+            if index == "id":
+                sets.append({str(key)} if str(key) in self._items[type] else set())
+                continue
+            if index not in INDEXES:
+                raise ValueError(
+                    "Unknown index {index!r}, use one of: id, {indexes}".format(
+                        index=index, indexes=", ".join(INDEXES)
+                    )
+                )
+            sets.append(self._indexes[(type, index)].get(str(key), {}))
+        if not sets:
+            return self._items[type]
+        sets.sort(key=len)
+        first, others = sets[0], sets[1:]
+        return [id for id in first if all(id in ids for ids in others)]
+
+    def find(self, type: str, **conditions: t.Any) -> t.List[t.Any]:
+        # resources matching all conditions, e.g. find("volumes", region="fra1")
+        self._check_type(type)
+        items = self._items[type]
+        return [items[id] for id in self._ids(type, **conditions)]
+
+    def find_one(self, type: str, **conditions: t.Any) -> t.Any:
+        found = self.find(type, **conditions)
+        return found[0] if found else None
+
+    def volumes_of(self, droplet: t.Any) -> t.List[t.Any]:
+        droplet_id = str(_get(droplet, "id"))
+        ids = dict.fromkeys(_get(droplet, "volume_ids") or [])
+        ids.update(self._indexes[("volumes", "droplet")].get(droplet_id, {}))
+        volumes = self._items["volumes"]
+        return [volumes[id] for id in ids if id in volumes]
+
+    def _attached(self, type: str, droplet: t.Any) -> t.List[t.Any]:
+        # resources targeting droplet by its id or by one of its tags
+        ids = dict(self._indexes[(type, "droplet")].get(str(_get(droplet, "id")), {}))
+        for tag in _get(droplet, "tags") or []:
+            ids.update(self._indexes[(type, "tag")].get(tag, {}))
+        items = self._items[type]
+        return [items[id] for id in ids]
+
+    def firewalls_of(self, droplet: t.Any) -> t.List[t.Any]:
+        return self._attached("firewalls", droplet)
+
+    def load_balancers_of(self, droplet: t.Any) -> t.List[t.Any]:
+        return self._attached("load_balancers", droplet)
+
+    def droplets_of(self, item: t.Any) -> t.List[t.Any]:
+        # droplets of a volume, firewall, load balancer or floating ip
+        ids = dict.fromkeys(_droplet_ids(item))
+        if isinstance(item, (models.Firewall, models.LoadBalancer)):
+            # firewalls and load balancers target droplets by tags too
+            for tag in _index_keys(item)["tag"]:
+                ids.update(self._indexes[("droplets", "tag")].get(tag, {}))
+        droplets = self._items["droplets"]
+        return [droplets[id] for id in ids if id in droplets]
@@ -0,0 +1,93 @@
+import typing as t
+
+from .. import models
+
+
+class Resource:
+    # resource type of the inventory and how to list it with managers
+    def __init__(
+        self,
+        name: str,
+        model: t.Type[models.BaseModel],
+        manager: str,
+        method: str = "all",
+        kwargs: t.Dict[str, t.Any] = None,
+        id_field: str = "id",
+        parent: str = None,
+    ) -> None:
+        self.name = name
+        self.model = model
+        self.manager = manager
+        self.method = method
+        self.kwargs = kwargs or {}
+        self.id_field = id_field
+        # listed per item of parent resource, e.g. records of every domain
+        self.parent = parent
+
+    def get_id(self, item: models.BaseModel) -> str:
+        return str(getattr(item, self.id_field))
+
+    def fetch(
+        self, client: t.Any, parent_id: str = None, validate: bool = False
+    ) -> t.List[models.BaseModel]:
+        method = getattr(getattr(client, self.manager), self.method)
+        args = () if parent_id is None else (parent_id,)
+        return method(*args, validate=validate, **self.kwargs)
+
+    async def async_fetch(
+        self, client: t.Any, parent_id: str = None, validate: bool = False
+    ) -> t.List[models.BaseModel]:
+        method = getattr(getattr(client, self.manager), self.method)
+        args = () if parent_id is None else (parent_id,)
+        return await method(*args, validate=validate, **self.kwargs)
+
+
+RESOURCES: t.Dict[str, Resource] = {
+    resource.name: resource
+    for resource in [
+        Resource("droplets", models.Droplet, "droplets"),
+        Resource("volumes", models.Volume, "volumes"),
+        Resource(
+            "images", models.Image, "images", method="filter", kwargs={"private": True}
+        ),
+        Resource("snapshots", models.Snapshot, "snapshots"),
+        Resource("tags", models.Tag, "tags", id_field="name"),
+        Resource("domains", models.Domain, "domains", id_field="name"),
+        Resource(
+            "domain_records",
+            models.Domain.Record,
+            "domains",
+            method="records",
+            parent="domains",
+        ),
+        Resource("firewalls", models.Firewall, "firewalls"),
+        Resource("floating_ips", models.FloatingIP, "floating_ips", id_field="ip"),
+        Resource("load_balancers", models.LoadBalancer, "load_balancers"),
+        Resource("vpcs", models.VPC, "vpcs"),
+        Resource("certificates", models.Certificate, "certificates"),
+        Resource("cdn_endpoints", models.CDNEndpoint, "cdn_endpoints"),
+        Resource("projects", models.Project, "projects"),
+        Resource("ssh_keys", models.SSHKey, "ssh_keys"),
+        Resource("kubernetes_clusters", models.K8SCluster, "kubernetes"),
+        Resource("databases", models.DBCluster, "databases"),
+    ]
+}
+
+
+def get_resources(types: t.Iterable[str] = None) -> t.List[Resource]:
+    # resources in listing order, parents before children
+    if types is None:
+        return list(RESOURCES.values())
+    names = set(types)
+    unknown = names - set(RESOURCES)
+    if unknown:
+        raise ValueError(
+            "Unknown resource types: {unknown}".format(
+                unknown=", ".join(sorted(unknown))
+            )
+        )
+    for name in list(names):
+        parent = RESOURCES[name].parent
+        if parent is not None:
+            names.add(parent)
+    return [resource for name, resource in RESOURCES.items() if name in names]
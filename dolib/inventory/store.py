@@ -0,0 +1,311 @@
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+import typing as t
+
+from .. import models
+from ..codec import JSONCodec, get_codec, pydantic_encoder
+from .resources import RESOURCES, Resource, get_resources
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS resources (
+    type TEXT NOT NULL,
+    id TEXT NOT NULL,
+    parent TEXT,
+    hash TEXT NOT NULL,
+    data TEXT NOT NULL,
+    updated_at REAL NOT NULL,
+    PRIMARY KEY (type, id)
+);
+CREATE INDEX IF NOT EXISTS resources_parent ON resources (type, parent);
+CREATE TABLE IF NOT EXISTS changes (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    type TEXT NOT NULL,
+    id TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    hash TEXT,
+    data TEXT,
+    at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS syncs (
+    type TEXT PRIMARY KEY,
+    synced_at REAL NOT NULL,
+    count INTEGER NOT NULL
+);
+"""
+
+ADDED = "added"
+CHANGED = "changed"
+REMOVED = "removed"
+
+# (id, parent, hash, canonical json) of a fetched resource
+Row = t.Tuple[str, t.Optional[str], str, str]
+
+
+class Change:
+    def __init__(
+        self,
+        seq: int,
+        type: str,
+        id: str,
+        kind: str,
+        hash: t.Optional[str],
+        data: t.Optional[t.Dict[str, t.Any]],
+        at: float,
+    ) -> None:
+        self.seq = seq
+        self.type = type
+        self.id = id
+        # added, changed or removed
+        self.kind = kind
+        self.hash = hash
+        # new state of the resource, None if removed
+        self.data = data
+        self.at = at
+
+    def __repr__(self) -> str:
+        return "Change(seq={seq}, type={type!r}, id={id!r}, kind={kind!r})".format(
+            seq=self.seq, type=self.type, id=self.id, kind=self.kind
+        )
+
+
+def _canonical(item: models.BaseModel) -> t.Tuple[str, str]:
+    data = json.dumps(
+        item.dict(),
+        sort_keys=True,
+        separators=(",", ":"),
+        default=pydantic_encoder,
+    )
+    return data, hashlib.sha1(data.encode("utf-8")).hexdigest()
+
+
+class InventoryStore:
+    # local sqlite mirror of account resources, refreshed with client managers
+    def __init__(
+        self, path: str = ":memory:", json_codec: t.Union[str, JSONCodec] = "auto"
+    ) -> None:
+        self.path = path
+        self.json_codec = get_codec(json_codec)
+        self._lock = threading.RLock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        if path != ":memory:":
+            # readers don't block the refreshing writer
+            self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.executescript(SCHEMA)
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
+
+    def __enter__(self) -> "InventoryStore":
+        return self
+
+    def __exit__(self, *args: t.Any) -> None:
+        self.close()
+
+    def _rows(
+        self, resource: Resource, items: t.Iterable[t.Tuple[t.Optional[str], t.Any]]
+    ) -> t.List[Row]:
+        rows = []
+        for parent, item in items:
+            data, digest = _canonical(item)
+            item_id = resource.get_id(item)
+            if parent is not None:
+                item_id = "{parent}/{id}".format(parent=parent, id=item_id)
+            rows.append((item_id, parent, digest, data))
+        return rows
+
+    def _apply(self, resource: Resource, rows: t.List[Row]) -> t.List[Change]:
+        now = time.time()
+        changes: t.List[t.Tuple[str, str, str, t.Optional[str], t.Optional[str]]] = []
+        with self._lock, self._db:
+            existing = dict(
+                self._db.execute(
+                    "SELECT id, hash FROM resources WHERE type = ?", (resource.name,)
+                )
+            )
+            seen = set()
+            for item_id, parent, digest, data in rows:
+                seen.add(item_id)
+                old_digest = existing.get(item_id)
+                if old_digest == digest:
+                    continue
+                kind = ADDED if old_digest is None else CHANGED
+                self._db.execute(
+                    "INSERT OR REPLACE INTO resources "
+                    "(type, id, parent, hash, data, updated_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    (resource.name, item_id, parent, digest, data, now),
+                )
+                changes.append((resource.name, item_id, kind, digest, data))
+            for item_id in existing.keys() - seen:
+                self._db.execute(
+                    "DELETE FROM resources WHERE type = ? AND id = ?",
+                    (resource.name, item_id),
+                )
+                changes.append((resource.name, item_id, REMOVED, None, None))
+
+            result = []
+            for type, item_id, kind, digest, data in changes:
+                cursor = self._db.execute(
+                    "INSERT INTO changes (type, id, kind, hash, data, at) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    (type, item_id, kind, digest, data, now),
+                )
+                result.append(
+                    Change(
+                        t.cast(int, cursor.lastrowid),
+                        type,
+                        item_id,
+                        kind,
+                        digest,
+                        None if data is None else self.json_codec.loads(data),
+                        now,
+                    )
+                )
+            self._db.execute(
+                "INSERT OR REPLACE INTO syncs (type, synced_at, count) "
+                "VALUES (?, ?, ?)",
+                (resource.name, now, len(rows)),
+            )
+        return result
+
+    def refresh(self, client: t.Any, types: t.Iterable[str] = None) -> t.List[Change]:
+        # list resources with managers of a sync client, returns the changes
+        changes: t.List[Change] = []
+        fetched: t.Dict[str, t.List[t.Any]] = {}
+        for resource in get_resources(types):
+            items: t.List[t.Tuple[t.Optional[str], t.Any]]
+            if resource.parent is None:
+                items = [(None, item) for item in resource.fetch(client)]
+            else:
+                parent = RESOURCES[resource.parent]
+                items = [
+                    (parent.get_id(parent_item), item)
+                    for parent_item in fetched[resource.parent]
+                    for item in resource.fetch(client, parent.get_id(parent_item))
+                ]
+            fetched[resource.name] = [item for _, item in items]
+            changes += self._apply(resource, self._rows(resource, items))
+        return changes
+
+    async def async_refresh(
+        self, client: t.Any, types: t.Iterable[str] = None
+    ) -> t.List[Change]:
+        # same as refresh with an AsyncClient, resource types are listed concurrently
+        import asyncio
+
+        resources = get_resources(types)
+        top = [resource for resource in resources if resource.parent is None]
+        results = await asyncio.gather(
+            *(resource.async_fetch(client) for resource in top)
+        )
+        fetched = {resource.name: items for resource, items in zip(top, results)}
+
+        changes: t.List[Change] = []
+        for resource in resources:
+            items: t.List[t.Tuple[t.Optional[str], t.Any]]
+            if resource.parent is None:
+                items = [(None, item) for item in fetched[resource.name]]
+            else:
+                parent = RESOURCES[resource.parent]
+                parent_ids = [parent.get_id(item) for item in fetched[parent.name]]
+                pages = await asyncio.gather(
+                    *(
+                        resource.async_fetch(client, parent_id)
+                        for parent_id in parent_ids
+                    )
+                )
+                items = [
+                    (parent_id, item)
+                    for parent_id, page in zip(parent_ids, pages)
+                    for item in page
+                ]
+            changes += self._apply(resource, self._rows(resource, items))
+        return changes
+
+    def _load(self, type: str, data: str, validate: bool) -> models.BaseModel:
+        model = RESOURCES[type].model
+        values = self.json_codec.loads(data)
+        if validate:
+            return model(**values)
+        return models.construct(model, values)
+
+    def get(
+        self, type: str, id: t.Any, validate: bool = False
+    ) -> t.Optional[models.BaseModel]:
+        with self._lock:
+            row = self._db.execute(
+                "SELECT data FROM resources WHERE type = ? AND id = ?", (type, str(id))
+            ).fetchone()
+        return None if row is None else self._load(type, row[0], validate)
+
+    def all(
+        self, type: str, parent: str = None, validate: bool = False
+    ) -> t.List[models.BaseModel]:
+        # e.g. all("droplets") or all("domain_records", parent="example.com")
+        query = "SELECT data FROM resources WHERE type = ?"
+        params: t.Tuple[t.Any, ...] = (type,)
+        if parent is not None:
+            query += " AND parent = ?"
+            params += (parent,)
+        with self._lock:
+            rows = self._db.execute(query + " ORDER BY rowid", params).fetchall()
+        return [self._load(type, data, validate) for (data,) in rows]
+
+    def count(self, type: str) -> int:
+        with self._lock:
+            return self._db.execute(
+                "SELECT COUNT(*) FROM resources WHERE type = ?", (type,)
+            ).fetchone()[0]
+
+    def synced_at(self, type: str) -> t.Optional[float]:
+        with self._lock:
+            row = self._db.execute(
+                "SELECT synced_at FROM syncs WHERE type = ?", (type,)
+            ).fetchone()
+        return None if row is None else row[0]
+
+    def changes(
+        self, since: int = 0, types: t.Iterable[str] = None, limit: int = None
+    ) -> t.List[Change]:
+        # change feed after sequence number since, oldest first
+        query = "SELECT seq, type, id, kind, hash, data, at FROM changes WHERE seq > ?"
+        params: t.Tuple[t.Any, ...] = (since,)
+        if types is not None:
+            types = list(types)
+            query += " AND type IN ({marks})".format(marks=", ".join("?" * len(types)))
+            params += tuple(types)
+        query += " ORDER BY seq"
+        if limit is not None:
+            query += " LIMIT ?"
+            params += (limit,)
+        with self._lock:
+            rows = self._db.execute(query, params).fetchall()
+        return [
+            Change(
+                seq,
+                type,
+                id,
+                kind,
+                digest,
+                None if data is None else self.json_codec.loads(data),
+                at,
+            )
+            for seq, type, id, kind, digest, data, at in rows
+        ]
+
+    @property
+    def last_seq(self) -> int:
+        with self._lock:
+            row = self._db.execute(
+                "SELECT seq FROM sqlite_sequence WHERE name = 'changes'"
+            ).fetchone()
+        return 0 if row is None else row[0]
+
+    def prune(self, before: int) -> None:
+        # drop change feed entries up to sequence number before
+        with self._lock, self._db:
+            self._db.execute("DELETE FROM changes WHERE seq <= ?", (before,))
@@ -1,26 +1,81 @@
-from .account import AccountManager, AsyncAccountManager
-from .actions import ActionsManager, AsyncActionsManager
-from .base import AsyncBaseManager, BaseManager
-from .cdns import AsyncCDNEndpointsManager, CDNEndpointsManager
-from .certificates import AsyncCertificatesManager, CertificatesManager
-from .databases import AsyncDatabasesManager, DatabasesManager
-from .domains import AsyncDomainsManager, DomainsManager
-from .droplets import AsyncDropletsManager, DropletsManager
-from .firewalls import AsyncFirewallsManager, FirewallsManager
-from .floating_ips import AsyncFloatingIPsManager, FloatingIPsManager
-from .images import AsyncImagesManager, ImagesManager
-from .invoices import AsyncInvoicesManager, InvoicesManager
-from .kubernetes import AsyncKubernetesManager, KubernetesManager
-from .load_balancers import AsyncLoadBalancersManager, LoadBalancersManager
-from .oneclicks import AsyncOneClicksManager, OneClicksManager
-from .projects import AsyncProjectsManager, ProjectsManager
-from .regions import AsyncRegionsManager, RegionsManager
-from .registry import AsyncRegistryManager, RegistryManager
-from .snapshots import AsyncSnapshotsManager, SnapshotsManager
-from .ssh_keys import AsyncSSHKeysManager, SSHKeysManager
-from .tags import AsyncTagsManager, TagsManager
-from .volumes import AsyncVolumesManager, VolumesManager
-from .vpcs import AsyncVPCsManager, VPCsManager
+import importlib
+import sys
+import typing as t
+
+if t.TYPE_CHECKING:  # pragma: no cover
+    from .account import AccountManager, AsyncAccountManager
+    from .actions import ActionsManager, AsyncActionsManager
+    from .base import AsyncBaseManager, BaseManager
+    from .cdns import AsyncCDNEndpointsManager, CDNEndpointsManager
+    from .certificates import AsyncCertificatesManager, CertificatesManager
+    from .databases import AsyncDatabasesManager, DatabasesManager
+    from .domains import AsyncDomainsManager, DomainsManager
+    from .droplets import AsyncDropletsManager, DropletsManager
+    from .firewalls import AsyncFirewallsManager, FirewallsManager
+    from .floating_ips import AsyncFloatingIPsManager, FloatingIPsManager
+    from .images import AsyncImagesManager, ImagesManager
+    from .invoices import AsyncInvoicesManager, InvoicesManager
+    from .kubernetes import AsyncKubernetesManager, KubernetesManager
+    from .load_balancers import AsyncLoadBalancersManager, LoadBalancersManager
+    from .oneclicks import AsyncOneClicksManager, OneClicksManager
+    from .projects import AsyncProjectsManager, ProjectsManager
+    from .regions import AsyncRegionsManager, RegionsManager
+    from .registry import AsyncRegistryManager, RegistryManager
+    from .snapshots import AsyncSnapshotsManager, SnapshotsManager
+    from .ssh_keys import AsyncSSHKeysManager, SSHKeysManager
+    from .tags import AsyncTagsManager, TagsManager
+    from .volumes import AsyncVolumesManager, VolumesManager
+    from .vpcs import AsyncVPCsManager, VPCsManager
+
+# modules of manager classes, imported on first access
+__modules__ = {
+    "AccountManager": "account",
+    "AsyncAccountManager": "account",
+    "ActionsManager": "actions",
+    "AsyncActionsManager": "actions",
+    "AsyncBaseManager": "base",
+    "BaseManager": "base",
+    "AsyncCDNEndpointsManager": "cdns",
+    "CDNEndpointsManager": "cdns",
+    "AsyncCertificatesManager": "certificates",
+    "CertificatesManager": "certificates",
+    "AsyncDatabasesManager": "databases",
+    "DatabasesManager": "databases",
+    "AsyncDomainsManager": "domains",
+    "DomainsManager": "domains",
+    "AsyncDropletsManager": "droplets",
+    "DropletsManager": "droplets",
+    "AsyncFirewallsManager": "firewalls",
+    "FirewallsManager": "firewalls",
+    "AsyncFloatingIPsManager": "floating_ips",
+    "FloatingIPsManager": "floating_ips",
+    "AsyncImagesManager": "images",
+    "ImagesManager": "images",
+    "AsyncInvoicesManager": "invoices",
+    "InvoicesManager": "invoices",
+    "AsyncKubernetesManager": "kubernetes",
+    "KubernetesManager": "kubernetes",
+    "AsyncLoadBalancersManager": "load_balancers",
+    "LoadBalancersManager": "load_balancers",
+    "AsyncOneClicksManager": "oneclicks",
+    "OneClicksManager": "oneclicks",
+    "AsyncProjectsManager": "projects",
+    "ProjectsManager": "projects",
+    "AsyncRegionsManager": "regions",
+    "RegionsManager": "regions",
+    "AsyncRegistryManager": "registry",
+    "RegistryManager": "registry",
+    "AsyncSnapshotsManager": "snapshots",
+    "SnapshotsManager": "snapshots",
+    "AsyncSSHKeysManager": "ssh_keys",
+    "SSHKeysManager": "ssh_keys",
+    "AsyncTagsManager": "tags",
+    "TagsManager": "tags",
+    "AsyncVolumesManager": "volumes",
+    "VolumesManager": "volumes",
+    "AsyncVPCsManager": "vpcs",
+    "VPCsManager": "vpcs",
+}
 
 __all__ = [
     "BaseManager",
@@ -125,3 +180,20 @@ __async_managers__ = [
     "AsyncVolumesManager",
     "AsyncVPCsManager",
 ]
+
+
+def __getattr__(name: str) -> t.Any:
+    if name not in __modules__:
+        raise AttributeError(
+            "module {module!r} has no attribute {name!r}".format(
+                module=__name__, name=name
+            )
+        )
+    module = importlib.import_module("." + __modules__[name], __name__)
+    return getattr(module, name)
+
+
+if sys.version_info < (3, 7):  # pragma: no cover
+    # module __getattr__ is supported since python 3.7
+    for name in __modules__:
+        globals()[name] = __getattr__(name)
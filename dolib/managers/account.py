@@ -10,17 +10,17 @@ class AccountManager(BaseManager):
 
     def get(self) -> models.Account:
         res = self._client.request(endpoint="account", method="get")
-        return models.Account(**res["account"])
+        return self._parse(models.Account, res["account"])
 
     def balance(self) -> models.Balance:
         res = self._client.request(endpoint="customers/my/balance", method="get")
-        return models.Balance(**res)
+        return self._parse(models.Balance, res)
 
     def billing_history(self) -> List[models.BillingHistory]:
         res = self._client.fetch_all(
             endpoint="customers/my/billing_history", key="billing_history"
         )
-        return [models.BillingHistory(**history) for history in res]
+        return [self._parse(models.BillingHistory, history) for history in res]
 
 
 class AsyncAccountManager(AsyncBaseManager):
@@ -29,14 +29,14 @@ class AsyncAccountManager(AsyncBaseManager):
 
     async def get(self) -> models.Account:
         res = await self._client.request(endpoint="account", method="get")
-        return models.Account(**res["account"])
+        return self._parse(models.Account, res["account"])
 
     async def balance(self) -> models.Balance:
         res = await self._client.request(endpoint="customers/my/balance", method="get")
-        return models.Balance(**res)
+        return self._parse(models.Balance, res)
 
     async def billing_history(self) -> List[models.BillingHistory]:
         res = await self._client.fetch_all(
             endpoint="customers/my/billing_history", key="billing_history"
         )
-        return [models.BillingHistory(**history) for history in res]
+        return [self._parse(models.BillingHistory, history) for history in res]
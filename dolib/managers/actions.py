@@ -1,36 +1,245 @@
-from typing import List
+import time
+from typing import Any, Callable, Dict, Iterable, List, Set
 
 from .. import models
 from .base import AsyncBaseManager, BaseManager
 
+IN_PROGRESS = "in-progress"
+ERRORED = "errored"
+PER_PAGE = 200
+
+
+def _wait_result(
+    actions: List[models.Action], updated: Dict[int, models.Action]
+) -> models.ActionWaitResult:
+    completed, errored, pending = [], [], []
+    for action in actions:
+        action = updated.get(action.id, action)
+        if action.status == IN_PROGRESS:
+            pending.append(action)
+        elif action.status == ERRORED:
+            errored.append(action)
+        else:
+            completed.append(action)
+    return models.ActionWaitResult(
+        completed=completed, errored=errored, pending=pending
+    )
+
+
+def _match_page(
+    res: Dict[str, Any],
+    wanted: Set[int],
+    oldest: int,
+    found: List[models.Action],
+    parse: Callable[..., models.Action],
+) -> bool:
+    # collect wanted actions of a listing page, True if no page is needed after it
+    page = res.get("actions") or []
+    for action in page:
+        if action["id"] in wanted:
+            found.append(parse(models.Action, action))
+            wanted.discard(action["id"])
+    next_page = ((res.get("links") or {}).get("pages") or {}).get("next")
+    return not wanted or not page or page[-1]["id"] < oldest or next_page is None
+
 
 class ActionsManager(BaseManager):
     endpoint = "actions"
     name = "actions"
 
+    # from this number of pending actions they are polled by listing actions
+    bulk_threshold = 20
+
     def all(self) -> List[models.Action]:
         res = self._client.request(endpoint="actions", method="get")
-        return [models.Action(**action) for action in res["actions"]]
+        return [self._parse(models.Action, action) for action in res["actions"]]
 
     def get(self, id: str) -> models.Action:
         res = self._client.request(
             endpoint="actions/{id}".format(id=id),
             method="get",
         )
-        return models.Action(**res["action"])
+        return self._parse(models.Action, res["action"])
+
+    def get_many(
+        self, ids: Iterable[str], max_workers: int = None
+    ) -> List[models.Action]:
+        res = self._client.fetch_many(
+            ["actions/{id}".format(id=id) for id in ids],
+            max_workers=max_workers,
+        )
+        return [self._parse(models.Action, item["action"]) for item in res]
+
+    def _poll(self, ids: List[int]) -> List[models.Action]:
+        if len(ids) < self.bulk_threshold:
+            return self.get_many([str(id) for id in ids])
+
+        # actions are listed from the newest one, a page at a time to stop
+        # without requesting the next one
+        wanted, oldest = set(ids), min(ids)
+        found: List[models.Action] = []
+        page = 1
+        while True:
+            res = self._client.request(
+                endpoint="actions", params={"page": page, "per_page": PER_PAGE}
+            )
+            if _match_page(res, wanted, oldest, found, self._parse):
+                break
+            page += 1
+        # actions which weren't found in the listing are polled by id
+        return found + self.get_many([str(id) for id in sorted(wanted)])
+
+    def wait(
+        self,
+        action: models.Action,
+        timeout: float = None,
+        interval: float = 1.0,
+        max_interval: float = 10.0,
+    ) -> models.Action:
+        result = self.wait_many(
+            [action], timeout=timeout, interval=interval, max_interval=max_interval
+        )
+        if result.pending:
+            raise TimeoutError(
+                "Action {id} is not completed in {timeout} seconds".format(
+                    id=action.id, timeout=timeout
+                )
+            )
+        return (result.completed + result.errored)[0]
+
+    def wait_many(
+        self,
+        actions: Iterable[models.Action],
+        timeout: float = None,
+        interval: float = 1.0,
+        max_interval: float = 10.0,
+    ) -> models.ActionWaitResult:
+        actions = list(actions)
+        deadline = None if timeout is None else time.monotonic() + timeout
+        updated: Dict[int, models.Action] = {}
+        pending = [action.id for action in actions if action.status == IN_PROGRESS]
+        delay = interval
+        while pending:
+            if deadline is not None:
+                left = deadline - time.monotonic()
+                if left <= 0:
+                    break
+                delay = min(delay, left)
+            time.sleep(delay)
+
+            for action in self._poll(pending):
+                updated[action.id] = action
+            still_pending = [
+                id
+                for id in pending
+                if id not in updated or updated[id].status == IN_PROGRESS
+            ]
+            # poll more often while actions are completing
+            if len(still_pending) < len(pending):
+                delay = interval
+            else:
+                delay = min(delay * 1.5, max_interval)
+            pending = still_pending
+        return _wait_result(actions, updated)
 
 
 class AsyncActionsManager(AsyncBaseManager):
     endpoint = "actions"
     name = "actions"
 
+    # from this number of pending actions they are polled by listing actions
+    bulk_threshold = 20
+
     async def all(self) -> List[models.Action]:
         res = await self._client.request(endpoint="actions", method="get")
-        return [models.Action(**action) for action in res["actions"]]
+        return [self._parse(models.Action, action) for action in res["actions"]]
 
     async def get(self, id: str) -> models.Action:
         res = await self._client.request(
             endpoint="actions/{id}".format(id=id),
             method="get",
         )
-        return models.Action(**res["action"])
+        return self._parse(models.Action, res["action"])
+
+    async def get_many(
+        self, ids: Iterable[str], concurrency: int = None
+    ) -> List[models.Action]:
+        res = await self._client.fetch_many(
+            ["actions/{id}".format(id=id) for id in ids],
+            concurrency=concurrency,
+        )
+        return [self._parse(models.Action, item["action"]) for item in res]
+
+    async def _poll(self, ids: List[int]) -> List[models.Action]:
+        if len(ids) < self.bulk_threshold:
+            return await self.get_many([str(id) for id in ids])
+
+        # actions are listed from the newest one, a page at a time to stop
+        # without requesting the next one
+        wanted, oldest = set(ids), min(ids)
+        found: List[models.Action] = []
+        page = 1
+        while True:
+            res = await self._client.request(
+                endpoint="actions", params={"page": page, "per_page": PER_PAGE}
+            )
+            if _match_page(res, wanted, oldest, found, self._parse):
+                break
+            page += 1
+        # actions which weren't found in the listing are polled by id
+        return found + await self.get_many([str(id) for id in sorted(wanted)])
+
+    async def wait(
+        self,
+        action: models.Action,
+        timeout: float = None,
+        interval: float = 1.0,
+        max_interval: float = 10.0,
+    ) -> models.Action:
+        result = await self.wait_many(
+            [action], timeout=timeout, interval=interval, max_interval=max_interval
+        )
+        if result.pending:
+            raise TimeoutError(
+                "Action {id} is not completed in {timeout} seconds".format(
+                    id=action.id, timeout=timeout
+                )
+            )
+        return (result.completed + result.errored)[0]
+
+    async def wait_many(
+        self,
+        actions: Iterable[models.Action],
+        timeout: float = None,
+        interval: float = 1.0,
+        max_interval: float = 10.0,
+    ) -> models.ActionWaitResult:
+        import asyncio
+
+        actions = list(actions)
+        deadline = None if timeout is None else time.monotonic() + timeout
+        updated: Dict[int, models.Action] = {}
+        pending = [action.id for action in actions if action.status == IN_PROGRESS]
+        delay = interval
+        while pending:
+            if deadline is not None:
+                left = deadline - time.monotonic()
+                if left <= 0:
+                    break
+                delay = min(delay, left)
+            await asyncio.sleep(delay)
+
+            for action in await self._poll(pending):
+                updated[action.id] = action
+            still_pending = [
+                id
+                for id in pending
+                if id not in updated or updated[id].status == IN_PROGRESS
+            ]
+            # poll more often while actions are completing
+            if len(still_pending) < len(pending):
+                delay = interval
+            else:
+                delay = min(delay * 1.5, max_interval)
+            pending = still_pending
+        return _wait_result(actions, updated)
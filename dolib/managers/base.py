@@ -1,4 +1,7 @@
+from typing import Any, Dict, Type
+
 from .. import client  # import Client
+from .. import models
 
 
 class AsyncBaseManager:
@@ -9,6 +12,20 @@ class AsyncBaseManager:
     def __init__(self, client: "client.AsyncClient") -> None:
         self._client = client
 
+    def _dump(self, model: models.BaseModel, **kwargs: Any) -> bytes:
+        return self._client.json_codec.dumps(model.dict(**kwargs))
+
+    def _parse(
+        self, model: Type[models.ModelT], data: Dict[str, Any], validate: bool = None
+    ) -> models.ModelT:
+        if validate is None:
+            validate = self._client.validate
+        if not validate:
+            return models.construct(model, data)
+        if self._client.lazy:
+            return models.lazy(model, data)
+        return model(**data)
+
 
 class BaseManager:
     name = "base"
@@ -17,3 +34,17 @@ class BaseManager:
 
     def __init__(self, client: "client.Client") -> None:
         self._client = client
+
+    def _dump(self, model: models.BaseModel, **kwargs: Any) -> bytes:
+        return self._client.json_codec.dumps(model.dict(**kwargs))
+
+    def _parse(
+        self, model: Type[models.ModelT], data: Dict[str, Any], validate: bool = None
+    ) -> models.ModelT:
+        if validate is None:
+            validate = self._client.validate
+        if not validate:
+            return models.construct(model, data)
+        if self._client.lazy:
+            return models.lazy(model, data)
+        return model(**data)
@@ -1,4 +1,4 @@
-from typing import List
+from typing import AsyncIterator, Iterable, Iterator, List
 
 from .. import models
 from .base import AsyncBaseManager, BaseManager
@@ -8,33 +8,53 @@ class CDNEndpointsManager(BaseManager):
     endpoint = "cdn_endpoints"
     name = "cdn_endpoints"
 
-    def all(self) -> List[models.CDNEndpoint]:
-        res = self._client.fetch_all(endpoint="cdn/endpoints", key="endpoints")
-        return [models.CDNEndpoint(**endpoint) for endpoint in res]
+    def all(
+        self, max_workers: int = None, validate: bool = None
+    ) -> List[models.CDNEndpoint]:
+        res = self._client.fetch_all(
+            endpoint="cdn/endpoints", key="endpoints", max_workers=max_workers
+        )
+        return [self._parse(models.CDNEndpoint, endpoint, validate) for endpoint in res]
+
+    def iter_all(self, validate: bool = None) -> Iterator[models.CDNEndpoint]:
+        for page in self._client.iter_pages(endpoint="cdn/endpoints", key="endpoints"):
+            for endpoint in page:
+                yield self._parse(models.CDNEndpoint, endpoint, validate)
 
     def get(self, id: str) -> models.CDNEndpoint:
         res = self._client.request(
             endpoint="cdn/endpoints/{id}".format(id=id), method="get"
         )
-        return models.CDNEndpoint(**res["endpoint"])
+        return self._parse(models.CDNEndpoint, res["endpoint"])
+
+    def get_many(
+        self, ids: Iterable[str], max_workers: int = None
+    ) -> List[models.CDNEndpoint]:
+        res = self._client.fetch_many(
+            ["cdn/endpoints/{id}".format(id=id) for id in ids],
+            max_workers=max_workers,
+        )
+        return [self._parse(models.CDNEndpoint, item["endpoint"]) for item in res]
 
     def create(self, endpoint: models.CDNEndpoint) -> models.CDNEndpoint:
         res = self._client.request(
             endpoint="cdn/endpoints",
             method="post",
-            data=endpoint.json(
-                include={"origin", "ttl", "certificate_id", "custom_domain"}
+            data=self._dump(
+                endpoint, include={"origin", "ttl", "certificate_id", "custom_domain"}
             ),
         )
-        return models.CDNEndpoint(**res["endpoint"])
+        return self._parse(models.CDNEndpoint, res["endpoint"])
 
     def update(self, endpoint: models.CDNEndpoint) -> models.CDNEndpoint:
         res = self._client.request(
             endpoint="cdn/endpoints/{id}".format(id=endpoint.id),
             method="put",
-            data=endpoint.json(include={"ttl", "certificate_id", "custom_domain"}),
+            data=self._dump(
+                endpoint, include={"ttl", "certificate_id", "custom_domain"}
+            ),
         )
-        return models.CDNEndpoint(**res["endpoint"])
+        return self._parse(models.CDNEndpoint, res["endpoint"])
 
     def delete(self, endpoint: models.CDNEndpoint) -> None:
         self._client.request(
@@ -56,33 +76,53 @@ class AsyncCDNEndpointsManager(AsyncBaseManager):
     endpoint = "cdn_endpoints"
     name = "cdn_endpoints"
 
-    async def all(self) -> List[models.CDNEndpoint]:
+    async def all(self, validate: bool = None) -> List[models.CDNEndpoint]:
         res = await self._client.fetch_all(endpoint="cdn/endpoints", key="endpoints")
-        return [models.CDNEndpoint(**endpoint) for endpoint in res]
+        return [self._parse(models.CDNEndpoint, endpoint, validate) for endpoint in res]
+
+    async def iter_all(
+        self, validate: bool = None
+    ) -> AsyncIterator[models.CDNEndpoint]:
+        async for page in self._client.iter_pages(
+            endpoint="cdn/endpoints", key="endpoints"
+        ):
+            for endpoint in page:
+                yield self._parse(models.CDNEndpoint, endpoint, validate)
 
     async def get(self, id: str) -> models.CDNEndpoint:
         res = await self._client.request(
             endpoint="cdn/endpoints/{id}".format(id=id), method="get"
         )
-        return models.CDNEndpoint(**res["endpoint"])
+        return self._parse(models.CDNEndpoint, res["endpoint"])
+
+    async def get_many(
+        self, ids: Iterable[str], concurrency: int = None
+    ) -> List[models.CDNEndpoint]:
+        res = await self._client.fetch_many(
+            ["cdn/endpoints/{id}".format(id=id) for id in ids],
+            concurrency=concurrency,
+        )
+        return [self._parse(models.CDNEndpoint, item["endpoint"]) for item in res]
 
     async def create(self, endpoint: models.CDNEndpoint) -> models.CDNEndpoint:
         res = await self._client.request(
             endpoint="cdn/endpoints",
             method="post",
-            data=endpoint.json(
-                include={"origin", "ttl", "certificate_id", "custom_domain"}
+            data=self._dump(
+                endpoint, include={"origin", "ttl", "certificate_id", "custom_domain"}
             ),
         )
-        return models.CDNEndpoint(**res["endpoint"])
+        return self._parse(models.CDNEndpoint, res["endpoint"])
 
     async def update(self, endpoint: models.CDNEndpoint) -> models.CDNEndpoint:
         res = await self._client.request(
             endpoint="cdn/endpoints/{id}".format(id=endpoint.id),
             method="put",
-            data=endpoint.json(include={"ttl", "certificate_id", "custom_domain"}),
+            data=self._dump(
+                endpoint, include={"ttl", "certificate_id", "custom_domain"}
+            ),
         )
-        return models.CDNEndpoint(**res["endpoint"])
+        return self._parse(models.CDNEndpoint, res["endpoint"])
 
     async def delete(self, endpoint: models.CDNEndpoint) -> None:
         await self._client.request(
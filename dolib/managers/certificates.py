@@ -1,4 +1,4 @@
-from typing import List
+from typing import AsyncIterator, Iterable, Iterator, List
 
 from .. import models
 from .base import AsyncBaseManager, BaseManager
@@ -8,21 +8,45 @@ class CertificatesManager(BaseManager):
     endpoint = "certificates"
     name = "certificates"
 
-    def all(self) -> List[models.Certificate]:
-        res = self._client.fetch_all(endpoint="certificates", key="certificates")
-        return [models.Certificate(**certificate) for certificate in res]
+    def all(
+        self, max_workers: int = None, validate: bool = None
+    ) -> List[models.Certificate]:
+        res = self._client.fetch_all(
+            endpoint="certificates", key="certificates", max_workers=max_workers
+        )
+        return [
+            self._parse(models.Certificate, certificate, validate)
+            for certificate in res
+        ]
+
+    def iter_all(self, validate: bool = None) -> Iterator[models.Certificate]:
+        for page in self._client.iter_pages(
+            endpoint="certificates", key="certificates"
+        ):
+            for certificate in page:
+                yield self._parse(models.Certificate, certificate, validate)
 
     def get(self, id: str) -> models.Certificate:
         res = self._client.request(
             endpoint="certificates/{id}".format(id=id), method="get"
         )
-        return models.Certificate(**res["certificate"])
+        return self._parse(models.Certificate, res["certificate"])
+
+    def get_many(
+        self, ids: Iterable[str], max_workers: int = None
+    ) -> List[models.Certificate]:
+        res = self._client.fetch_many(
+            ["certificates/{id}".format(id=id) for id in ids],
+            max_workers=max_workers,
+        )
+        return [self._parse(models.Certificate, item["certificate"]) for item in res]
 
     def create(self, certificate: models.Certificate) -> models.Certificate:
         res = self._client.request(
             endpoint="certificates",
             method="post",
-            data=certificate.json(
+            data=self._dump(
+                certificate,
                 include={
                     "name",
                     "private_key",
@@ -30,10 +54,10 @@ class CertificatesManager(BaseManager):
                     "certificate_chain",
                     "dns_names",
                     "type",
-                }
+                },
             ),
         )
-        return models.Certificate(**res["certificate"])
+        return self._parse(models.Certificate, res["certificate"])
 
     def delete(self, certificate: models.Certificate) -> None:
         self._client.request(
@@ -45,21 +69,43 @@ class AsyncCertificatesManager(AsyncBaseManager):
     endpoint = "certificates"
     name = "certificates"
 
-    async def all(self) -> List[models.Certificate]:
+    async def all(self, validate: bool = None) -> List[models.Certificate]:
         res = await self._client.fetch_all(endpoint="certificates", key="certificates")
-        return [models.Certificate(**certificate) for certificate in res]
+        return [
+            self._parse(models.Certificate, certificate, validate)
+            for certificate in res
+        ]
+
+    async def iter_all(
+        self, validate: bool = None
+    ) -> AsyncIterator[models.Certificate]:
+        async for page in self._client.iter_pages(
+            endpoint="certificates", key="certificates"
+        ):
+            for certificate in page:
+                yield self._parse(models.Certificate, certificate, validate)
 
     async def get(self, id: str) -> models.Certificate:
         res = await self._client.request(
             endpoint="certificates/{id}".format(id=id), method="get"
         )
-        return models.Certificate(**res["certificate"])
+        return self._parse(models.Certificate, res["certificate"])
+
+    async def get_many(
+        self, ids: Iterable[str], concurrency: int = None
+    ) -> List[models.Certificate]:
+        res = await self._client.fetch_many(
+            ["certificates/{id}".format(id=id) for id in ids],
+            concurrency=concurrency,
+        )
+        return [self._parse(models.Certificate, item["certificate"]) for item in res]
 
     async def create(self, certificate: models.Certificate) -> models.Certificate:
         res = await self._client.request(
             endpoint="certificates",
             method="post",
-            data=certificate.json(
+            data=self._dump(
+                certificate,
                 include={
                     "name",
                     "private_key",
@@ -67,10 +113,10 @@ class AsyncCertificatesManager(AsyncBaseManager):
                     "certificate_chain",
                     "dns_names",
                     "type",
-                }
+                },
             ),
         )
-        return models.Certificate(**res["certificate"])
+        return self._parse(models.Certificate, res["certificate"])
 
     async def delete(self, certificate: models.Certificate) -> None:
         await self._client.request(
@@ -1,4 +1,4 @@
-from typing import List
+from typing import AsyncIterator, Iterable, Iterator, List
 
 from .. import models
 from .base import AsyncBaseManager, BaseManager
@@ -8,11 +8,22 @@ class DatabasesManager(BaseManager):
     endpoint = "databases"
     name = "databases"
 
-    def all(self) -> List[models.DBCluster]:
-        res = self._client.fetch_all(endpoint="databases", key="databases")
-        return [models.DBCluster(**db) for db in res]
+    def all(
+        self, max_workers: int = None, validate: bool = None
+    ) -> List[models.DBCluster]:
+        res = self._client.fetch_all(
+            endpoint="databases", key="databases", max_workers=max_workers
+        )
+        return [self._parse(models.DBCluster, db, validate) for db in res]
+
+    def iter_all(self, validate: bool = None) -> Iterator[models.DBCluster]:
+        for page in self._client.iter_pages(endpoint="databases", key="databases"):
+            for db in page:
+                yield self._parse(models.DBCluster, db, validate)
 
-    def filter(self, tag_name: str = None) -> List[models.DBCluster]:
+    def filter(
+        self, tag_name: str = None, max_workers: int = None, validate: bool = None
+    ) -> List[models.DBCluster]:
         params = {}
         if tag_name is not None:
             params["tag_name"] = tag_name
@@ -20,20 +31,31 @@ class DatabasesManager(BaseManager):
             endpoint="databases",
             key="databases",
             params=params,
+            max_workers=max_workers,
         )
-        return [models.DBCluster(**db) for db in res]
+        return [self._parse(models.DBCluster, db, validate) for db in res]
 
     def get(self, id: str) -> models.DBCluster:
         res = self._client.request(
             endpoint="databases/{id}".format(id=id), method="get"
         )
-        return models.DBCluster(**res["database"])
+        return self._parse(models.DBCluster, res["database"])
+
+    def get_many(
+        self, ids: Iterable[str], max_workers: int = None
+    ) -> List[models.DBCluster]:
+        res = self._client.fetch_many(
+            ["databases/{id}".format(id=id) for id in ids],
+            max_workers=max_workers,
+        )
+        return [self._parse(models.DBCluster, item["database"]) for item in res]
 
     def create(self, database: models.DBCluster) -> models.DBCluster:
         res = self._client.request(
             endpoint="databases",
             method="post",
-            data=database.json(
+            data=self._dump(
+                database,
                 include={
                     "name",
                     "engine",
@@ -43,10 +65,10 @@ class DatabasesManager(BaseManager):
                     "num_nodes",
                     "tags",
                     "private_network_uuid",
-                }
+                },
             ),
         )
-        return models.DBCluster(**res["database"])
+        return self._parse(models.DBCluster, res["database"])
 
     def delete(self, database: models.DBCluster) -> None:
         self._client.request(
@@ -58,24 +80,25 @@ class DatabasesManager(BaseManager):
             endpoint="databases/{id}/replicas".format(id=id),
             key="replicas",
         )
-        return [models.DBReplica(**replica) for replica in res]
+        return [self._parse(models.DBReplica, replica) for replica in res]
 
     def add_replica(self, id: str, replica: models.DBReplica) -> models.DBReplica:
         res = self._client.request(
             endpoint="databases/{id}/replicas".format(id=id),
             method="post",
-            data=replica.json(
-                include={"name", "region", "size", "tags", "private_network_uuid"}
+            data=self._dump(
+                replica,
+                include={"name", "region", "size", "tags", "private_network_uuid"},
             ),
         )
-        return models.DBReplica(**res["replica"])
+        return self._parse(models.DBReplica, res["replica"])
 
     def get_replica(self, id: str, name: str) -> models.DBReplica:
         res = self._client.request(
             endpoint="databases/{id}/replicas/{name}".format(id=id, name=name),
             method="get",
         )
-        return models.DBReplica(**res["replica"])
+        return self._parse(models.DBReplica, res["replica"])
 
     def delete_replica(self, id: str, replica: models.DBReplica) -> None:
         self._client.request(
@@ -88,22 +111,22 @@ class DatabasesManager(BaseManager):
             endpoint="databases/{id}/users".format(id=id),
             key="users",
         )
-        return [models.DBCluster.User(**user) for user in res]
+        return [self._parse(models.DBCluster.User, user) for user in res]
 
     def add_user(self, id: str, user: models.DBCluster.User) -> models.DBCluster.User:
         res = self._client.request(
             endpoint="databases/{id}/users".format(id=id),
             method="post",
-            data=user.json(include={"name", "mysql_settings"}),
+            data=self._dump(user, include={"name", "mysql_settings"}),
         )
-        return models.DBCluster.User(**res["user"])
+        return self._parse(models.DBCluster.User, res["user"])
 
     def get_user(self, id: str, name: str) -> models.DBCluster.User:
         res = self._client.request(
             endpoint="databases/{id}/users/{name}".format(id=id, name=name),
             method="get",
         )
-        return models.DBCluster.User(**res["user"])
+        return self._parse(models.DBCluster.User, res["user"])
 
     def delete_user(self, id: str, user: models.DBCluster.User) -> None:
         self._client.request(
@@ -116,19 +139,21 @@ class DatabasesManager(BaseManager):
             endpoint="databases/{id}/dbs".format(id=id),
             key="dbs",
         )
-        return [models.DBCluster.DB(**db) for db in res]
+        return [self._parse(models.DBCluster.DB, db) for db in res]
 
     def add_db(self, id: str, db: models.DBCluster.DB) -> models.DBCluster.DB:
         res = self._client.request(
-            endpoint="databases/{id}/dbs".format(id=id), method="post", data=db.json()
+            endpoint="databases/{id}/dbs".format(id=id),
+            method="post",
+            data=self._dump(db),
         )
-        return models.DBCluster.DB(**res["db"])
+        return self._parse(models.DBCluster.DB, res["db"])
 
     def get_db(self, id: str, name: str) -> models.DBCluster.DB:
         res = self._client.request(
             endpoint="databases/{id}/dbs/{name}".format(id=id, name=name), method="get"
         )
-        return models.DBCluster.DB(**res["db"])
+        return self._parse(models.DBCluster.DB, res["db"])
 
     def delete_db(self, id: str, db: models.DBCluster.DB) -> None:
         self._client.request(
@@ -156,11 +181,20 @@ class AsyncDatabasesManager(AsyncBaseManager):
     endpoint = "databases"
     name = "databases"
 
-    async def all(self) -> List[models.DBCluster]:
+    async def all(self, validate: bool = None) -> List[models.DBCluster]:
         res = await self._client.fetch_all(endpoint="databases", key="databases")
-        return [models.DBCluster(**db) for db in res]
-
-    async def filter(self, tag_name: str = None) -> List[models.DBCluster]:
+        return [self._parse(models.DBCluster, db, validate) for db in res]
+
+    async def iter_all(self, validate: bool = None) -> AsyncIterator[models.DBCluster]:
+        async for page in self._client.iter_pages(
+            endpoint="databases", key="databases"
+        ):
+            for db in page:
+                yield self._parse(models.DBCluster, db, validate)
+
+    async def filter(
+        self, tag_name: str = None, validate: bool = None
+    ) -> List[models.DBCluster]:
         params = {}
         if tag_name is not None:
             params["tag_name"] = tag_name
@@ -169,19 +203,29 @@ class AsyncDatabasesManager(AsyncBaseManager):
             key="databases",
             params=params,
         )
-        return [models.DBCluster(**db) for db in res]
+        return [self._parse(models.DBCluster, db, validate) for db in res]
 
     async def get(self, id: str) -> models.DBCluster:
         res = await self._client.request(
             endpoint="databases/{id}".format(id=id), method="get"
         )
-        return models.DBCluster(**res["database"])
+        return self._parse(models.DBCluster, res["database"])
+
+    async def get_many(
+        self, ids: Iterable[str], concurrency: int = None
+    ) -> List[models.DBCluster]:
+        res = await self._client.fetch_many(
+            ["databases/{id}".format(id=id) for id in ids],
+            concurrency=concurrency,
+        )
+        return [self._parse(models.DBCluster, item["database"]) for item in res]
 
     async def create(self, database: models.DBCluster) -> models.DBCluster:
         res = await self._client.request(
             endpoint="databases",
             method="post",
-            data=database.json(
+            data=self._dump(
+                database,
                 include={
                     "name",
                     "engine",
@@ -191,10 +235,10 @@ class AsyncDatabasesManager(AsyncBaseManager):
                     "num_nodes",
                     "tags",
                     "private_network_uuid",
-                }
+                },
             ),
         )
-        return models.DBCluster(**res["database"])
+        return self._parse(models.DBCluster, res["database"])
 
     async def delete(self, database: models.DBCluster) -> None:
         await self._client.request(
@@ -206,24 +250,25 @@ class AsyncDatabasesManager(AsyncBaseManager):
             endpoint="databases/{id}/replicas".format(id=id),
             key="replicas",
         )
-        return [models.DBReplica(**replica) for replica in res]
+        return [self._parse(models.DBReplica, replica) for replica in res]
 
     async def add_replica(self, id: str, replica: models.DBReplica) -> models.DBReplica:
         res = await self._client.request(
             endpoint="databases/{id}/replicas".format(id=id),
             method="post",
-            data=replica.json(
-                include={"name", "region", "size", "tags", "private_network_uuid"}
+            data=self._dump(
+                replica,
+                include={"name", "region", "size", "tags", "private_network_uuid"},
             ),
         )
-        return models.DBReplica(**res["replica"])
+        return self._parse(models.DBReplica, res["replica"])
 
     async def get_replica(self, id: str, name: str) -> models.DBReplica:
         res = await self._client.request(
             endpoint="databases/{id}/replicas/{name}".format(id=id, name=name),
             method="get",
         )
-        return models.DBReplica(**res["replica"])
+        return self._parse(models.DBReplica, res["replica"])
 
     async def delete_replica(self, id: str, replica: models.DBReplica) -> None:
         await self._client.request(
@@ -236,7 +281,7 @@ class AsyncDatabasesManager(AsyncBaseManager):
             endpoint="databases/{id}/users".format(id=id),
             key="users",
         )
-        return [models.DBCluster.User(**user) for user in res]
+        return [self._parse(models.DBCluster.User, user) for user in res]
 
     async def add_user(
         self, id: str, user: models.DBCluster.User
@@ -244,16 +289,16 @@ class AsyncDatabasesManager(AsyncBaseManager):
         res = await self._client.request(
             endpoint="databases/{id}/users".format(id=id),
             method="post",
-            data=user.json(include={"name", "mysql_settings"}),
+            data=self._dump(user, include={"name", "mysql_settings"}),
         )
-        return models.DBCluster.User(**res["user"])
+        return self._parse(models.DBCluster.User, res["user"])
 
     async def get_user(self, id: str, name: str) -> models.DBCluster.User:
         res = await self._client.request(
             endpoint="databases/{id}/users/{name}".format(id=id, name=name),
             method="get",
         )
-        return models.DBCluster.User(**res["user"])
+        return self._parse(models.DBCluster.User, res["user"])
 
     async def delete_user(self, id: str, user: models.DBCluster.User) -> None:
         await self._client.request(
@@ -266,19 +311,21 @@ class AsyncDatabasesManager(AsyncBaseManager):
             endpoint="databases/{id}/dbs".format(id=id),
             key="dbs",
         )
-        return [models.DBCluster.DB(**db) for db in res]
+        return [self._parse(models.DBCluster.DB, db) for db in res]
 
     async def add_db(self, id: str, db: models.DBCluster.DB) -> models.DBCluster.DB:
         res = await self._client.request(
-            endpoint="databases/{id}/dbs".format(id=id), method="post", data=db.json()
+            endpoint="databases/{id}/dbs".format(id=id),
+            method="post",
+            data=self._dump(db),
         )
-        return models.DBCluster.DB(**res["db"])
+        return self._parse(models.DBCluster.DB, res["db"])
 
     async def get_db(self, id: str, name: str) -> models.DBCluster.DB:
         res = await self._client.request(
             endpoint="databases/{id}/dbs/{name}".format(id=id, name=name), method="get"
         )
-        return models.DBCluster.DB(**res["db"])
+        return self._parse(models.DBCluster.DB, res["db"])
 
     async def delete_db(self, id: str, db: models.DBCluster.DB) -> None:
         await self._client.request(
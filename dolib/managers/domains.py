@@ -1,30 +1,169 @@
-from typing import List
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import (
+    AsyncIterator,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    TextIO,
+    Tuple,
+)
 
-from .. import models
+import httpx
+
+from .. import models, zonefile
+from ..client import MANY_CONCURRENCY
 from .base import AsyncBaseManager, BaseManager
 
+# records managed by DigitalOcean, left alone by sync
+SYNC_IGNORED_TYPES = ("SOA", "NS")
+# record fields compared by sync when set in the desired record
+SYNC_FIELDS = ("priority", "port", "ttl", "weight", "flags", "tag")
+# types with a hostname in data, "mail.example.com." equals "mail.example.com"
+HOSTNAME_TYPES = {"CNAME", "MX", "NS", "SRV"}
+
+RecordKey = Tuple[str, str, str]
+
+
+def _record_key(record: models.Domain.Record) -> RecordKey:
+    type = record.type.upper()
+    data = record.data or ""
+    if type in HOSTNAME_TYPES:
+        data = data.rstrip(".")
+    return type, record.name or "@", data
+
+
+def _needs_update(current: models.Domain.Record, desired: models.Domain.Record) -> bool:
+    return any(
+        getattr(desired, field) is not None
+        and getattr(desired, field) != getattr(current, field)
+        for field in SYNC_FIELDS
+    )
+
+
+def _plan_sync(
+    current: Iterable[models.Domain.Record],
+    desired: Iterable[models.Domain.Record],
+    ignore_types: Iterable[str],
+) -> Tuple[
+    List[models.Domain.Record],
+    List[models.DomainSyncResult.Update],
+    List[models.Domain.Record],
+    int,
+]:
+    ignored = {type.upper() for type in ignore_types}
+    # existing records by (type, name, data), duplicates are kept in order
+    existing: Dict[RecordKey, List[models.Domain.Record]] = {}
+    for record in current:
+        if record.type.upper() not in ignored:
+            existing.setdefault(_record_key(record), []).append(record)
+
+    update = []
+    unmatched = []
+    unchanged = 0
+    for index, record in enumerate(desired):
+        if record.type.upper() in ignored:
+            continue
+        matches = existing.get(_record_key(record))
+        if not matches:
+            unmatched.append((index, record))
+            continue
+        before = matches.pop(0)
+        if _needs_update(before, record):
+            update.append((index, before, record))
+        else:
+            unchanged += 1
+
+    # a record whose data changed is updated in place instead of recreated
+    leftover: Dict[Tuple[str, str], List[models.Domain.Record]] = {}
+    for records in existing.values():
+        for record in records:
+            leftover.setdefault(_record_key(record)[:2], []).append(record)
+    create = []
+    for index, record in unmatched:
+        candidates = leftover.get(_record_key(record)[:2])
+        if candidates:
+            update.append((index, candidates.pop(0), record))
+        else:
+            create.append(record)
+    delete = [record for records in leftover.values() for record in records]
+    # updates in order of desired records
+    update.sort(key=lambda change: change[0])
+
+    return (
+        create,
+        [
+            # fields the desired record leaves unset keep their current value
+            models.DomainSyncResult.Update(
+                before=before,
+                after=before.copy(
+                    update=dict(after.dict(exclude_none=True), id=before.id)
+                ),
+            )
+            for _, before, after in update
+        ],
+        delete,
+        unchanged,
+    )
+
+
+def _sync_error(
+    action: str, record: models.Domain.Record, exc: httpx.HTTPError
+) -> models.DomainSyncResult.Error:
+    status_code = None
+    message = str(exc)
+    if isinstance(exc, httpx.HTTPStatusError):
+        status_code = exc.response.status_code
+        try:
+            message = exc.response.json()["message"]
+        except (ValueError, KeyError, TypeError):
+            pass
+    return models.DomainSyncResult.Error(
+        action=action, record=record, message=message, status_code=status_code
+    )
+
 
 class DomainsManager(BaseManager):
     endpoint = "domains"
     name = "domains"
 
-    def all(self) -> List[models.Domain]:
-        res = self._client.fetch_all(endpoint="domains", key="domains")
-        return [models.Domain(**domain) for domain in res]
+    def all(
+        self, max_workers: int = None, validate: bool = None
+    ) -> List[models.Domain]:
+        res = self._client.fetch_all(
+            endpoint="domains", key="domains", max_workers=max_workers
+        )
+        return [self._parse(models.Domain, domain, validate) for domain in res]
+
+    def iter_all(self, validate: bool = None) -> Iterator[models.Domain]:
+        for page in self._client.iter_pages(endpoint="domains", key="domains"):
+            for domain in page:
+                yield self._parse(models.Domain, domain, validate)
 
     def get(self, name: str) -> models.Domain:
         res = self._client.request(
             endpoint="domains/{name}".format(name=name), method="get"
         )
-        return models.Domain(**res["domain"])
+        return self._parse(models.Domain, res["domain"])
+
+    def get_many(
+        self, names: Iterable[str], max_workers: int = None
+    ) -> List[models.Domain]:
+        res = self._client.fetch_many(
+            ["domains/{name}".format(name=name) for name in names],
+            max_workers=max_workers,
+        )
+        return [self._parse(models.Domain, item["domain"]) for item in res]
 
     def create(self, domain: models.Domain) -> models.Domain:
         res = self._client.request(
             endpoint="domains",
             method="post",
-            data=domain.json(include={"name"}),
+            data=self._dump(domain, include={"name"}),
         )
-        return models.Domain(**res["domain"])
+        return self._parse(models.Domain, res["domain"])
 
     def delete(self, domain: models.Domain) -> None:
         self._client.request(
@@ -32,7 +171,11 @@ class DomainsManager(BaseManager):
         )
 
     def records(
-        self, name: str, record_name: str = None, record_type: str = None
+        self,
+        name: str,
+        record_name: str = None,
+        record_type: str = None,
+        validate: bool = None,
     ) -> List[models.Domain.Record]:
         params = {}
         if record_name is not None:
@@ -44,7 +187,27 @@ class DomainsManager(BaseManager):
             key="domain_records",
             params=params,
         )
-        return [models.Domain.Record(**record) for record in res]
+        return [self._parse(models.Domain.Record, record, validate) for record in res]
+
+    def iter_records(
+        self,
+        name: str,
+        record_name: str = None,
+        record_type: str = None,
+        validate: bool = None,
+    ) -> Iterator[models.Domain.Record]:
+        params = {}
+        if record_name is not None:
+            params["name"] = record_name
+        if record_type is not None:
+            params["type"] = record_type
+        for page in self._client.iter_pages(
+            endpoint="domains/{name}/records".format(name=name),
+            key="domain_records",
+            params=params,
+        ):
+            for record in page:
+                yield self._parse(models.Domain.Record, record, validate)
 
     def create_record(
         self, name: str, record: models.Domain.Record
@@ -52,9 +215,9 @@ class DomainsManager(BaseManager):
         res = self._client.request(
             endpoint="domains/{name}/records".format(name=name),
             method="post",
-            data=record.json(),
+            data=self._dump(record),
         )
-        return models.Domain.Record(**res["domain_record"])
+        return self._parse(models.Domain.Record, res["domain_record"])
 
     def update_record(
         self, name: str, record: models.Domain.Record
@@ -64,9 +227,9 @@ class DomainsManager(BaseManager):
                 name=name, record_id=record.id
             ),
             method="put",
-            data=record.json(),
+            data=self._dump(record),
         )
-        return models.Domain.Record(**res["domain_record"])
+        return self._parse(models.Domain.Record, res["domain_record"])
 
     def delete_record(self, name: str, record: models.Domain.Record) -> None:
         self._client.request(
@@ -74,7 +237,64 @@ class DomainsManager(BaseManager):
                 name=name, record_id=record.id
             ),
             method="delete",
-            data=record.json(),
+            data=self._dump(record),
+        )
+
+    def export_zone(self, name: str, file: TextIO, ttl: int = None) -> int:
+        # write records to a zone file page by page, returns their number
+        return zonefile.write(
+            self.iter_records(name, validate=False), file, origin=name, ttl=ttl
+        )
+
+    def sync(
+        self,
+        name: str,
+        records: Iterable[models.Domain.Record],
+        dry_run: bool = False,
+        concurrency: int = None,
+        ignore_types: Iterable[str] = SYNC_IGNORED_TYPES,
+    ) -> models.DomainSyncResult:
+        # make records of the domain equal to records with the fewest requests
+        create, update, delete, unchanged = _plan_sync(
+            self.records(name), records, ignore_types
+        )
+        errors: List[models.DomainSyncResult.Error] = []
+        if concurrency is None:
+            concurrency = MANY_CONCURRENCY
+        if not dry_run:
+
+            def run(
+                action: str, record: models.Domain.Record
+            ) -> Optional[models.DomainSyncResult.Error]:
+                try:
+                    if action == "delete":
+                        self.delete_record(name, record)
+                    elif action == "update":
+                        self.update_record(name, record)
+                    else:
+                        self.create_record(name, record)
+                except httpx.HTTPError as exc:
+                    return _sync_error(action, record, exc)
+                return None
+
+            # deletes first, e.g. an A record is replaced by a CNAME
+            with ThreadPoolExecutor(max_workers=concurrency) as executor:
+                for action, changes in (
+                    ("delete", delete),
+                    ("update", [change.after for change in update]),
+                    ("create", create),
+                ):
+                    for error in executor.map(partial(run, action), changes):
+                        if error is not None:
+                            errors.append(error)
+
+        return models.DomainSyncResult(
+            create=create,
+            update=update,
+            delete=delete,
+            unchanged=unchanged,
+            dry_run=dry_run,
+            errors=errors,
         )
 
 
@@ -82,23 +302,37 @@ class AsyncDomainsManager(AsyncBaseManager):
     endpoint = "domains"
     name = "domains"
 
-    async def all(self) -> List[models.Domain]:
+    async def all(self, validate: bool = None) -> List[models.Domain]:
         res = await self._client.fetch_all(endpoint="domains", key="domains")
-        return [models.Domain(**domain) for domain in res]
+        return [self._parse(models.Domain, domain, validate) for domain in res]
+
+    async def iter_all(self, validate: bool = None) -> AsyncIterator[models.Domain]:
+        async for page in self._client.iter_pages(endpoint="domains", key="domains"):
+            for domain in page:
+                yield self._parse(models.Domain, domain, validate)
 
     async def get(self, name: str) -> models.Domain:
         res = await self._client.request(
             endpoint="domains/{name}".format(name=name), method="get"
         )
-        return models.Domain(**res["domain"])
+        return self._parse(models.Domain, res["domain"])
+
+    async def get_many(
+        self, names: Iterable[str], concurrency: int = None
+    ) -> List[models.Domain]:
+        res = await self._client.fetch_many(
+            ["domains/{name}".format(name=name) for name in names],
+            concurrency=concurrency,
+        )
+        return [self._parse(models.Domain, item["domain"]) for item in res]
 
     async def create(self, domain: models.Domain) -> models.Domain:
         res = await self._client.request(
             endpoint="domains",
             method="post",
-            data=domain.json(include={"name"}),
+            data=self._dump(domain, include={"name"}),
         )
-        return models.Domain(**res["domain"])
+        return self._parse(models.Domain, res["domain"])
 
     async def delete(self, domain: models.Domain) -> None:
         await self._client.request(
@@ -106,7 +340,11 @@ class AsyncDomainsManager(AsyncBaseManager):
         )
 
     async def records(
-        self, name: str, record_name: str = None, record_type: str = None
+        self,
+        name: str,
+        record_name: str = None,
+        record_type: str = None,
+        validate: bool = None,
     ) -> List[models.Domain.Record]:
         params = {}
         if record_name is not None:
@@ -118,7 +356,27 @@ class AsyncDomainsManager(AsyncBaseManager):
             key="domain_records",
             params=params,
         )
-        return [models.Domain.Record(**record) for record in res]
+        return [self._parse(models.Domain.Record, record, validate) for record in res]
+
+    async def iter_records(
+        self,
+        name: str,
+        record_name: str = None,
+        record_type: str = None,
+        validate: bool = None,
+    ) -> AsyncIterator[models.Domain.Record]:
+        params = {}
+        if record_name is not None:
+            params["name"] = record_name
+        if record_type is not None:
+            params["type"] = record_type
+        async for page in self._client.iter_pages(
+            endpoint="domains/{name}/records".format(name=name),
+            key="domain_records",
+            params=params,
+        ):
+            for record in page:
+                yield self._parse(models.Domain.Record, record, validate)
 
     async def create_record(
         self, name: str, record: models.Domain.Record
@@ -126,9 +384,9 @@ class AsyncDomainsManager(AsyncBaseManager):
         res = await self._client.request(
             endpoint="domains/{name}/records".format(name=name),
             method="post",
-            data=record.json(),
+            data=self._dump(record),
         )
-        return models.Domain.Record(**res["domain_record"])
+        return self._parse(models.Domain.Record, res["domain_record"])
 
     async def update_record(
         self, name: str, record: models.Domain.Record
@@ -138,9 +396,9 @@ class AsyncDomainsManager(AsyncBaseManager):
                 name=name, record_id=record.id
             ),
             method="put",
-            data=record.json(),
+            data=self._dump(record),
         )
-        return models.Domain.Record(**res["domain_record"])
+        return self._parse(models.Domain.Record, res["domain_record"])
 
     async def delete_record(self, name: str, record: models.Domain.Record) -> None:
         await self._client.request(
@@ -148,5 +406,64 @@ class AsyncDomainsManager(AsyncBaseManager):
                 name=name, record_id=record.id
             ),
             method="delete",
-            data=record.json(),
+            data=self._dump(record),
+        )
+
+    async def export_zone(self, name: str, file: TextIO, ttl: int = None) -> int:
+        zonefile.write_header(file, origin=name, ttl=ttl)
+        count = 0
+        async for record in self.iter_records(name, validate=False):
+            zonefile.write_record(file, record)
+            count += 1
+        return count
+
+    async def sync(
+        self,
+        name: str,
+        records: Iterable[models.Domain.Record],
+        dry_run: bool = False,
+        concurrency: int = None,
+        ignore_types: Iterable[str] = SYNC_IGNORED_TYPES,
+    ) -> models.DomainSyncResult:
+        create, update, delete, unchanged = _plan_sync(
+            await self.records(name), records, ignore_types
+        )
+        errors: List[models.DomainSyncResult.Error] = []
+        if concurrency is None:
+            concurrency = MANY_CONCURRENCY
+        if not dry_run:
+            import asyncio
+
+            semaphore = asyncio.Semaphore(concurrency)
+
+            async def run(
+                action: str, record: models.Domain.Record
+            ) -> Optional[models.DomainSyncResult.Error]:
+                try:
+                    async with semaphore:
+                        if action == "delete":
+                            await self.delete_record(name, record)
+                        elif action == "update":
+                            await self.update_record(name, record)
+                        else:
+                            await self.create_record(name, record)
+                except httpx.HTTPError as exc:
+                    return _sync_error(action, record, exc)
+                return None
+
+            for action, changes in (
+                ("delete", delete),
+                ("update", [change.after for change in update]),
+                ("create", create),
+            ):
+                results = await asyncio.gather(*[run(action, c) for c in changes])
+                errors += [error for error in results if error is not None]
+
+        return models.DomainSyncResult(
+            create=create,
+            update=update,
+            delete=delete,
+            unchanged=unchanged,
+            dry_run=dry_run,
+            errors=errors,
         )
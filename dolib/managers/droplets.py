@@ -1,18 +1,62 @@
-from typing import Any, Dict, List, Union
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncIterator, Dict, Iterable, Iterator, List, Union
+
+import httpx
 
 from .. import models
+from ..client import MANY_CONCURRENCY
+from ..table import DropletTable
 from .base import AsyncBaseManager, BaseManager
 
 
+def _bulk_error(
+    id: Union[int, str], exc: httpx.HTTPError
+) -> models.BulkActionResult.Error:
+    status_code = None
+    message = str(exc)
+    if isinstance(exc, httpx.HTTPStatusError):
+        status_code = exc.response.status_code
+        try:
+            message = exc.response.json()["message"]
+        except (ValueError, KeyError, TypeError):
+            pass
+    return models.BulkActionResult.Error(
+        id=str(id), message=message, status_code=status_code
+    )
+
+
 class DropletsManager(BaseManager):
     endpoint = "droplets"
     name = "droplets"
 
-    def all(self) -> List[models.Droplet]:
-        res = self._client.fetch_all(endpoint="droplets", key="droplets")
-        return [models.Droplet(**droplet) for droplet in res]
+    def all(
+        self, max_workers: int = None, validate: bool = None
+    ) -> List[models.Droplet]:
+        res = self._client.fetch_all(
+            endpoint="droplets", key="droplets", max_workers=max_workers
+        )
+        return [self._parse(models.Droplet, droplet, validate) for droplet in res]
+
+    def iter_all(self, validate: bool = None) -> Iterator[models.Droplet]:
+        for page in self._client.iter_pages(endpoint="droplets", key="droplets"):
+            for droplet in page:
+                yield self._parse(models.Droplet, droplet, validate)
+
+    def filter(
+        self, tag_name: str = None, max_workers: int = None, validate: bool = None
+    ) -> List[models.Droplet]:
+        params = {}
+        if tag_name is not None:
+            params["tag_name"] = tag_name
+        res = self._client.fetch_all(
+            endpoint="droplets",
+            key="droplets",
+            params=params,
+            max_workers=max_workers,
+        )
+        return [self._parse(models.Droplet, droplet, validate) for droplet in res]
 
-    def filter(self, tag_name: str = None) -> List[models.Droplet]:
+    def table(self, tag_name: str = None, max_workers: int = None) -> DropletTable:
         params = {}
         if tag_name is not None:
             params["tag_name"] = tag_name
@@ -20,18 +64,29 @@ class DropletsManager(BaseManager):
             endpoint="droplets",
             key="droplets",
             params=params,
+            max_workers=max_workers,
         )
-        return [models.Droplet(**droplet) for droplet in res]
+        return DropletTable.from_droplets(res)
 
     def get(self, id: str) -> models.Droplet:
         res = self._client.request(endpoint="droplets/{id}".format(id=id), method="get")
-        return models.Droplet(**res["droplet"])
+        return self._parse(models.Droplet, res["droplet"])
+
+    def get_many(
+        self, ids: Iterable[str], max_workers: int = None
+    ) -> List[models.Droplet]:
+        res = self._client.fetch_many(
+            ["droplets/{id}".format(id=id) for id in ids],
+            max_workers=max_workers,
+        )
+        return [self._parse(models.Droplet, item["droplet"]) for item in res]
 
     def create(self, droplet: models.Droplet) -> models.Droplet:
         res = self._client.request(
             endpoint="droplets",
             method="post",
-            data=droplet.json(
+            data=self._dump(
+                droplet,
                 include={
                     "name",
                     "region",
@@ -46,10 +101,10 @@ class DropletsManager(BaseManager):
                     "monitoring",
                     "volumes",
                     "tags",
-                }
+                },
             ),
         )
-        return models.Droplet(**res["droplet"])
+        return self._parse(models.Droplet, res["droplet"])
 
     def delete(self, droplet: models.Droplet) -> None:
         self._client.request(
@@ -61,28 +116,28 @@ class DropletsManager(BaseManager):
             endpoint="droplets/{id}/neighbors".format(id=id),
             key="droplets",
         )
-        return [models.Droplet(**neighbor) for neighbor in res]
+        return [self._parse(models.Droplet, neighbor) for neighbor in res]
 
     def kernels(self, id: str) -> List[models.Droplet.Kernel]:
         res = self._client.fetch_all(
             endpoint="droplets/{id}/kernels".format(id=id),
             key="kernels",
         )
-        return [models.Droplet.Kernel(**kernel) for kernel in res]
+        return [self._parse(models.Droplet.Kernel, kernel) for kernel in res]
 
     def snapshots(self, id: str) -> List[models.Snapshot]:
         res = self._client.fetch_all(
             endpoint="droplets/{id}/snapshots".format(id=id),
             key="snapshots",
         )
-        return [models.Snapshot(**snapshot) for snapshot in res]
+        return [self._parse(models.Snapshot, snapshot) for snapshot in res]
 
     def actions(self, id: str) -> List[models.Action]:
         res = self._client.fetch_all(
             endpoint="droplets/{id}/actions".format(id=id),
             key="actions",
         )
-        return [models.Action(**action) for action in res]
+        return [self._parse(models.Action, action) for action in res]
 
     def action(self, id: str, action_id: int) -> models.Action:
         res = self._client.request(
@@ -91,11 +146,11 @@ class DropletsManager(BaseManager):
             ),
             method="get",
         )
-        return models.Action(**res["action"])
+        return self._parse(models.Action, res["action"])
 
     def sizes(self) -> List[models.Droplet.Size]:
         res = self._client.fetch_all(endpoint="sizes", key="sizes")
-        return [models.Droplet.Size(**size) for size in res]
+        return [self._parse(models.Droplet.Size, size) for size in res]
 
     # Actions
 
@@ -106,7 +161,7 @@ class DropletsManager(BaseManager):
             method="post",
             json=post_json,
         )
-        return models.Action(**res["action"])
+        return self._parse(models.Action, res["action"])
 
     def enable_backups(self, id: str) -> models.Action:
         return self._action(id, "enable_backups")
@@ -137,7 +192,7 @@ class DropletsManager(BaseManager):
         res = self._client.request(
             endpoint="droplets/{id}/actions".format(id=id), method="post", json=action
         )
-        return models.Action(**res["action"])
+        return self._parse(models.Action, res["action"])
 
     def password_reset(self, id: str) -> models.Action:
         return self._action(id, "password_reset")
@@ -156,7 +211,7 @@ class DropletsManager(BaseManager):
             method="post",
             json=post_json,
         )
-        return models.Action(**res["action"])
+        return self._parse(models.Action, res["action"])
 
     def rebuild(self, id: str, image: Union[int, str]) -> models.Action:
         action = {
@@ -166,7 +221,7 @@ class DropletsManager(BaseManager):
         res = self._client.request(
             endpoint="droplets/{id}/actions".format(id=id), method="post", json=action
         )
-        return models.Action(**res["action"])
+        return self._parse(models.Action, res["action"])
 
     def rename(self, id: str, name: str) -> models.Action:
         action = {
@@ -176,7 +231,7 @@ class DropletsManager(BaseManager):
         res = self._client.request(
             endpoint="droplets/{id}/actions".format(id=id), method="post", json=action
         )
-        return models.Action(**res["action"])
+        return self._parse(models.Action, res["action"])
 
     def change_kernel(self, id: str, kernel: int) -> models.Action:
         action = {
@@ -186,7 +241,7 @@ class DropletsManager(BaseManager):
         res = self._client.request(
             endpoint="droplets/{id}/actions".format(id=id), method="post", json=action
         )
-        return models.Action(**res["action"])
+        return self._parse(models.Action, res["action"])
 
     def enable_ipv6(self, id: str) -> models.Action:
         return self._action(id, "enable_ipv6")
@@ -204,7 +259,7 @@ class DropletsManager(BaseManager):
             json=post_json,
             params=params,
         )
-        return [models.Action(**action) for action in res["actions"]]
+        return [self._parse(models.Action, action) for action in res["actions"]]
 
     def snapshot(self, id: str, name: str = None) -> models.Action:
         action = {"type": "snapshot"}
@@ -214,18 +269,56 @@ class DropletsManager(BaseManager):
         res = self._client.request(
             endpoint="droplets/{id}/actions".format(id=id), method="post", json=action
         )
-        return models.Action(**res["action"])
+        return self._parse(models.Action, res["action"])
+
+    def bulk(
+        self,
+        action: str,
+        ids: Iterable[Union[int, str]],
+        concurrency: int = None,
+        **params: Any,
+    ) -> models.BulkActionResult:
+        if concurrency is None:
+            concurrency = MANY_CONCURRENCY
+        post_json = dict(params, type=action)
+
+        def run(
+            id: Union[int, str],
+        ) -> Union[models.Action, models.BulkActionResult.Error]:
+            try:
+                res = self._client.request(
+                    endpoint="droplets/{id}/actions".format(id=id),
+                    method="post",
+                    json=post_json,
+                )
+            except httpx.HTTPError as exc:
+                return _bulk_error(id, exc)
+            return self._parse(models.Action, res["action"])
+
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            results = list(executor.map(run, ids))
+        return models.BulkActionResult(
+            actions=[res for res in results if isinstance(res, models.Action)],
+            errors=[res for res in results if not isinstance(res, models.Action)],
+        )
 
 
 class AsyncDropletsManager(AsyncBaseManager):
     endpoint = "droplets"
     name = "droplets"
 
-    async def all(self) -> List[models.Droplet]:
+    async def all(self, validate: bool = None) -> List[models.Droplet]:
         res = await self._client.fetch_all(endpoint="droplets", key="droplets")
-        return [models.Droplet(**droplet) for droplet in res]
+        return [self._parse(models.Droplet, droplet, validate) for droplet in res]
 
-    async def filter(self, tag_name: str = None) -> List[models.Droplet]:
+    async def iter_all(self, validate: bool = None) -> AsyncIterator[models.Droplet]:
+        async for page in self._client.iter_pages(endpoint="droplets", key="droplets"):
+            for droplet in page:
+                yield self._parse(models.Droplet, droplet, validate)
+
+    async def filter(
+        self, tag_name: str = None, validate: bool = None
+    ) -> List[models.Droplet]:
         params = {}
         if tag_name is not None:
             params["tag_name"] = tag_name
@@ -234,19 +327,40 @@ class AsyncDropletsManager(AsyncBaseManager):
             key="droplets",
             params=params,
         )
-        return [models.Droplet(**droplet) for droplet in res]
+        return [self._parse(models.Droplet, droplet, validate) for droplet in res]
+
+    async def table(self, tag_name: str = None) -> DropletTable:
+        params = {}
+        if tag_name is not None:
+            params["tag_name"] = tag_name
+        res = await self._client.fetch_all(
+            endpoint="droplets",
+            key="droplets",
+            params=params,
+        )
+        return DropletTable.from_droplets(res)
 
     async def get(self, id: str) -> models.Droplet:
         res = await self._client.request(
             endpoint="droplets/{id}".format(id=id), method="get"
         )
-        return models.Droplet(**res["droplet"])
+        return self._parse(models.Droplet, res["droplet"])
+
+    async def get_many(
+        self, ids: Iterable[str], concurrency: int = None
+    ) -> List[models.Droplet]:
+        res = await self._client.fetch_many(
+            ["droplets/{id}".format(id=id) for id in ids],
+            concurrency=concurrency,
+        )
+        return [self._parse(models.Droplet, item["droplet"]) for item in res]
 
     async def create(self, droplet: models.Droplet) -> models.Droplet:
         res = await self._client.request(
             endpoint="droplets",
             method="post",
-            data=droplet.json(
+            data=self._dump(
+                droplet,
                 include={
                     "name",
                     "region",
@@ -261,10 +375,10 @@ class AsyncDropletsManager(AsyncBaseManager):
                     "monitoring",
                     "volumes",
                     "tags",
-                }
+                },
             ),
         )
-        return models.Droplet(**res["droplet"])
+        return self._parse(models.Droplet, res["droplet"])
 
     async def delete(self, droplet: models.Droplet) -> None:
         await self._client.request(
@@ -276,28 +390,28 @@ class AsyncDropletsManager(AsyncBaseManager):
             endpoint="droplets/{id}/neighbors".format(id=id),
             key="droplets",
         )
-        return [models.Droplet(**neighbor) for neighbor in res]
+        return [self._parse(models.Droplet, neighbor) for neighbor in res]
 
     async def kernels(self, id: str) -> List[models.Droplet.Kernel]:
         res = await self._client.fetch_all(
             endpoint="droplets/{id}/kernels".format(id=id),
             key="kernels",
         )
-        return [models.Droplet.Kernel(**kernel) for kernel in res]
+        return [self._parse(models.Droplet.Kernel, kernel) for kernel in res]
 
     async def snapshots(self, id: str) -> List[models.Snapshot]:
         res = await self._client.fetch_all(
             endpoint="droplets/{id}/snapshots".format(id=id),
             key="snapshots",
         )
-        return [models.Snapshot(**snapshot) for snapshot in res]
+        return [self._parse(models.Snapshot, snapshot) for snapshot in res]
 
     async def actions(self, id: str) -> List[models.Action]:
         res = await self._client.fetch_all(
             endpoint="droplets/{id}/actions".format(id=id),
             key="actions",
         )
-        return [models.Action(**action) for action in res]
+        return [self._parse(models.Action, action) for action in res]
 
     async def action(self, id: str, action_id: int) -> models.Action:
         res = await self._client.request(
@@ -306,11 +420,11 @@ class AsyncDropletsManager(AsyncBaseManager):
             ),
             method="get",
         )
-        return models.Action(**res["action"])
+        return self._parse(models.Action, res["action"])
 
     async def sizes(self) -> List[models.Droplet.Size]:
         res = await self._client.fetch_all(endpoint="sizes", key="sizes")
-        return [models.Droplet.Size(**size) for size in res]
+        return [self._parse(models.Droplet.Size, size) for size in res]
 
     # Actions
 
@@ -321,7 +435,7 @@ class AsyncDropletsManager(AsyncBaseManager):
             method="post",
             json=post_json,
         )
-        return models.Action(**res["action"])
+        return self._parse(models.Action, res["action"])
 
     async def enable_backups(self, id: str) -> models.Action:
         return await self._action(id, "enable_backups")
@@ -352,7 +466,7 @@ class AsyncDropletsManager(AsyncBaseManager):
         res = await self._client.request(
             endpoint="droplets/{id}/actions".format(id=id), method="post", json=action
         )
-        return models.Action(**res["action"])
+        return self._parse(models.Action, res["action"])
 
     async def password_reset(self, id: str) -> models.Action:
         return await self._action(id, "password_reset")
@@ -371,7 +485,7 @@ class AsyncDropletsManager(AsyncBaseManager):
             method="post",
             json=post_json,
         )
-        return models.Action(**res["action"])
+        return self._parse(models.Action, res["action"])
 
     async def rebuild(self, id: str, image: Union[int, str]) -> models.Action:
         action = {
@@ -381,7 +495,7 @@ class AsyncDropletsManager(AsyncBaseManager):
         res = await self._client.request(
             endpoint="droplets/{id}/actions".format(id=id), method="post", json=action
         )
-        return models.Action(**res["action"])
+        return self._parse(models.Action, res["action"])
 
     async def rename(self, id: str, name: str) -> models.Action:
         action = {
@@ -391,7 +505,7 @@ class AsyncDropletsManager(AsyncBaseManager):
         res = await self._client.request(
             endpoint="droplets/{id}/actions".format(id=id), method="post", json=action
         )
-        return models.Action(**res["action"])
+        return self._parse(models.Action, res["action"])
 
     async def change_kernel(self, id: str, kernel: int) -> models.Action:
         action = {
@@ -401,7 +515,7 @@ class AsyncDropletsManager(AsyncBaseManager):
         res = await self._client.request(
             endpoint="droplets/{id}/actions".format(id=id), method="post", json=action
         )
-        return models.Action(**res["action"])
+        return self._parse(models.Action, res["action"])
 
     async def enable_ipv6(self, id: str) -> models.Action:
         return await self._action(id, "enable_ipv6")
@@ -419,7 +533,7 @@ class AsyncDropletsManager(AsyncBaseManager):
             json=post_json,
             params=params,
         )
-        return [models.Action(**action) for action in res["actions"]]
+        return [self._parse(models.Action, action) for action in res["actions"]]
 
     async def snapshot(self, id: str, name: str = None) -> models.Action:
         action = {"type": "snapshot"}
@@ -429,4 +543,38 @@ class AsyncDropletsManager(AsyncBaseManager):
         res = await self._client.request(
             endpoint="droplets/{id}/actions".format(id=id), method="post", json=action
         )
-        return models.Action(**res["action"])
+        return self._parse(models.Action, res["action"])
+
+    async def bulk(
+        self,
+        action: str,
+        ids: Iterable[Union[int, str]],
+        concurrency: int = None,
+        **params: Any,
+    ) -> models.BulkActionResult:
+        import asyncio
+
+        if concurrency is None:
+            concurrency = MANY_CONCURRENCY
+        post_json = dict(params, type=action)
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def run(
+            id: Union[int, str],
+        ) -> Union[models.Action, models.BulkActionResult.Error]:
+            try:
+                async with semaphore:
+                    res = await self._client.request(
+                        endpoint="droplets/{id}/actions".format(id=id),
+                        method="post",
+                        json=post_json,
+                    )
+            except httpx.HTTPError as exc:
+                return _bulk_error(id, exc)
+            return self._parse(models.Action, res["action"])
+
+        results = await asyncio.gather(*[run(id) for id in ids])
+        return models.BulkActionResult(
+            actions=[res for res in results if isinstance(res, models.Action)],
+            errors=[res for res in results if not isinstance(res, models.Action)],
+        )
@@ -1,4 +1,4 @@
-from typing import List
+from typing import AsyncIterator, Iterable, Iterator, List
 
 from .. import models
 from .base import AsyncBaseManager, BaseManager
@@ -8,47 +8,67 @@ class FirewallsManager(BaseManager):
     endpoint = "firewalls"
     name = "firewalls"
 
-    def all(self) -> List[models.Firewall]:
-        res = self._client.fetch_all(endpoint="firewalls", key="firewalls")
-        return [models.Firewall(**firewall) for firewall in res]
+    def all(
+        self, max_workers: int = None, validate: bool = None
+    ) -> List[models.Firewall]:
+        res = self._client.fetch_all(
+            endpoint="firewalls", key="firewalls", max_workers=max_workers
+        )
+        return [self._parse(models.Firewall, firewall, validate) for firewall in res]
+
+    def iter_all(self, validate: bool = None) -> Iterator[models.Firewall]:
+        for page in self._client.iter_pages(endpoint="firewalls", key="firewalls"):
+            for firewall in page:
+                yield self._parse(models.Firewall, firewall, validate)
 
     def get(self, id: str) -> models.Firewall:
         res = self._client.request(
             endpoint="firewalls/{id}".format(id=id), method="get"
         )
-        return models.Firewall(**res["firewall"])
+        return self._parse(models.Firewall, res["firewall"])
+
+    def get_many(
+        self, ids: Iterable[str], max_workers: int = None
+    ) -> List[models.Firewall]:
+        res = self._client.fetch_many(
+            ["firewalls/{id}".format(id=id) for id in ids],
+            max_workers=max_workers,
+        )
+        return [self._parse(models.Firewall, item["firewall"]) for item in res]
 
     def create(self, firewall: models.Firewall) -> models.Firewall:
         res = self._client.request(
             endpoint="firewalls",
             method="post",
-            data=firewall.json(
+            data=self._dump(
+                firewall,
                 include={
                     "name",
                     "inbound_rules",
                     "outbound_rules",
                     "droplet_ids",
                     "tags",
-                }
+                },
             ),
         )
-        return models.Firewall(**res["firewall"])
+        return self._parse(models.Firewall, res["firewall"])
 
     def update(self, firewall: models.Firewall) -> models.Firewall:
         res = self._client.request(
             endpoint="firewalls/{id}".format(id=firewall.id),
             method="put",
-            data=firewall.json(
+            data=self._dump(
+                firewall,
                 include={
                     "name",
                     "inbound_rules",
                     "outbound_rules",
                     "droplet_ids",
                     "tags",
-                }
+                },
             ),
         )
-        return models.Firewall(**res["firewall"])
+        return self._parse(models.Firewall, res["firewall"])
 
     def delete(self, firewall: models.Firewall) -> None:
         self._client.request(
@@ -132,47 +152,65 @@ class AsyncFirewallsManager(AsyncBaseManager):
     endpoint = "firewalls"
     name = "firewalls"
 
-    async def all(self) -> List[models.Firewall]:
+    async def all(self, validate: bool = None) -> List[models.Firewall]:
         res = await self._client.fetch_all(endpoint="firewalls", key="firewalls")
-        return [models.Firewall(**firewall) for firewall in res]
+        return [self._parse(models.Firewall, firewall, validate) for firewall in res]
+
+    async def iter_all(self, validate: bool = None) -> AsyncIterator[models.Firewall]:
+        async for page in self._client.iter_pages(
+            endpoint="firewalls", key="firewalls"
+        ):
+            for firewall in page:
+                yield self._parse(models.Firewall, firewall, validate)
 
     async def get(self, id: str) -> models.Firewall:
         res = await self._client.request(
             endpoint="firewalls/{id}".format(id=id), method="get"
         )
-        return models.Firewall(**res["firewall"])
+        return self._parse(models.Firewall, res["firewall"])
+
+    async def get_many(
+        self, ids: Iterable[str], concurrency: int = None
+    ) -> List[models.Firewall]:
+        res = await self._client.fetch_many(
+            ["firewalls/{id}".format(id=id) for id in ids],
+            concurrency=concurrency,
+        )
+        return [self._parse(models.Firewall, item["firewall"]) for item in res]
 
     async def create(self, firewall: models.Firewall) -> models.Firewall:
         res = await self._client.request(
             endpoint="firewalls",
             method="post",
-            data=firewall.json(
+            data=self._dump(
+                firewall,
                 include={
                     "name",
                     "inbound_rules",
                     "outbound_rules",
                     "droplet_ids",
                     "tags",
-                }
+                },
             ),
         )
-        return models.Firewall(**res["firewall"])
+        return self._parse(models.Firewall, res["firewall"])
 
     async def update(self, firewall: models.Firewall) -> models.Firewall:
         res = await self._client.request(
             endpoint="firewalls/{id}".format(id=firewall.id),
             method="put",
-            data=firewall.json(
+            data=self._dump(
+                firewall,
                 include={
                     "name",
                     "inbound_rules",
                     "outbound_rules",
                     "droplet_ids",
                     "tags",
-                }
+                },
             ),
         )
-        return models.Firewall(**res["firewall"])
+        return self._parse(models.Firewall, res["firewall"])
 
     async def delete(self, firewall: models.Firewall) -> None:
         await self._client.request(
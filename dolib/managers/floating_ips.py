@@ -1,4 +1,4 @@
-from typing import Any, Dict, List
+from typing import Any, AsyncIterator, Dict, Iterable, Iterator, List
 
 from .. import models
 from .base import AsyncBaseManager, BaseManager
@@ -8,15 +8,35 @@ class FloatingIPsManager(BaseManager):
     endpoint = "floating_ips"
     name = "floating_ips"
 
-    def all(self) -> List[models.FloatingIP]:
-        res = self._client.fetch_all(endpoint="floating_ips", key="floating_ips")
-        return [models.FloatingIP(**ip) for ip in res]
+    def all(
+        self, max_workers: int = None, validate: bool = None
+    ) -> List[models.FloatingIP]:
+        res = self._client.fetch_all(
+            endpoint="floating_ips", key="floating_ips", max_workers=max_workers
+        )
+        return [self._parse(models.FloatingIP, ip, validate) for ip in res]
+
+    def iter_all(self, validate: bool = None) -> Iterator[models.FloatingIP]:
+        for page in self._client.iter_pages(
+            endpoint="floating_ips", key="floating_ips"
+        ):
+            for ip in page:
+                yield self._parse(models.FloatingIP, ip, validate)
 
     def get(self, ip: str) -> models.FloatingIP:
         res = self._client.request(
             endpoint="floating_ips/{ip}".format(ip=ip), method="get"
         )
-        return models.FloatingIP(**res["floating_ip"])
+        return self._parse(models.FloatingIP, res["floating_ip"])
+
+    def get_many(
+        self, ips: Iterable[str], max_workers: int = None
+    ) -> List[models.FloatingIP]:
+        res = self._client.fetch_many(
+            ["floating_ips/{ip}".format(ip=ip) for ip in ips],
+            max_workers=max_workers,
+        )
+        return [self._parse(models.FloatingIP, item["floating_ip"]) for item in res]
 
     def create(self, ip: models.FloatingIP) -> models.FloatingIP:
         post_data: Dict[str, Any] = {}
@@ -30,7 +50,7 @@ class FloatingIPsManager(BaseManager):
             method="post",
             json=post_data,
         )
-        return models.FloatingIP(**res["floating_ip"])
+        return self._parse(models.FloatingIP, res["floating_ip"])
 
     def delete(self, ip: models.FloatingIP) -> None:
         self._client.request(
@@ -43,7 +63,7 @@ class FloatingIPsManager(BaseManager):
             method="post",
             json={"type": "assign", "droplet_id": droplet.id},
         )
-        return models.Action(**res["action"])
+        return self._parse(models.Action, res["action"])
 
     def unassign(self, ip: str) -> models.Action:
         res = self._client.request(
@@ -51,13 +71,13 @@ class FloatingIPsManager(BaseManager):
             method="post",
             json={"type": "unassign"},
         )
-        return models.Action(**res["action"])
+        return self._parse(models.Action, res["action"])
 
     def actions(self, ip: str) -> List[models.Action]:
         res = self._client.fetch_all(
             endpoint="floating_ips/{ip}/actions".format(ip=ip), key="actions"
         )
-        return [models.Action(**action) for action in res]
+        return [self._parse(models.Action, action) for action in res]
 
     def action(self, ip: str, action_id: int) -> models.Action:
         res = self._client.request(
@@ -66,22 +86,38 @@ class FloatingIPsManager(BaseManager):
             ),
             method="get",
         )
-        return models.Action(**res["action"])
+        return self._parse(models.Action, res["action"])
 
 
 class AsyncFloatingIPsManager(AsyncBaseManager):
     endpoint = "floating_ips"
     name = "floating_ips"
 
-    async def all(self) -> List[models.FloatingIP]:
+    async def all(self, validate: bool = None) -> List[models.FloatingIP]:
         res = await self._client.fetch_all(endpoint="floating_ips", key="floating_ips")
-        return [models.FloatingIP(**ip) for ip in res]
+        return [self._parse(models.FloatingIP, ip, validate) for ip in res]
+
+    async def iter_all(self, validate: bool = None) -> AsyncIterator[models.FloatingIP]:
+        async for page in self._client.iter_pages(
+            endpoint="floating_ips", key="floating_ips"
+        ):
+            for ip in page:
+                yield self._parse(models.FloatingIP, ip, validate)
 
     async def get(self, ip: str) -> models.FloatingIP:
         res = await self._client.request(
             endpoint="floating_ips/{ip}".format(ip=ip), method="get"
         )
-        return models.FloatingIP(**res["floating_ip"])
+        return self._parse(models.FloatingIP, res["floating_ip"])
+
+    async def get_many(
+        self, ips: Iterable[str], concurrency: int = None
+    ) -> List[models.FloatingIP]:
+        res = await self._client.fetch_many(
+            ["floating_ips/{ip}".format(ip=ip) for ip in ips],
+            concurrency=concurrency,
+        )
+        return [self._parse(models.FloatingIP, item["floating_ip"]) for item in res]
 
     async def create(self, ip: models.FloatingIP) -> models.FloatingIP:
         post_data: Dict[str, Any] = {}
@@ -95,7 +131,7 @@ class AsyncFloatingIPsManager(AsyncBaseManager):
             method="post",
             json=post_data,
         )
-        return models.FloatingIP(**res["floating_ip"])
+        return self._parse(models.FloatingIP, res["floating_ip"])
 
     async def delete(self, ip: models.FloatingIP) -> None:
         await self._client.request(
@@ -108,7 +144,7 @@ class AsyncFloatingIPsManager(AsyncBaseManager):
             method="post",
             json={"type": "assign", "droplet_id": droplet.id},
         )
-        return models.Action(**res["action"])
+        return self._parse(models.Action, res["action"])
 
     async def unassign(self, ip: str) -> models.Action:
         res = await self._client.request(
@@ -116,13 +152,13 @@ class AsyncFloatingIPsManager(AsyncBaseManager):
             method="post",
             json={"type": "unassign"},
         )
-        return models.Action(**res["action"])
+        return self._parse(models.Action, res["action"])
 
     async def actions(self, ip: str) -> List[models.Action]:
         res = await self._client.fetch_all(
             endpoint="floating_ips/{ip}/actions".format(ip=ip), key="actions"
         )
-        return [models.Action(**action) for action in res]
+        return [self._parse(models.Action, action) for action in res]
 
     async def action(self, ip: str, action_id: int) -> models.Action:
         res = await self._client.request(
@@ -131,4 +167,4 @@ class AsyncFloatingIPsManager(AsyncBaseManager):
             ),
             method="get",
         )
-        return models.Action(**res["action"])
+        return self._parse(models.Action, res["action"])
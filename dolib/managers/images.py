@@ -1,4 +1,4 @@
-from typing import List
+from typing import AsyncIterator, Iterable, Iterator, List
 
 from .. import models
 from .base import AsyncBaseManager, BaseManager
@@ -8,15 +8,24 @@ class ImagesManager(BaseManager):
     endpoint: str = "images"
     name: str = "images"
 
-    def all(self) -> List[models.Image]:
-        res = self._client.fetch_all(endpoint="images", key="images")
-        return [models.Image(**image) for image in res]
+    def all(self, max_workers: int = None, validate: bool = None) -> List[models.Image]:
+        res = self._client.fetch_all(
+            endpoint="images", key="images", max_workers=max_workers
+        )
+        return [self._parse(models.Image, image, validate) for image in res]
+
+    def iter_all(self, validate: bool = None) -> Iterator[models.Image]:
+        for page in self._client.iter_pages(endpoint="images", key="images"):
+            for image in page:
+                yield self._parse(models.Image, image, validate)
 
     def filter(
         self,
         private: str = None,
         type: str = None,
         tag_name: str = None,
+        max_workers: int = None,
+        validate: bool = None,
     ) -> List[models.Image]:
         params = dict()
         if private is not None:
@@ -26,31 +35,44 @@ class ImagesManager(BaseManager):
         if tag_name is not None:
             params["tag_name"] = tag_name
 
-        res = self._client.fetch_all(endpoint="images", key="images", params=params)
-        return [models.Image(**image) for image in res]
+        res = self._client.fetch_all(
+            endpoint="images", key="images", params=params, max_workers=max_workers
+        )
+        return [self._parse(models.Image, image, validate) for image in res]
 
     def get(self, id: str) -> models.Image:
         res = self._client.request(
             endpoint="images/{id}".format(id=id),
             method="get",
         )
-        return models.Image(**res["image"])
+        return self._parse(models.Image, res["image"])
+
+    def get_many(
+        self, ids: Iterable[str], max_workers: int = None
+    ) -> List[models.Image]:
+        res = self._client.fetch_many(
+            ["images/{id}".format(id=id) for id in ids],
+            max_workers=max_workers,
+        )
+        return [self._parse(models.Image, item["image"]) for item in res]
 
     def create(self, image: models.Image) -> models.Image:
         res = self._client.request(
             endpoint="images",
             method="post",
-            data=image.json(include={"name", "url", "region", "distribution", "tags"}),
+            data=self._dump(
+                image, include={"name", "url", "region", "distribution", "tags"}
+            ),
         )
-        return models.Image(**res["image"])
+        return self._parse(models.Image, res["image"])
 
     def update(self, image: models.Image) -> models.Image:
         res = self._client.request(
             endpoint="images/{id}".format(id=image.id),
             method="put",
-            data=image.json(include={"name", "distribution", "description"}),
+            data=self._dump(image, include={"name", "distribution", "description"}),
         )
-        return models.Image(**res["image"])
+        return self._parse(models.Image, res["image"])
 
     def delete(self, image: models.Image) -> None:
         self._client.request(
@@ -69,7 +91,7 @@ class ImagesManager(BaseManager):
             method="post",
             json=action,
         )
-        return models.Action(**res["action"])
+        return self._parse(models.Action, res["action"])
 
     def convert(self, id: str) -> models.Action:
         action = {
@@ -81,14 +103,14 @@ class ImagesManager(BaseManager):
             method="post",
             json=action,
         )
-        return models.Action(**res["action"])
+        return self._parse(models.Action, res["action"])
 
     def actions(self, id: str) -> List[models.Action]:
         res = self._client.fetch_all(
             endpoint="images/{id}/actions".format(id=id),
             key="actions",
         )
-        return [models.Action(**action) for action in res]
+        return [self._parse(models.Action, action) for action in res]
 
     def action(self, id: str, action_id: str) -> models.Action:
         res = self._client.request(
@@ -97,22 +119,28 @@ class ImagesManager(BaseManager):
             ),
             method="get",
         )
-        return models.Action(**res["action"])
+        return self._parse(models.Action, res["action"])
 
 
 class AsyncImagesManager(AsyncBaseManager):
     endpoint: str = "images"
     name: str = "images"
 
-    async def all(self) -> List[models.Image]:
+    async def all(self, validate: bool = None) -> List[models.Image]:
         res = await self._client.fetch_all(endpoint="images", key="images")
-        return [models.Image(**image) for image in res]
+        return [self._parse(models.Image, image, validate) for image in res]
+
+    async def iter_all(self, validate: bool = None) -> AsyncIterator[models.Image]:
+        async for page in self._client.iter_pages(endpoint="images", key="images"):
+            for image in page:
+                yield self._parse(models.Image, image, validate)
 
     async def filter(
         self,
         private: str = None,
         type: str = None,
         tag_name: str = None,
+        validate: bool = None,
     ) -> List[models.Image]:
         params = dict()
         if private is not None:
@@ -125,30 +153,41 @@ class AsyncImagesManager(AsyncBaseManager):
         res = await self._client.fetch_all(
             endpoint="images", key="images", params=params
         )
-        return [models.Image(**image) for image in res]
+        return [self._parse(models.Image, image, validate) for image in res]
 
     async def get(self, id: str) -> models.Image:
         res = await self._client.request(
             endpoint="images/{id}".format(id=id),
             method="get",
         )
-        return models.Image(**res["image"])
+        return self._parse(models.Image, res["image"])
+
+    async def get_many(
+        self, ids: Iterable[str], concurrency: int = None
+    ) -> List[models.Image]:
+        res = await self._client.fetch_many(
+            ["images/{id}".format(id=id) for id in ids],
+            concurrency=concurrency,
+        )
+        return [self._parse(models.Image, item["image"]) for item in res]
 
     async def create(self, image: models.Image) -> models.Image:
         res = await self._client.request(
             endpoint="images",
             method="post",
-            data=image.json(include={"name", "url", "region", "distribution", "tags"}),
+            data=self._dump(
+                image, include={"name", "url", "region", "distribution", "tags"}
+            ),
         )
-        return models.Image(**res["image"])
+        return self._parse(models.Image, res["image"])
 
     async def update(self, image: models.Image) -> models.Image:
         res = await self._client.request(
             endpoint="images/{id}".format(id=image.id),
             method="put",
-            data=image.json(include={"name", "distribution", "description"}),
+            data=self._dump(image, include={"name", "distribution", "description"}),
         )
-        return models.Image(**res["image"])
+        return self._parse(models.Image, res["image"])
 
     async def delete(self, image: models.Image) -> None:
         await self._client.request(
@@ -167,7 +206,7 @@ class AsyncImagesManager(AsyncBaseManager):
             method="post",
             json=action,
         )
-        return models.Action(**res["action"])
+        return self._parse(models.Action, res["action"])
 
     async def convert(self, id: str) -> models.Action:
         action = {
@@ -179,14 +218,14 @@ class AsyncImagesManager(AsyncBaseManager):
             method="post",
             json=action,
         )
-        return models.Action(**res["action"])
+        return self._parse(models.Action, res["action"])
 
     async def actions(self, id: str) -> List[models.Action]:
         res = await self._client.fetch_all(
             endpoint="images/{id}/actions".format(id=id),
             key="actions",
         )
-        return [models.Action(**action) for action in res]
+        return [self._parse(models.Action, action) for action in res]
 
     async def action(self, id: str, action_id: str) -> models.Action:
         res = await self._client.request(
@@ -195,4 +234,4 @@ class AsyncImagesManager(AsyncBaseManager):
             ),
             method="get",
         )
-        return models.Action(**res["action"])
+        return self._parse(models.Action, res["action"])
@@ -1,4 +1,4 @@
-from typing import List
+from typing import AsyncIterator, Iterable, Iterator, List
 
 from .. import models
 from .base import AsyncBaseManager, BaseManager
@@ -8,21 +8,41 @@ class InvoicesManager(BaseManager):
     endpoint = "invoices"
     name = "invoices"
 
-    def all(self) -> List[models.Invoice]:
-        res = self._client.fetch_all(endpoint="customers/my/invoices", key="invoices")
-        return [models.Invoice(**invoice) for invoice in res]
+    def all(
+        self, max_workers: int = None, validate: bool = None
+    ) -> List[models.Invoice]:
+        res = self._client.fetch_all(
+            endpoint="customers/my/invoices", key="invoices", max_workers=max_workers
+        )
+        return [self._parse(models.Invoice, invoice, validate) for invoice in res]
+
+    def iter_all(self, validate: bool = None) -> Iterator[models.Invoice]:
+        for page in self._client.iter_pages(
+            endpoint="customers/my/invoices", key="invoices"
+        ):
+            for invoice in page:
+                yield self._parse(models.Invoice, invoice, validate)
 
     def get(self, id: str) -> models.Invoice:
         res = self._client.request(
             endpoint="customers/my/invoices/{id}/summary".format(id=id), method="get"
         )
-        return models.Invoice(**res)
+        return self._parse(models.Invoice, res)
+
+    def get_many(
+        self, ids: Iterable[str], max_workers: int = None
+    ) -> List[models.Invoice]:
+        res = self._client.fetch_many(
+            ["customers/my/invoices/{id}/summary".format(id=id) for id in ids],
+            max_workers=max_workers,
+        )
+        return [self._parse(models.Invoice, item) for item in res]
 
     def items(self, id: str) -> List[models.Invoice.Item]:
         res = self._client.fetch_all(
             endpoint="customers/my/invoices/{id}".format(id=id), key="invoice_items"
         )
-        return [models.Invoice.Item(**item) for item in res]
+        return [self._parse(models.Invoice.Item, item) for item in res]
 
     def csv(self, id: str) -> bytes:
         res = self._client.request_raw(
@@ -41,23 +61,39 @@ class AsyncInvoicesManager(AsyncBaseManager):
     endpoint = "invoices"
     name = "invoices"
 
-    async def all(self) -> List[models.Invoice]:
+    async def all(self, validate: bool = None) -> List[models.Invoice]:
         res = await self._client.fetch_all(
             endpoint="customers/my/invoices", key="invoices"
         )
-        return [models.Invoice(**invoice) for invoice in res]
+        return [self._parse(models.Invoice, invoice, validate) for invoice in res]
+
+    async def iter_all(self, validate: bool = None) -> AsyncIterator[models.Invoice]:
+        async for page in self._client.iter_pages(
+            endpoint="customers/my/invoices", key="invoices"
+        ):
+            for invoice in page:
+                yield self._parse(models.Invoice, invoice, validate)
 
     async def get(self, id: str) -> models.Invoice:
         res = await self._client.request(
             endpoint="customers/my/invoices/{id}/summary".format(id=id), method="get"
         )
-        return models.Invoice(**res)
+        return self._parse(models.Invoice, res)
+
+    async def get_many(
+        self, ids: Iterable[str], concurrency: int = None
+    ) -> List[models.Invoice]:
+        res = await self._client.fetch_many(
+            ["customers/my/invoices/{id}/summary".format(id=id) for id in ids],
+            concurrency=concurrency,
+        )
+        return [self._parse(models.Invoice, item) for item in res]
 
     async def items(self, id: str) -> List[models.Invoice.Item]:
         res = await self._client.fetch_all(
             endpoint="customers/my/invoices/{id}".format(id=id), key="invoice_items"
         )
-        return [models.Invoice.Item(**item) for item in res]
+        return [self._parse(models.Invoice.Item, item) for item in res]
 
     async def csv(self, id: str) -> bytes:
         res = await self._client.request_raw(
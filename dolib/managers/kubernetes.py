@@ -1,4 +1,4 @@
-from typing import List
+from typing import AsyncIterator, Iterable, Iterator, List
 
 from .. import models
 from .base import AsyncBaseManager, BaseManager
@@ -8,23 +8,46 @@ class KubernetesManager(BaseManager):
     endpoint = "kubernetes"
     name = "kubernetes"
 
-    def all(self) -> List[models.K8SCluster]:
+    def all(
+        self, max_workers: int = None, validate: bool = None
+    ) -> List[models.K8SCluster]:
         res = self._client.fetch_all(
-            endpoint="kubernetes/clusters", key="kubernetes_clusters"
+            endpoint="kubernetes/clusters",
+            key="kubernetes_clusters",
+            max_workers=max_workers,
         )
-        return [models.K8SCluster(**cluster) for cluster in res]
+        return [self._parse(models.K8SCluster, cluster, validate) for cluster in res]
+
+    def iter_all(self, validate: bool = None) -> Iterator[models.K8SCluster]:
+        for page in self._client.iter_pages(
+            endpoint="kubernetes/clusters", key="kubernetes_clusters"
+        ):
+            for cluster in page:
+                yield self._parse(models.K8SCluster, cluster, validate)
 
     def get(self, id: str) -> models.K8SCluster:
         res = self._client.request(
             endpoint="kubernetes/clusters/{id}".format(id=id), method="get"
         )
-        return models.K8SCluster(**res["kubernetes_cluster"])
+        return self._parse(models.K8SCluster, res["kubernetes_cluster"])
+
+    def get_many(
+        self, ids: Iterable[str], max_workers: int = None
+    ) -> List[models.K8SCluster]:
+        res = self._client.fetch_many(
+            ["kubernetes/clusters/{id}".format(id=id) for id in ids],
+            max_workers=max_workers,
+        )
+        return [
+            self._parse(models.K8SCluster, item["kubernetes_cluster"]) for item in res
+        ]
 
     def create(self, cluster: models.K8SCluster) -> models.K8SCluster:
         res = self._client.request(
             endpoint="kubernetes/clusters",
             method="post",
-            data=cluster.json(
+            data=self._dump(
+                cluster,
                 include={
                     "name",
                     "region",
@@ -34,17 +57,17 @@ class KubernetesManager(BaseManager):
                     "maintenance_policy",
                     "node_pools",
                     "vpc_uuid",
-                }
+                },
             ),
         )
-        return models.K8SCluster(**res["kubernetes_cluster"])
+        return self._parse(models.K8SCluster, res["kubernetes_cluster"])
 
     def update(self, cluster: models.K8SCluster) -> models.K8SCluster:
         self._client.request(
             endpoint="kubernetes/clusters/{id}".format(id=cluster.id),
             method="put",
-            data=cluster.json(
-                include={"name", "auto_upgrade", "tags", "maintenance_policy"}
+            data=self._dump(
+                cluster, include={"name", "auto_upgrade", "tags", "maintenance_policy"}
             ),
         )
         # DO api method return nothing
@@ -61,7 +84,7 @@ class KubernetesManager(BaseManager):
             endpoint="kubernetes/clusters/{id}/node_pools".format(id=id),
             key="node_pools",
         )
-        return [models.K8SCluster.Pool(**pool) for pool in res]
+        return [self._parse(models.K8SCluster.Pool, pool) for pool in res]
 
     def add_node_pool(
         self, id: str, pool: models.K8SCluster.Pool
@@ -70,7 +93,8 @@ class KubernetesManager(BaseManager):
         res = self._client.request(
             endpoint="kubernetes/clusters/{id}/node_pools".format(id=id),
             method="post",
-            data=pool.json(
+            data=self._dump(
+                pool,
                 include={
                     "size",
                     "name",
@@ -79,10 +103,10 @@ class KubernetesManager(BaseManager):
                     "auto_scale",
                     "min_nodes",
                     "max_nodes",
-                }
+                },
             ),
         )
-        return models.K8SCluster.Pool(**res["node_pool"])
+        return self._parse(models.K8SCluster.Pool, res["node_pool"])
 
     def get_node_pool(self, id: str, pool_id: str) -> models.K8SCluster.Pool:
         res = self._client.request(
@@ -91,7 +115,7 @@ class KubernetesManager(BaseManager):
             ),
             method="get",
         )
-        return models.K8SCluster.Pool(**res["node_pool"])
+        return self._parse(models.K8SCluster.Pool, res["node_pool"])
 
     def update_node_pool(
         self, id: str, pool: models.K8SCluster.Pool
@@ -101,7 +125,8 @@ class KubernetesManager(BaseManager):
                 id=id, pool_id=pool.id
             ),
             method="put",
-            data=pool.json(
+            data=self._dump(
+                pool,
                 include={
                     "name",
                     "count",
@@ -109,7 +134,7 @@ class KubernetesManager(BaseManager):
                     "auto_scale",
                     "min_nodes",
                     "max_nodes",
-                }
+                },
             ),
         )
         # DO api method return nothing
@@ -159,23 +184,42 @@ class AsyncKubernetesManager(AsyncBaseManager):
     endpoint = "kubernetes"
     name = "kubernetes"
 
-    async def all(self) -> List[models.K8SCluster]:
+    async def all(self, validate: bool = None) -> List[models.K8SCluster]:
         res = await self._client.fetch_all(
             endpoint="kubernetes/clusters", key="kubernetes_clusters"
         )
-        return [models.K8SCluster(**cluster) for cluster in res]
+        return [self._parse(models.K8SCluster, cluster, validate) for cluster in res]
+
+    async def iter_all(self, validate: bool = None) -> AsyncIterator[models.K8SCluster]:
+        async for page in self._client.iter_pages(
+            endpoint="kubernetes/clusters", key="kubernetes_clusters"
+        ):
+            for cluster in page:
+                yield self._parse(models.K8SCluster, cluster, validate)
 
     async def get(self, id: str) -> models.K8SCluster:
         res = await self._client.request(
             endpoint="kubernetes/clusters/{id}".format(id=id), method="get"
         )
-        return models.K8SCluster(**res["kubernetes_cluster"])
+        return self._parse(models.K8SCluster, res["kubernetes_cluster"])
+
+    async def get_many(
+        self, ids: Iterable[str], concurrency: int = None
+    ) -> List[models.K8SCluster]:
+        res = await self._client.fetch_many(
+            ["kubernetes/clusters/{id}".format(id=id) for id in ids],
+            concurrency=concurrency,
+        )
+        return [
+            self._parse(models.K8SCluster, item["kubernetes_cluster"]) for item in res
+        ]
 
     async def create(self, cluster: models.K8SCluster) -> models.K8SCluster:
         res = await self._client.request(
             endpoint="kubernetes/clusters",
             method="post",
-            data=cluster.json(
+            data=self._dump(
+                cluster,
                 include={
                     "name",
                     "region",
@@ -185,17 +229,17 @@ class AsyncKubernetesManager(AsyncBaseManager):
                     "maintenance_policy",
                     "node_pools",
                     "vpc_uuid",
-                }
+                },
             ),
         )
-        return models.K8SCluster(**res["kubernetes_cluster"])
+        return self._parse(models.K8SCluster, res["kubernetes_cluster"])
 
     async def update(self, cluster: models.K8SCluster) -> models.K8SCluster:
         await self._client.request(
             endpoint="kubernetes/clusters/{id}".format(id=cluster.id),
             method="put",
-            data=cluster.json(
-                include={"name", "auto_upgrade", "tags", "maintenance_policy"}
+            data=self._dump(
+                cluster, include={"name", "auto_upgrade", "tags", "maintenance_policy"}
             ),
         )
         # DO api method return nothing
@@ -212,7 +256,7 @@ class AsyncKubernetesManager(AsyncBaseManager):
             endpoint="kubernetes/clusters/{id}/node_pools".format(id=id),
             key="node_pools",
         )
-        return [models.K8SCluster.Pool(**pool) for pool in res]
+        return [self._parse(models.K8SCluster.Pool, pool) for pool in res]
 
     async def add_node_pool(
         self, id: str, pool: models.K8SCluster.Pool
@@ -221,7 +265,8 @@ class AsyncKubernetesManager(AsyncBaseManager):
         res = await self._client.request(
             endpoint="kubernetes/clusters/{id}/node_pools".format(id=id),
             method="post",
-            data=pool.json(
+            data=self._dump(
+                pool,
                 include={
                     "size",
                     "name",
@@ -230,10 +275,10 @@ class AsyncKubernetesManager(AsyncBaseManager):
                     "auto_scale",
                     "min_nodes",
                     "max_nodes",
-                }
+                },
             ),
         )
-        return models.K8SCluster.Pool(**res["node_pool"])
+        return self._parse(models.K8SCluster.Pool, res["node_pool"])
 
     async def get_node_pool(self, id: str, pool_id: str) -> models.K8SCluster.Pool:
         res = await self._client.request(
@@ -242,7 +287,7 @@ class AsyncKubernetesManager(AsyncBaseManager):
             ),
             method="get",
         )
-        return models.K8SCluster.Pool(**res["node_pool"])
+        return self._parse(models.K8SCluster.Pool, res["node_pool"])
 
     async def update_node_pool(
         self, id: str, pool: models.K8SCluster.Pool
@@ -252,7 +297,8 @@ class AsyncKubernetesManager(AsyncBaseManager):
                 id=id, pool_id=pool.id
             ),
             method="put",
-            data=pool.json(
+            data=self._dump(
+                pool,
                 include={
                     "name",
                     "count",
@@ -260,7 +306,7 @@ class AsyncKubernetesManager(AsyncBaseManager):
                     "auto_scale",
                     "min_nodes",
                     "max_nodes",
-                }
+                },
             ),
         )
         # DO api method return nothing
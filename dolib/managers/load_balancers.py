@@ -1,4 +1,4 @@
-from typing import List
+from typing import AsyncIterator, Iterable, Iterator, List
 
 from .. import models
 from .base import AsyncBaseManager, BaseManager
@@ -8,23 +8,43 @@ class LoadBalancersManager(BaseManager):
     endpoint: str = "load_balancers"
     name: str = "load_balancers"
 
-    def all(self) -> List[models.LoadBalancer]:
-        res = self._client.fetch_all(endpoint="load_balancers", key="load_balancers")
-        return [models.LoadBalancer(**lb) for lb in res]
+    def all(
+        self, max_workers: int = None, validate: bool = None
+    ) -> List[models.LoadBalancer]:
+        res = self._client.fetch_all(
+            endpoint="load_balancers", key="load_balancers", max_workers=max_workers
+        )
+        return [self._parse(models.LoadBalancer, lb, validate) for lb in res]
+
+    def iter_all(self, validate: bool = None) -> Iterator[models.LoadBalancer]:
+        for page in self._client.iter_pages(
+            endpoint="load_balancers", key="load_balancers"
+        ):
+            for lb in page:
+                yield self._parse(models.LoadBalancer, lb, validate)
 
     def get(self, id: str) -> models.LoadBalancer:
         res = self._client.request(
             endpoint="load_balancers/{id}".format(id=id), method="get"
         )
-        return models.LoadBalancer(**res["load_balancer"])
+        return self._parse(models.LoadBalancer, res["load_balancer"])
+
+    def get_many(
+        self, ids: Iterable[str], max_workers: int = None
+    ) -> List[models.LoadBalancer]:
+        res = self._client.fetch_many(
+            ["load_balancers/{id}".format(id=id) for id in ids],
+            max_workers=max_workers,
+        )
+        return [self._parse(models.LoadBalancer, item["load_balancer"]) for item in res]
 
     def create(self, load_balancer: models.LoadBalancer) -> models.LoadBalancer:
         res = self._client.request(
             endpoint="load_balancers",
             method="post",
-            data=load_balancer.json(),
+            data=self._dump(load_balancer),
         )
-        return models.LoadBalancer(**res["load_balancer"])
+        return self._parse(models.LoadBalancer, res["load_balancer"])
 
     def update(self, load_balancer: models.LoadBalancer) -> models.LoadBalancer:
         if isinstance(load_balancer.region, models.Region):
@@ -33,7 +53,8 @@ class LoadBalancersManager(BaseManager):
         res = self._client.request(
             endpoint="load_balancers/{id}".format(id=load_balancer.id),
             method="put",
-            data=load_balancer.json(
+            data=self._dump(
+                load_balancer,
                 include={
                     "name",
                     "size",
@@ -48,10 +69,10 @@ class LoadBalancersManager(BaseManager):
                     "vpc_uuid",
                     "droplet_ids",
                     "tag",
-                }
+                },
             ),
         )
-        return models.LoadBalancer(**res["load_balancer"])
+        return self._parse(models.LoadBalancer, res["load_balancer"])
 
     def delete(self, load_balancer: models.LoadBalancer) -> None:
         self._client.request(
@@ -102,25 +123,43 @@ class AsyncLoadBalancersManager(AsyncBaseManager):
     endpoint: str = "load_balancers"
     name: str = "load_balancers"
 
-    async def all(self) -> List[models.LoadBalancer]:
+    async def all(self, validate: bool = None) -> List[models.LoadBalancer]:
         res = await self._client.fetch_all(
             endpoint="load_balancers", key="load_balancers"
         )
-        return [models.LoadBalancer(**lb) for lb in res]
+        return [self._parse(models.LoadBalancer, lb, validate) for lb in res]
+
+    async def iter_all(
+        self, validate: bool = None
+    ) -> AsyncIterator[models.LoadBalancer]:
+        async for page in self._client.iter_pages(
+            endpoint="load_balancers", key="load_balancers"
+        ):
+            for lb in page:
+                yield self._parse(models.LoadBalancer, lb, validate)
 
     async def get(self, id: str) -> models.LoadBalancer:
         res = await self._client.request(
             endpoint="load_balancers/{id}".format(id=id), method="get"
         )
-        return models.LoadBalancer(**res["load_balancer"])
+        return self._parse(models.LoadBalancer, res["load_balancer"])
+
+    async def get_many(
+        self, ids: Iterable[str], concurrency: int = None
+    ) -> List[models.LoadBalancer]:
+        res = await self._client.fetch_many(
+            ["load_balancers/{id}".format(id=id) for id in ids],
+            concurrency=concurrency,
+        )
+        return [self._parse(models.LoadBalancer, item["load_balancer"]) for item in res]
 
     async def create(self, load_balancer: models.LoadBalancer) -> models.LoadBalancer:
         res = await self._client.request(
             endpoint="load_balancers",
             method="post",
-            data=load_balancer.json(),
+            data=self._dump(load_balancer),
         )
-        return models.LoadBalancer(**res["load_balancer"])
+        return self._parse(models.LoadBalancer, res["load_balancer"])
 
     async def update(self, load_balancer: models.LoadBalancer) -> models.LoadBalancer:
         if isinstance(load_balancer.region, models.Region):
@@ -129,7 +168,8 @@ class AsyncLoadBalancersManager(AsyncBaseManager):
         res = await self._client.request(
             endpoint="load_balancers/{id}".format(id=load_balancer.id),
             method="put",
-            data=load_balancer.json(
+            data=self._dump(
+                load_balancer,
                 include={
                     "name",
                     "size",
@@ -144,10 +184,10 @@ class AsyncLoadBalancersManager(AsyncBaseManager):
                     "vpc_uuid",
                     "droplet_ids",
                     "tag",
-                }
+                },
             ),
         )
-        return models.LoadBalancer(**res["load_balancer"])
+        return self._parse(models.LoadBalancer, res["load_balancer"])
 
     async def delete(self, load_balancer: models.LoadBalancer) -> None:
         await self._client.request(
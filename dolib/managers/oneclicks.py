@@ -1,4 +1,4 @@
-from typing import List
+from typing import AsyncIterator, Iterator, List
 
 from .. import models
 from .base import AsyncBaseManager, BaseManager
@@ -8,11 +8,22 @@ class OneClicksManager(BaseManager):
     endpoint = "one_clicks"
     name = "one_clicks"
 
-    def all(self) -> List[models.OneClickApp]:
-        res = self._client.fetch_all(endpoint="1-clicks", key="1_clicks")
-        return [models.OneClickApp(**app) for app in res]
+    def all(
+        self, max_workers: int = None, validate: bool = None
+    ) -> List[models.OneClickApp]:
+        res = self._client.fetch_all(
+            endpoint="1-clicks", key="1_clicks", max_workers=max_workers
+        )
+        return [self._parse(models.OneClickApp, app, validate) for app in res]
 
-    def filter(self, app_type: str = None) -> List[models.OneClickApp]:
+    def iter_all(self, validate: bool = None) -> Iterator[models.OneClickApp]:
+        for page in self._client.iter_pages(endpoint="1-clicks", key="1_clicks"):
+            for app in page:
+                yield self._parse(models.OneClickApp, app, validate)
+
+    def filter(
+        self, app_type: str = None, max_workers: int = None, validate: bool = None
+    ) -> List[models.OneClickApp]:
         params = {}
         if app_type is not None:
             params["type"] = app_type
@@ -20,19 +31,29 @@ class OneClicksManager(BaseManager):
             endpoint="1-clicks",
             key="1_clicks",
             params=params,
+            max_workers=max_workers,
         )
-        return [models.OneClickApp(**app) for app in res]
+        return [self._parse(models.OneClickApp, app, validate) for app in res]
 
 
 class AsyncOneClicksManager(AsyncBaseManager):
     endpoint = "one_clicks"
     name = "one_clicks"
 
-    async def all(self) -> List[models.OneClickApp]:
+    async def all(self, validate: bool = None) -> List[models.OneClickApp]:
         res = await self._client.fetch_all(endpoint="1-clicks", key="1_clicks")
-        return [models.OneClickApp(**app) for app in res]
+        return [self._parse(models.OneClickApp, app, validate) for app in res]
+
+    async def iter_all(
+        self, validate: bool = None
+    ) -> AsyncIterator[models.OneClickApp]:
+        async for page in self._client.iter_pages(endpoint="1-clicks", key="1_clicks"):
+            for app in page:
+                yield self._parse(models.OneClickApp, app, validate)
 
-    async def filter(self, app_type: str = None) -> List[models.OneClickApp]:
+    async def filter(
+        self, app_type: str = None, validate: bool = None
+    ) -> List[models.OneClickApp]:
         params = {}
         if app_type is not None:
             params["type"] = app_type
@@ -41,4 +62,4 @@ class AsyncOneClicksManager(AsyncBaseManager):
             key="1_clicks",
             params=params,
         )
-        return [models.OneClickApp(**app) for app in res]
+        return [self._parse(models.OneClickApp, app, validate) for app in res]
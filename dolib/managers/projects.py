@@ -1,4 +1,4 @@
-from typing import List
+from typing import AsyncIterator, Iterable, Iterator, List
 
 from .. import models
 from .base import AsyncBaseManager, BaseManager
@@ -8,33 +8,52 @@ class ProjectsManager(BaseManager):
     endpoint = "projects"
     name = "projects"
 
-    def all(self) -> List[models.Project]:
-        res = self._client.fetch_all(endpoint="projects", key="projects")
-        return [models.Project(**proj) for proj in res]
+    def all(
+        self, max_workers: int = None, validate: bool = None
+    ) -> List[models.Project]:
+        res = self._client.fetch_all(
+            endpoint="projects", key="projects", max_workers=max_workers
+        )
+        return [self._parse(models.Project, proj, validate) for proj in res]
+
+    def iter_all(self, validate: bool = None) -> Iterator[models.Project]:
+        for page in self._client.iter_pages(endpoint="projects", key="projects"):
+            for proj in page:
+                yield self._parse(models.Project, proj, validate)
 
     def get(self, id: str) -> models.Project:
         res = self._client.request(endpoint="projects/{id}".format(id=id), method="get")
-        return models.Project(**res["project"])
+        return self._parse(models.Project, res["project"])
+
+    def get_many(
+        self, ids: Iterable[str], max_workers: int = None
+    ) -> List[models.Project]:
+        res = self._client.fetch_many(
+            ["projects/{id}".format(id=id) for id in ids],
+            max_workers=max_workers,
+        )
+        return [self._parse(models.Project, item["project"]) for item in res]
 
     def create(self, project: models.Project) -> models.Project:
         res = self._client.request(
             endpoint="projects",
             method="post",
-            data=project.json(
-                include={"name", "description", "purpose", "environment"}
+            data=self._dump(
+                project, include={"name", "description", "purpose", "environment"}
             ),
         )
-        return models.Project(**res["project"])
+        return self._parse(models.Project, res["project"])
 
     def update(self, project: models.Project) -> models.Project:
         res = self._client.request(
             endpoint="projects/{id}".format(id=project.id),
             method="put",
-            data=project.json(
-                include={"name", "description", "purpose", "environment", "is_default"}
+            data=self._dump(
+                project,
+                include={"name", "description", "purpose", "environment", "is_default"},
             ),
         )
-        return models.Project(**res["project"])
+        return self._parse(models.Project, res["project"])
 
     def delete(self, project: models.Project) -> None:
         self._client.request(
@@ -45,7 +64,7 @@ class ProjectsManager(BaseManager):
         res = self._client.fetch_all(
             endpoint="projects/{id}/resources".format(id=id), key="resources"
         )
-        return [models.Project.Resource(**resource) for resource in res]
+        return [self._parse(models.Project.Resource, resource) for resource in res]
 
     def assign_resources(
         self, id: str, resources: List[models.Project.Resource]
@@ -56,42 +75,60 @@ class ProjectsManager(BaseManager):
             method="post",
             json=post_json,
         )
-        return [models.Project.Resource(**resource) for resource in res["resources"]]
+        return [
+            self._parse(models.Project.Resource, resource)
+            for resource in res["resources"]
+        ]
 
 
 class AsyncProjectsManager(AsyncBaseManager):
     endpoint = "projects"
     name = "projects"
 
-    async def all(self) -> List[models.Project]:
+    async def all(self, validate: bool = None) -> List[models.Project]:
         res = await self._client.fetch_all(endpoint="projects", key="projects")
-        return [models.Project(**proj) for proj in res]
+        return [self._parse(models.Project, proj, validate) for proj in res]
+
+    async def iter_all(self, validate: bool = None) -> AsyncIterator[models.Project]:
+        async for page in self._client.iter_pages(endpoint="projects", key="projects"):
+            for proj in page:
+                yield self._parse(models.Project, proj, validate)
 
     async def get(self, id: str) -> models.Project:
         res = await self._client.request(
             endpoint="projects/{id}".format(id=id), method="get"
         )
-        return models.Project(**res["project"])
+        return self._parse(models.Project, res["project"])
+
+    async def get_many(
+        self, ids: Iterable[str], concurrency: int = None
+    ) -> List[models.Project]:
+        res = await self._client.fetch_many(
+            ["projects/{id}".format(id=id) for id in ids],
+            concurrency=concurrency,
+        )
+        return [self._parse(models.Project, item["project"]) for item in res]
 
     async def create(self, project: models.Project) -> models.Project:
         res = await self._client.request(
             endpoint="projects",
             method="post",
-            data=project.json(
-                include={"name", "description", "purpose", "environment"}
+            data=self._dump(
+                project, include={"name", "description", "purpose", "environment"}
             ),
         )
-        return models.Project(**res["project"])
+        return self._parse(models.Project, res["project"])
 
     async def update(self, project: models.Project) -> models.Project:
         res = await self._client.request(
             endpoint="projects/{id}".format(id=project.id),
             method="put",
-            data=project.json(
-                include={"name", "description", "purpose", "environment", "is_default"}
+            data=self._dump(
+                project,
+                include={"name", "description", "purpose", "environment", "is_default"},
             ),
         )
-        return models.Project(**res["project"])
+        return self._parse(models.Project, res["project"])
 
     async def delete(self, project: models.Project) -> None:
         await self._client.request(
@@ -102,7 +139,7 @@ class AsyncProjectsManager(AsyncBaseManager):
         res = await self._client.fetch_all(
             endpoint="projects/{id}/resources".format(id=id), key="resources"
         )
-        return [models.Project.Resource(**resource) for resource in res]
+        return [self._parse(models.Project.Resource, resource) for resource in res]
 
     async def assign_resources(
         self, id: str, resources: List[models.Project.Resource]
@@ -113,4 +150,7 @@ class AsyncProjectsManager(AsyncBaseManager):
             method="post",
             json=post_json,
         )
-        return [models.Project.Resource(**resource) for resource in res["resources"]]
+        return [
+            self._parse(models.Project.Resource, resource)
+            for resource in res["resources"]
+        ]
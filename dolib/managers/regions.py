@@ -1,4 +1,4 @@
-from typing import List
+from typing import AsyncIterator, Iterator, List
 
 from .. import models
 from .base import AsyncBaseManager, BaseManager
@@ -8,15 +8,29 @@ class RegionsManager(BaseManager):
     endpoint = "regions"
     name = "regions"
 
-    def all(self) -> List[models.Region]:
-        res = self._client.fetch_all(endpoint="regions", key="regions")
-        return [models.Region(**region) for region in res]
+    def all(
+        self, max_workers: int = None, validate: bool = None
+    ) -> List[models.Region]:
+        res = self._client.fetch_all(
+            endpoint="regions", key="regions", max_workers=max_workers
+        )
+        return [self._parse(models.Region, region, validate) for region in res]
+
+    def iter_all(self, validate: bool = None) -> Iterator[models.Region]:
+        for page in self._client.iter_pages(endpoint="regions", key="regions"):
+            for region in page:
+                yield self._parse(models.Region, region, validate)
 
 
 class AsyncRegionsManager(AsyncBaseManager):
     endpoint = "regions"
     name = "regions"
 
-    async def all(self) -> List[models.Region]:
+    async def all(self, validate: bool = None) -> List[models.Region]:
         res = await self._client.fetch_all(endpoint="regions", key="regions")
-        return [models.Region(**region) for region in res]
+        return [self._parse(models.Region, region, validate) for region in res]
+
+    async def iter_all(self, validate: bool = None) -> AsyncIterator[models.Region]:
+        async for page in self._client.iter_pages(endpoint="regions", key="regions"):
+            for region in page:
+                yield self._parse(models.Region, region, validate)
@@ -13,7 +13,7 @@ class RegistryManager(BaseManager):
             endpoint="registry",
             method="get",
         )
-        return models.Registry(**res["registry"])
+        return self._parse(models.Registry, res["registry"])
 
     def create(self, registry: models.Registry) -> models.Registry:
         raise DeprecationWarning(
@@ -26,11 +26,11 @@ class RegistryManager(BaseManager):
         res = self._client.request(
             endpoint="registry",
             method="post",
-            data=registry.json(include={"name", "subscription_tier_slug"}),
+            data=self._dump(registry, include={"name", "subscription_tier_slug"}),
         )
         return (
-            models.Registry(**res["registry"]),
-            models.Registry.Subscription(**res["subscription"]),
+            self._parse(models.Registry, res["registry"]),
+            self._parse(models.Registry.Subscription, res["subscription"]),
         )
 
     def delete(self, registry: models.Registry) -> None:
@@ -45,7 +45,7 @@ class RegistryManager(BaseManager):
             endpoint="registry",
             method="get",
         )
-        return models.Registry.Subscription(**res["subscription"])
+        return self._parse(models.Registry.Subscription, res["subscription"])
 
     def docker_credentials(
         self, read_write: bool = None, expiry_seconds: int = None
@@ -74,7 +74,7 @@ class RegistryManager(BaseManager):
             endpoint="registry/{name}/repositories".format(name=name),
             key="repositories",
         )
-        return [models.Registry.Repository(**rep) for rep in res]
+        return [self._parse(models.Registry.Repository, rep) for rep in res]
 
     def repository_tags(
         self, name: str, repository_name: str
@@ -86,7 +86,7 @@ class RegistryManager(BaseManager):
             key="tags",
         )
 
-        return [models.Registry.Repository.Tag(**tag) for tag in res]
+        return [self._parse(models.Registry.Repository.Tag, tag) for tag in res]
 
     def delete_tag(self, name: str, repository_name: str, tag: str) -> None:
         self._client.request(
@@ -115,14 +115,14 @@ class RegistryManager(BaseManager):
             method="post",
             json=json_param,
         )
-        return models.Registry.GarbageCollection(**res["garbage_collection"])
+        return self._parse(models.Registry.GarbageCollection, res["garbage_collection"])
 
     def garbage_collection(self, name: str) -> models.Registry.GarbageCollection:
         res = self._client.request(
             endpoint="registry/{name}/garbage-collection".format(name=name),
             method="get",
         )
-        return models.Registry.GarbageCollection(**res["garbage_collection"])
+        return self._parse(models.Registry.GarbageCollection, res["garbage_collection"])
 
 
 class AsyncRegistryManager(AsyncBaseManager):
@@ -134,7 +134,7 @@ class AsyncRegistryManager(AsyncBaseManager):
             endpoint="registry",
             method="get",
         )
-        return models.Registry(**res["registry"])
+        return self._parse(models.Registry, res["registry"])
 
     async def create(self, registry: models.Registry) -> models.Registry:
         raise DeprecationWarning(
@@ -147,11 +147,11 @@ class AsyncRegistryManager(AsyncBaseManager):
         res = await self._client.request(
             endpoint="registry",
             method="post",
-            data=registry.json(include={"name", "subscription_tier_slug"}),
+            data=self._dump(registry, include={"name", "subscription_tier_slug"}),
         )
         return (
-            models.Registry(**res["registry"]),
-            models.Registry.Subscription(**res["subscription"]),
+            self._parse(models.Registry, res["registry"]),
+            self._parse(models.Registry.Subscription, res["subscription"]),
         )
 
     async def delete(self, registry: models.Registry) -> None:
@@ -166,7 +166,7 @@ class AsyncRegistryManager(AsyncBaseManager):
             endpoint="registry",
             method="get",
         )
-        return models.Registry.Subscription(**res["subscription"])
+        return self._parse(models.Registry.Subscription, res["subscription"])
 
     async def docker_credentials(
         self, read_write: bool = None, expiry_seconds: int = None
@@ -195,7 +195,7 @@ class AsyncRegistryManager(AsyncBaseManager):
             endpoint="registry/{name}/repositories".format(name=name),
             key="repositories",
         )
-        return [models.Registry.Repository(**rep) for rep in res]
+        return [self._parse(models.Registry.Repository, rep) for rep in res]
 
     async def repository_tags(
         self, name: str, repository_name: str
@@ -207,7 +207,7 @@ class AsyncRegistryManager(AsyncBaseManager):
             key="tags",
         )
 
-        return [models.Registry.Repository.Tag(**tag) for tag in res]
+        return [self._parse(models.Registry.Repository.Tag, tag) for tag in res]
 
     async def delete_tag(self, name: str, repository_name: str, tag: str) -> None:
         await self._client.request(
@@ -238,11 +238,11 @@ class AsyncRegistryManager(AsyncBaseManager):
             method="post",
             json=json_param,
         )
-        return models.Registry.GarbageCollection(**res["garbage_collection"])
+        return self._parse(models.Registry.GarbageCollection, res["garbage_collection"])
 
     async def garbage_collection(self, name: str) -> models.Registry.GarbageCollection:
         res = await self._client.request(
             endpoint="registry/{name}/garbage-collection".format(name=name),
             method="get",
         )
-        return models.Registry.GarbageCollection(**res["garbage_collection"])
+        return self._parse(models.Registry.GarbageCollection, res["garbage_collection"])
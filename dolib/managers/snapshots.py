@@ -1,4 +1,4 @@
-from typing import List, Optional
+from typing import AsyncIterator, Iterable, Iterator, List, Optional
 
 from .. import models
 from .base import AsyncBaseManager, BaseManager
@@ -8,20 +8,49 @@ class SnapshotsManager(BaseManager):
     endpoint = "snapshots"
     name = "snapshots"
 
-    def all(self, resource_type: Optional[str] = None) -> List[models.Snapshot]:
+    def all(
+        self,
+        resource_type: Optional[str] = None,
+        max_workers: int = None,
+        validate: bool = None,
+    ) -> List[models.Snapshot]:
         params = dict()
         if resource_type is not None:
             params["resource_type"] = resource_type
         res = self._client.fetch_all(
-            endpoint="snapshots", key="snapshots", params=params
+            endpoint="snapshots",
+            key="snapshots",
+            params=params,
+            max_workers=max_workers,
         )
-        return [models.Snapshot(**snapshot) for snapshot in res]
+        return [self._parse(models.Snapshot, snapshot, validate) for snapshot in res]
+
+    def iter_all(
+        self, resource_type: Optional[str] = None, validate: bool = None
+    ) -> Iterator[models.Snapshot]:
+        params = dict()
+        if resource_type is not None:
+            params["resource_type"] = resource_type
+        for page in self._client.iter_pages(
+            endpoint="snapshots", key="snapshots", params=params
+        ):
+            for snapshot in page:
+                yield self._parse(models.Snapshot, snapshot, validate)
 
     def get(self, id: str) -> models.Snapshot:
         res = self._client.request(
             endpoint="snapshots/{id}".format(id=id), method="get"
         )
-        return models.Snapshot(**res["snapshot"])
+        return self._parse(models.Snapshot, res["snapshot"])
+
+    def get_many(
+        self, ids: Iterable[str], max_workers: int = None
+    ) -> List[models.Snapshot]:
+        res = self._client.fetch_many(
+            ["snapshots/{id}".format(id=id) for id in ids],
+            max_workers=max_workers,
+        )
+        return [self._parse(models.Snapshot, item["snapshot"]) for item in res]
 
     def delete(self, snapshot: models.Snapshot) -> None:
         self._client.request(
@@ -33,20 +62,43 @@ class AsyncSnapshotsManager(AsyncBaseManager):
     endpoint = "snapshots"
     name = "snapshots"
 
-    async def all(self, resource_type: Optional[str] = None) -> List[models.Snapshot]:
+    async def all(
+        self, resource_type: Optional[str] = None, validate: bool = None
+    ) -> List[models.Snapshot]:
         params = dict()
         if resource_type is not None:
             params["resource_type"] = resource_type
         res = await self._client.fetch_all(
             endpoint="snapshots", key="snapshots", params=params
         )
-        return [models.Snapshot(**snapshot) for snapshot in res]
+        return [self._parse(models.Snapshot, snapshot, validate) for snapshot in res]
+
+    async def iter_all(
+        self, resource_type: Optional[str] = None, validate: bool = None
+    ) -> AsyncIterator[models.Snapshot]:
+        params = dict()
+        if resource_type is not None:
+            params["resource_type"] = resource_type
+        async for page in self._client.iter_pages(
+            endpoint="snapshots", key="snapshots", params=params
+        ):
+            for snapshot in page:
+                yield self._parse(models.Snapshot, snapshot, validate)
 
     async def get(self, id: str) -> models.Snapshot:
         res = await self._client.request(
             endpoint="snapshots/{id}".format(id=id), method="get"
         )
-        return models.Snapshot(**res["snapshot"])
+        return self._parse(models.Snapshot, res["snapshot"])
+
+    async def get_many(
+        self, ids: Iterable[str], concurrency: int = None
+    ) -> List[models.Snapshot]:
+        res = await self._client.fetch_many(
+            ["snapshots/{id}".format(id=id) for id in ids],
+            concurrency=concurrency,
+        )
+        return [self._parse(models.Snapshot, item["snapshot"]) for item in res]
 
     async def delete(self, snapshot: models.Snapshot) -> None:
         await self._client.request(
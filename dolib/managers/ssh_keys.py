@@ -1,4 +1,4 @@
-from typing import List
+from typing import AsyncIterator, Iterable, Iterator, List
 
 from .. import models
 from .base import AsyncBaseManager, BaseManager
@@ -8,33 +8,51 @@ class SSHKeysManager(BaseManager):
     endpoint = "ssh_keys"
     name = "ssh_keys"
 
-    def all(self) -> List[models.SSHKey]:
-        res = self._client.fetch_all(endpoint="account/keys", key="ssh_keys")
-        return [models.SSHKey(**key) for key in res]
+    def all(
+        self, max_workers: int = None, validate: bool = None
+    ) -> List[models.SSHKey]:
+        res = self._client.fetch_all(
+            endpoint="account/keys", key="ssh_keys", max_workers=max_workers
+        )
+        return [self._parse(models.SSHKey, key, validate) for key in res]
+
+    def iter_all(self, validate: bool = None) -> Iterator[models.SSHKey]:
+        for page in self._client.iter_pages(endpoint="account/keys", key="ssh_keys"):
+            for key in page:
+                yield self._parse(models.SSHKey, key, validate)
 
     def get(self, id: str) -> models.SSHKey:
         res = self._client.request(
             endpoint="account/keys/{id}".format(id=id), method="get"
         )
-        return models.SSHKey(**res["ssh_key"])
+        return self._parse(models.SSHKey, res["ssh_key"])
+
+    def get_many(
+        self, ids: Iterable[str], max_workers: int = None
+    ) -> List[models.SSHKey]:
+        res = self._client.fetch_many(
+            ["account/keys/{id}".format(id=id) for id in ids],
+            max_workers=max_workers,
+        )
+        return [self._parse(models.SSHKey, item["ssh_key"]) for item in res]
 
     def create(self, key: models.SSHKey) -> models.SSHKey:
         assert isinstance(key, models.SSHKey), "key must be models.SSHKey type"
         res = self._client.request(
             endpoint="account/keys",
             method="post",
-            data=key.json(include={"name", "public_key"}),
+            data=self._dump(key, include={"name", "public_key"}),
         )
-        return models.SSHKey(**res["ssh_key"])
+        return self._parse(models.SSHKey, res["ssh_key"])
 
     def update(self, key: models.SSHKey) -> models.SSHKey:
         assert isinstance(key, models.SSHKey), "key must be models.SSHKey type"
         res = self._client.request(
             endpoint="account/keys/{id}".format(id=key.id),
             method="put",
-            data=key.json(include={"name"}),
+            data=self._dump(key, include={"name"}),
         )
-        return models.SSHKey(**res["ssh_key"])
+        return self._parse(models.SSHKey, res["ssh_key"])
 
     def delete(self, key: models.SSHKey) -> None:
         assert isinstance(key, models.SSHKey), "key must be models.SSHKey type"
@@ -47,33 +65,49 @@ class AsyncSSHKeysManager(AsyncBaseManager):
     endpoint = "ssh_keys"
     name = "ssh_keys"
 
-    async def all(self) -> List[models.SSHKey]:
+    async def all(self, validate: bool = None) -> List[models.SSHKey]:
         res = await self._client.fetch_all(endpoint="account/keys", key="ssh_keys")
-        return [models.SSHKey(**key) for key in res]
+        return [self._parse(models.SSHKey, key, validate) for key in res]
+
+    async def iter_all(self, validate: bool = None) -> AsyncIterator[models.SSHKey]:
+        async for page in self._client.iter_pages(
+            endpoint="account/keys", key="ssh_keys"
+        ):
+            for key in page:
+                yield self._parse(models.SSHKey, key, validate)
 
     async def get(self, id: str) -> models.SSHKey:
         res = await self._client.request(
             endpoint="account/keys/{id}".format(id=id), method="get"
         )
-        return models.SSHKey(**res["ssh_key"])
+        return self._parse(models.SSHKey, res["ssh_key"])
+
+    async def get_many(
+        self, ids: Iterable[str], concurrency: int = None
+    ) -> List[models.SSHKey]:
+        res = await self._client.fetch_many(
+            ["account/keys/{id}".format(id=id) for id in ids],
+            concurrency=concurrency,
+        )
+        return [self._parse(models.SSHKey, item["ssh_key"]) for item in res]
 
     async def create(self, key: models.SSHKey) -> models.SSHKey:
         assert isinstance(key, models.SSHKey), "key must be models.SSHKey type"
         res = await self._client.request(
             endpoint="account/keys",
             method="post",
-            data=key.json(include={"name", "public_key"}),
+            data=self._dump(key, include={"name", "public_key"}),
         )
-        return models.SSHKey(**res["ssh_key"])
+        return self._parse(models.SSHKey, res["ssh_key"])
 
     async def update(self, key: models.SSHKey) -> models.SSHKey:
         assert isinstance(key, models.SSHKey), "key must be models.SSHKey type"
         res = await self._client.request(
             endpoint="account/keys/{id}".format(id=key.id),
             method="put",
-            data=key.json(include={"name"}),
+            data=self._dump(key, include={"name"}),
         )
-        return models.SSHKey(**res["ssh_key"])
+        return self._parse(models.SSHKey, res["ssh_key"])
 
     async def delete(self, key: models.SSHKey) -> None:
         assert isinstance(key, models.SSHKey), "key must be models.SSHKey type"
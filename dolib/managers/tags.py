@@ -1,4 +1,4 @@
-from typing import List
+from typing import AsyncIterator, Iterable, Iterator, List
 
 from .. import models
 from .base import AsyncBaseManager, BaseManager
@@ -8,23 +8,39 @@ class TagsManager(BaseManager):
     endpoint = "tags"
     name = "tags"
 
-    def all(self) -> List[models.Tag]:
-        res = self._client.fetch_all(endpoint="tags", key="tags")
-        return [models.Tag(**tag) for tag in res]
+    def all(self, max_workers: int = None, validate: bool = None) -> List[models.Tag]:
+        res = self._client.fetch_all(
+            endpoint="tags", key="tags", max_workers=max_workers
+        )
+        return [self._parse(models.Tag, tag, validate) for tag in res]
+
+    def iter_all(self, validate: bool = None) -> Iterator[models.Tag]:
+        for page in self._client.iter_pages(endpoint="tags", key="tags"):
+            for tag in page:
+                yield self._parse(models.Tag, tag, validate)
 
     def get(self, name: str) -> models.Tag:
         res = self._client.request(
             endpoint="tags/{name}".format(name=name), method="get"
         )
-        return models.Tag(**res["tag"])
+        return self._parse(models.Tag, res["tag"])
+
+    def get_many(
+        self, names: Iterable[str], max_workers: int = None
+    ) -> List[models.Tag]:
+        res = self._client.fetch_many(
+            ["tags/{name}".format(name=name) for name in names],
+            max_workers=max_workers,
+        )
+        return [self._parse(models.Tag, item["tag"]) for item in res]
 
     def create(self, tag: models.Tag) -> models.Tag:
         res = self._client.request(
             endpoint="tags",
             method="post",
-            data=tag.json(include={"name"}),
+            data=self._dump(tag, include={"name"}),
         )
-        return models.Tag(**res["tag"])
+        return self._parse(models.Tag, res["tag"])
 
     def delete(self, tag: models.Tag) -> None:
         self._client.request(
@@ -57,23 +73,37 @@ class AsyncTagsManager(AsyncBaseManager):
     endpoint = "tags"
     name = "tags"
 
-    async def all(self) -> List[models.Tag]:
+    async def all(self, validate: bool = None) -> List[models.Tag]:
         res = await self._client.fetch_all(endpoint="tags", key="tags")
-        return [models.Tag(**tag) for tag in res]
+        return [self._parse(models.Tag, tag, validate) for tag in res]
+
+    async def iter_all(self, validate: bool = None) -> AsyncIterator[models.Tag]:
+        async for page in self._client.iter_pages(endpoint="tags", key="tags"):
+            for tag in page:
+                yield self._parse(models.Tag, tag, validate)
 
     async def get(self, name: str) -> models.Tag:
         res = await self._client.request(
             endpoint="tags/{name}".format(name=name), method="get"
         )
-        return models.Tag(**res["tag"])
+        return self._parse(models.Tag, res["tag"])
+
+    async def get_many(
+        self, names: Iterable[str], concurrency: int = None
+    ) -> List[models.Tag]:
+        res = await self._client.fetch_many(
+            ["tags/{name}".format(name=name) for name in names],
+            concurrency=concurrency,
+        )
+        return [self._parse(models.Tag, item["tag"]) for item in res]
 
     async def create(self, tag: models.Tag) -> models.Tag:
         res = await self._client.request(
             endpoint="tags",
             method="post",
-            data=tag.json(include={"name"}),
+            data=self._dump(tag, include={"name"}),
         )
-        return models.Tag(**res["tag"])
+        return self._parse(models.Tag, res["tag"])
 
     async def delete(self, tag: models.Tag) -> None:
         await self._client.request(
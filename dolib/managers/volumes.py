@@ -1,4 +1,4 @@
-from typing import List
+from typing import AsyncIterator, Iterable, Iterator, List
 
 from .. import models
 from .base import AsyncBaseManager, BaseManager
@@ -8,21 +8,39 @@ class VolumesManager(BaseManager):
     endpoint: str = "volumes"
     name: str = "volumes"
 
-    def all(self) -> List[models.Volume]:
-        res = self._client.fetch_all(endpoint="volumes", key="volumes")
-        return [models.Volume(**volume) for volume in res]
+    def all(
+        self, max_workers: int = None, validate: bool = None
+    ) -> List[models.Volume]:
+        res = self._client.fetch_all(
+            endpoint="volumes", key="volumes", max_workers=max_workers
+        )
+        return [self._parse(models.Volume, volume, validate) for volume in res]
+
+    def iter_all(self, validate: bool = None) -> Iterator[models.Volume]:
+        for page in self._client.iter_pages(endpoint="volumes", key="volumes"):
+            for volume in page:
+                yield self._parse(models.Volume, volume, validate)
 
     def get(self, id: str) -> models.Volume:
         res = self._client.request(endpoint="volumes/{id}".format(id=id), method="get")
-        return models.Volume(**res["volume"])
+        return self._parse(models.Volume, res["volume"])
+
+    def get_many(
+        self, ids: Iterable[str], max_workers: int = None
+    ) -> List[models.Volume]:
+        res = self._client.fetch_many(
+            ["volumes/{id}".format(id=id) for id in ids],
+            max_workers=max_workers,
+        )
+        return [self._parse(models.Volume, item["volume"]) for item in res]
 
     def create(self, volume: models.Volume) -> models.Volume:
         res = self._client.request(
             endpoint="volumes",
             method="post",
-            data=volume.json(),
+            data=self._dump(volume),
         )
-        return models.Volume(**res["volume"])
+        return self._parse(models.Volume, res["volume"])
 
     def delete(self, volume: models.Volume) -> None:
         self._client.request(
@@ -40,7 +58,7 @@ class VolumesManager(BaseManager):
             method="post",
             json=action,
         )
-        return models.Action(**res["action"])
+        return self._parse(models.Action, res["action"])
 
     def _droplet_action(
         self, action_type: str, volume: models.Volume, droplet_id: int
@@ -69,7 +87,7 @@ class VolumesManager(BaseManager):
             res = self._client.request(
                 endpoint="volumes/actions", method="post", json=action
             )
-        return models.Action(**res["action"])
+        return self._parse(models.Action, res["action"])
 
     def attach(self, volume: models.Volume, droplet_id: int) -> models.Action:
         return self._droplet_action("attach", volume, droplet_id)
@@ -81,45 +99,59 @@ class VolumesManager(BaseManager):
         res = self._client.fetch_all(
             endpoint="volumes/{id}/snapshots".format(id=id), key="snapshots"
         )
-        return [models.Snapshot(**snapshot) for snapshot in res]
+        return [self._parse(models.Snapshot, snapshot) for snapshot in res]
 
     def create_snapshot(self, id: str, snapshot: models.Snapshot) -> models.Snapshot:
 
         res = self._client.request(
             endpoint="volumes/{id}/snapshots".format(id=id),
             method="post",
-            data=snapshot.json(include={"name", "tags"}),
+            data=self._dump(snapshot, include={"name", "tags"}),
         )
-        return models.Snapshot(**res["snapshot"])
+        return self._parse(models.Snapshot, res["snapshot"])
 
     def actions(self, id: str) -> List[models.Action]:
         res = self._client.fetch_all(
             endpoint="volumes/{id}/actions".format(id=id), key="actions"
         )
-        return [models.Action(**action) for action in res]
+        return [self._parse(models.Action, action) for action in res]
 
 
 class AsyncVolumesManager(AsyncBaseManager):
     endpoint: str = "volumes"
     name: str = "volumes"
 
-    async def all(self) -> List[models.Volume]:
+    async def all(self, validate: bool = None) -> List[models.Volume]:
         res = await self._client.fetch_all(endpoint="volumes", key="volumes")
-        return [models.Volume(**volume) for volume in res]
+        return [self._parse(models.Volume, volume, validate) for volume in res]
+
+    async def iter_all(self, validate: bool = None) -> AsyncIterator[models.Volume]:
+        async for page in self._client.iter_pages(endpoint="volumes", key="volumes"):
+            for volume in page:
+                yield self._parse(models.Volume, volume, validate)
 
     async def get(self, id: str) -> models.Volume:
         res = await self._client.request(
             endpoint="volumes/{id}".format(id=id), method="get"
         )
-        return models.Volume(**res["volume"])
+        return self._parse(models.Volume, res["volume"])
+
+    async def get_many(
+        self, ids: Iterable[str], concurrency: int = None
+    ) -> List[models.Volume]:
+        res = await self._client.fetch_many(
+            ["volumes/{id}".format(id=id) for id in ids],
+            concurrency=concurrency,
+        )
+        return [self._parse(models.Volume, item["volume"]) for item in res]
 
     async def create(self, volume: models.Volume) -> models.Volume:
         res = await self._client.request(
             endpoint="volumes",
             method="post",
-            data=volume.json(),
+            data=self._dump(volume),
         )
-        return models.Volume(**res["volume"])
+        return self._parse(models.Volume, res["volume"])
 
     async def delete(self, volume: models.Volume) -> None:
         await self._client.request(
@@ -137,7 +169,7 @@ class AsyncVolumesManager(AsyncBaseManager):
             method="post",
             json=action,
         )
-        return models.Action(**res["action"])
+        return self._parse(models.Action, res["action"])
 
     async def _droplet_action(
         self, action_type: str, volume: models.Volume, droplet_id: int
@@ -166,7 +198,7 @@ class AsyncVolumesManager(AsyncBaseManager):
             res = await self._client.request(
                 endpoint="volumes/actions", method="post", json=action
             )
-        return models.Action(**res["action"])
+        return self._parse(models.Action, res["action"])
 
     async def attach(self, volume: models.Volume, droplet_id: int) -> models.Action:
         return await self._droplet_action("attach", volume, droplet_id)
@@ -178,7 +210,7 @@ class AsyncVolumesManager(AsyncBaseManager):
         res = await self._client.fetch_all(
             endpoint="volumes/{id}/snapshots".format(id=id), key="snapshots"
         )
-        return [models.Snapshot(**snapshot) for snapshot in res]
+        return [self._parse(models.Snapshot, snapshot) for snapshot in res]
 
     async def create_snapshot(
         self, id: str, snapshot: models.Snapshot
@@ -187,12 +219,12 @@ class AsyncVolumesManager(AsyncBaseManager):
         res = await self._client.request(
             endpoint="volumes/{id}/snapshots".format(id=id),
             method="post",
-            data=snapshot.json(include={"name", "tags"}),
+            data=self._dump(snapshot, include={"name", "tags"}),
         )
-        return models.Snapshot(**res["snapshot"])
+        return self._parse(models.Snapshot, res["snapshot"])
 
     async def actions(self, id: str) -> List[models.Action]:
         res = await self._client.fetch_all(
             endpoint="volumes/{id}/actions".format(id=id), key="actions"
         )
-        return [models.Action(**action) for action in res]
+        return [self._parse(models.Action, action) for action in res]
@@ -1,4 +1,4 @@
-from typing import List
+from typing import AsyncIterator, Iterable, Iterator, List
 
 from .. import models
 from .base import AsyncBaseManager, BaseManager
@@ -8,29 +8,43 @@ class VPCsManager(BaseManager):
     endpoint = "vpcs"
     name = "vpcs"
 
-    def all(self) -> List[models.VPC]:
-        res = self._client.fetch_all(endpoint="vpcs", key="vpcs")
-        return [models.VPC(**vpc) for vpc in res]
+    def all(self, max_workers: int = None, validate: bool = None) -> List[models.VPC]:
+        res = self._client.fetch_all(
+            endpoint="vpcs", key="vpcs", max_workers=max_workers
+        )
+        return [self._parse(models.VPC, vpc, validate) for vpc in res]
+
+    def iter_all(self, validate: bool = None) -> Iterator[models.VPC]:
+        for page in self._client.iter_pages(endpoint="vpcs", key="vpcs"):
+            for vpc in page:
+                yield self._parse(models.VPC, vpc, validate)
 
     def get(self, id: str) -> models.VPC:
         res = self._client.request(endpoint="vpcs/{id}".format(id=id), method="get")
-        return models.VPC(**res["vpc"])
+        return self._parse(models.VPC, res["vpc"])
+
+    def get_many(self, ids: Iterable[str], max_workers: int = None) -> List[models.VPC]:
+        res = self._client.fetch_many(
+            ["vpcs/{id}".format(id=id) for id in ids],
+            max_workers=max_workers,
+        )
+        return [self._parse(models.VPC, item["vpc"]) for item in res]
 
     def create(self, vpc: models.VPC) -> models.VPC:
         res = self._client.request(
             endpoint="vpcs",
             method="post",
-            data=vpc.json(include={"name", "description", "region", "ip_range"}),
+            data=self._dump(vpc, include={"name", "description", "region", "ip_range"}),
         )
-        return models.VPC(**res["vpc"])
+        return self._parse(models.VPC, res["vpc"])
 
     def update(self, vpc: models.VPC) -> models.VPC:
         res = self._client.request(
             endpoint="vpcs/{id}".format(id=vpc.id),
             method="put",
-            data=vpc.json(include={"name", "description", "default"}),
+            data=self._dump(vpc, include={"name", "description", "default"}),
         )
-        return models.VPC(**res["vpc"])
+        return self._parse(models.VPC, res["vpc"])
 
     def delete(self, vpc: models.VPC) -> None:
         self._client.request(endpoint="vpcs/{id}".format(id=vpc.id), method="delete")
@@ -39,38 +53,52 @@ class VPCsManager(BaseManager):
         res = self._client.fetch_all(
             endpoint="vpcs/{id}/members".format(id=id), key="members"
         )
-        return [models.VPC.Member(**member) for member in res]
+        return [self._parse(models.VPC.Member, member) for member in res]
 
 
 class AsyncVPCsManager(AsyncBaseManager):
     endpoint = "vpcs"
     name = "vpcs"
 
-    async def all(self) -> List[models.VPC]:
+    async def all(self, validate: bool = None) -> List[models.VPC]:
         res = await self._client.fetch_all(endpoint="vpcs", key="vpcs")
-        return [models.VPC(**vpc) for vpc in res]
+        return [self._parse(models.VPC, vpc, validate) for vpc in res]
+
+    async def iter_all(self, validate: bool = None) -> AsyncIterator[models.VPC]:
+        async for page in self._client.iter_pages(endpoint="vpcs", key="vpcs"):
+            for vpc in page:
+                yield self._parse(models.VPC, vpc, validate)
 
     async def get(self, id: str) -> models.VPC:
         res = await self._client.request(
             endpoint="vpcs/{id}".format(id=id), method="get"
         )
-        return models.VPC(**res["vpc"])
+        return self._parse(models.VPC, res["vpc"])
+
+    async def get_many(
+        self, ids: Iterable[str], concurrency: int = None
+    ) -> List[models.VPC]:
+        res = await self._client.fetch_many(
+            ["vpcs/{id}".format(id=id) for id in ids],
+            concurrency=concurrency,
+        )
+        return [self._parse(models.VPC, item["vpc"]) for item in res]
 
     async def create(self, vpc: models.VPC) -> models.VPC:
         res = await self._client.request(
             endpoint="vpcs",
             method="post",
-            data=vpc.json(include={"name", "description", "region", "ip_range"}),
+            data=self._dump(vpc, include={"name", "description", "region", "ip_range"}),
         )
-        return models.VPC(**res["vpc"])
+        return self._parse(models.VPC, res["vpc"])
 
     async def update(self, vpc: models.VPC) -> models.VPC:
         res = await self._client.request(
             endpoint="vpcs/{id}".format(id=vpc.id),
             method="put",
-            data=vpc.json(include={"name", "description", "default"}),
+            data=self._dump(vpc, include={"name", "description", "default"}),
         )
-        return models.VPC(**res["vpc"])
+        return self._parse(models.VPC, res["vpc"])
 
     async def delete(self, vpc: models.VPC) -> None:
         await self._client.request(
@@ -81,4 +109,4 @@ class AsyncVPCsManager(AsyncBaseManager):
         res = await self._client.fetch_all(
             endpoint="vpcs/{id}/members".format(id=id), key="members"
         )
-        return [models.VPC.Member(**member) for member in res]
+        return [self._parse(models.VPC.Member, member) for member in res]
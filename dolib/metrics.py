@@ -0,0 +1,229 @@
+import bisect
+import threading
+import typing as t
+from collections import defaultdict
+
+from .hooks import Hooks, PageEvent, RequestEvent, ResponseEvent, RetryEvent
+
+try:
+    from opentelemetry import trace
+except ImportError:  # pragma: no cover
+    trace = None  # type: ignore
+
+DURATION_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+Labels = t.Tuple[t.Tuple[str, str], ...]
+
+
+def _labels(**labels: t.Any) -> Labels:
+    return tuple(sorted((name, str(value)) for name, value in labels.items()))
+
+
+def _format_labels(labels: Labels) -> str:
+    if not labels:
+        return ""
+    return "{{{labels}}}".format(
+        labels=",".join(
+            '{name}="{value}"'.format(
+                name=name,
+                value=value.replace("\\", "\\\\")
+                .replace("\n", "\\n")
+                .replace('"', '\\"'),
+            )
+            for name, value in labels
+        )
+    )
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Histogram:
+    def __init__(self, buckets: t.Sequence[float]) -> None:
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+
+class PrometheusCollector(Hooks):
+    # aggregates client events, expose() renders prometheus text format
+    def __init__(
+        self, prefix: str = "dolib", buckets: t.Sequence[float] = DURATION_BUCKETS
+    ) -> None:
+        self.prefix = prefix
+        self.buckets = tuple(sorted(buckets))
+        self._lock = threading.Lock()
+        self._counters: t.Dict[str, t.Dict[Labels, float]] = defaultdict(
+            lambda: defaultdict(float)
+        )
+        self._histograms: t.Dict[Labels, Histogram] = {}
+        self._ratelimit_remaining: t.Optional[int] = None
+
+    def on_response(self, event: ResponseEvent) -> None:
+        labels = _labels(
+            method=event.method,
+            endpoint=event.endpoint,
+            status=event.status_code or "error",
+        )
+        endpoint = _labels(method=event.method, endpoint=event.endpoint)
+        with self._lock:
+            self._counters["requests_total"][labels] += 1
+            if event.cached:
+                self._counters["cached_responses_total"][endpoint] += 1
+                return
+            self._counters["request_bytes_total"][endpoint] += event.request_bytes
+            self._counters["response_bytes_total"][endpoint] += event.response_bytes
+            histogram = self._histograms.get(endpoint)
+            if histogram is None:
+                histogram = self._histograms[endpoint] = Histogram(self.buckets)
+            histogram.observe(event.elapsed)
+            if event.ratelimit_remaining is not None:
+                self._ratelimit_remaining = event.ratelimit_remaining
+
+    def on_retry(self, event: RetryEvent) -> None:
+        labels = _labels(
+            method=event.request.method,
+            endpoint=event.request.endpoint,
+            reason=event.reason,
+        )
+        with self._lock:
+            self._counters["retries_total"][labels] += 1
+
+    def on_page(self, event: PageEvent) -> None:
+        labels = _labels(endpoint=event.endpoint)
+        with self._lock:
+            self._counters["pages_total"][labels] += 1
+            self._counters["page_items_total"][labels] += event.items
+
+    def requests(self, **labels: t.Any) -> float:
+        # sum of requests_total matching labels, e.g. requests(endpoint="droplets")
+        wanted = set(_labels(**labels))
+        with self._lock:
+            return sum(
+                value
+                for key, value in self._counters["requests_total"].items()
+                if wanted <= set(key)
+            )
+
+    def expose(self) -> str:
+        name = self.prefix + "_{metric}"
+        lines: t.List[str] = []
+        with self._lock:
+            for metric, help_text in [
+                ("requests_total", "Requests by method, endpoint and status."),
+                ("cached_responses_total", "Responses served from cache."),
+                ("request_bytes_total", "Bytes of request bodies."),
+                ("response_bytes_total", "Bytes of responses received."),
+                ("retries_total", "Retries by method, endpoint and reason."),
+                ("pages_total", "Pages fetched by paginated requests."),
+                ("page_items_total", "Items of pages fetched."),
+            ]:
+                values = self._counters.get(metric)
+                if not values:
+                    continue
+                lines.append(
+                    "# HELP {0} {1}".format(name.format(metric=metric), help_text)
+                )
+                lines.append("# TYPE {0} counter".format(name.format(metric=metric)))
+                for labels, value in sorted(values.items()):
+                    lines.append(
+                        "{metric}{labels} {value}".format(
+                            metric=name.format(metric=metric),
+                            labels=_format_labels(labels),
+                            value=_format_value(value),
+                        )
+                    )
+
+            if self._histograms:
+                metric = name.format(metric="request_duration_seconds")
+                lines.append("# HELP {0} Request latency.".format(metric))
+                lines.append("# TYPE {0} histogram".format(metric))
+                for labels, histogram in sorted(self._histograms.items()):
+                    cumulative = 0
+                    for bound, count in zip(
+                        histogram.buckets + (float("inf"),), histogram.counts
+                    ):
+                        cumulative += count
+                        lines.append(
+                            "{metric}_bucket{labels} {value}".format(
+                                metric=metric,
+                                labels=_format_labels(
+                                    labels + (("le", _format_value(bound)),)
+                                ),
+                                value=cumulative,
+                            )
+                        )
+                    lines.append(
+                        "{metric}_sum{labels} {value}".format(
+                            metric=metric,
+                            labels=_format_labels(labels),
+                            value=_format_value(histogram.sum),
+                        )
+                    )
+                    lines.append(
+                        "{metric}_count{labels} {value}".format(
+                            metric=metric,
+                            labels=_format_labels(labels),
+                            value=histogram.count,
+                        )
+                    )
+
+            if self._ratelimit_remaining is not None:
+                metric = name.format(metric="ratelimit_remaining")
+                lines.append("# HELP {0} Requests left in API budget.".format(metric))
+                lines.append("# TYPE {0} gauge".format(metric))
+                lines.append(
+                    "{metric} {value}".format(
+                        metric=metric, value=self._ratelimit_remaining
+                    )
+                )
+        return "\n".join(lines) + "\n" if lines else ""
+
+
+class OpenTelemetryHooks(Hooks):
+    # client span per request attempt, needs opentelemetry-api
+    def __init__(self, tracer: t.Any = None) -> None:
+        if tracer is None:
+            if trace is None:
+                raise ValueError("opentelemetry-api is not installed")
+            tracer = trace.get_tracer("dolib")
+        self.tracer = tracer
+
+    def on_request(self, event: RequestEvent) -> None:
+        span = self.tracer.start_span(
+            "{method} {endpoint}".format(method=event.method, endpoint=event.endpoint),
+            attributes={
+                "http.method": event.method,
+                "http.url": event.url,
+                "http.route": event.endpoint,
+                "http.retry_count": event.attempt,
+            },
+        )
+        event.context["otel_span"] = span
+
+    def on_response(self, event: ResponseEvent) -> None:
+        span = event.request.context.pop("otel_span", None)
+        if span is None:
+            return
+        if event.status_code is not None:
+            span.set_attribute("http.status_code", event.status_code)
+        span.set_attribute("http.request_content_length", event.request_bytes)
+        span.set_attribute("http.response_content_length", event.response_bytes)
+        span.set_attribute("dolib.cached", event.cached)
+        if event.ratelimit_remaining is not None:
+            span.set_attribute("dolib.ratelimit_remaining", event.ratelimit_remaining)
+        if event.error is not None:
+            span.record_exception(event.error)
+        failed = event.error is not None or (event.status_code or 0) >= 400
+        if failed and trace is not None:
+            span.set_status(trace.Status(trace.StatusCode.ERROR))
+        span.end()
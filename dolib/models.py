@@ -1,9 +1,23 @@
+import copy
 import uuid
 from datetime import datetime
 from decimal import Decimal
-from typing import Any, Dict, List, Optional, Union
-
-from pydantic import BaseModel, EmailStr, validator
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
+
+from pydantic import BaseModel, EmailStr, ValidationError, validator
+from pydantic.error_wrappers import ErrorWrapper
+from pydantic.errors import MissingError
+from pydantic.fields import ModelField
 
 
 class Region(BaseModel):
@@ -54,6 +68,30 @@ class Action(BaseModel):
     region_slug: Optional[str]
 
 
+class ActionWaitResult(BaseModel):
+    completed: List[Action]
+    errored: List[Action]
+    pending: List[Action]
+
+    @property
+    def ok(self) -> bool:
+        return not self.errored and not self.pending
+
+
+class BulkActionResult(BaseModel):
+    class Error(BaseModel):
+        id: str
+        message: str
+        status_code: Optional[int]
+
+    actions: List[Action]
+    errors: List[Error]
+
+    @property
+    def ok(self) -> bool:
+        return not self.errors
+
+
 class Balance(BaseModel):
     month_to_date_balance: Decimal
     account_balance: Decimal
@@ -220,6 +258,34 @@ class Domain(BaseModel):
     zone_file: Optional[str]
 
 
+class DomainSyncResult(BaseModel):
+    class Update(BaseModel):
+        before: Domain.Record
+        after: Domain.Record
+
+    class Error(BaseModel):
+        action: str
+        record: Domain.Record
+        message: str
+        status_code: Optional[int]
+
+    create: List[Domain.Record]
+    update: List[Update]
+    delete: List[Domain.Record]
+    unchanged: int
+    # changes were only planned, not applied
+    dry_run: bool
+    errors: List[Error]
+
+    @property
+    def changes(self) -> int:
+        return len(self.create) + len(self.update) + len(self.delete)
+
+    @property
+    def ok(self) -> bool:
+        return not self.errors
+
+
 class Droplet(BaseModel):
     class Size(BaseModel):
         slug: str
@@ -577,3 +643,149 @@ class VPC(BaseModel):
     description: Optional[str]
     default: Optional[bool]
     created_at: Optional[datetime]
+
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+
+def _type_candidates(type_: Any) -> Tuple[Any, ...]:
+    if getattr(type_, "__origin__", None) is Union:
+        return type_.__args__
+    return (type_,)
+
+
+def _converter(
+    type_: Any, build: Callable[[Any, Dict[str, Any]], Any] = None
+) -> Optional[Callable[[Any], Any]]:
+    # function which builds nested models of type_ or None if there are none
+    build = build or construct
+    model, item_converter = None, None
+    for candidate in _type_candidates(type_):
+        if isinstance(candidate, type) and issubclass(candidate, BaseModel):
+            model = model or candidate
+        elif getattr(candidate, "__origin__", None) in (list, List):
+            item_converter = item_converter or _converter(candidate.__args__[0], build)
+    if model is None and item_converter is None:
+        return None
+
+    def convert(value: Any) -> Any:
+        if model is not None and isinstance(value, dict):
+            return build(model, value)
+        if item_converter is not None and isinstance(value, list):
+            return [item_converter(item) for item in value]
+        return value
+
+    return convert
+
+
+_construct_fields: Dict[type, List[Tuple[str, Any, Any]]] = {}
+
+
+def construct(model: Type[ModelT], data: Dict[str, Any]) -> ModelT:
+    # build model from trusted API data without validation, nested models are
+    # constructed too but values are not converted (e.g. datetimes stay strings)
+    fields = _construct_fields.get(model)
+    if fields is None:
+        fields = _construct_fields[model] = [
+            (name, _converter(field.outer_type_), field.get_default())
+            for name, field in model.__fields__.items()
+        ]
+
+    values = {}
+    fields_set = set()
+    for name, converter, default in fields:
+        if name in data:
+            value = data[name]
+            values[name] = value if converter is None else converter(value)
+            fields_set.add(name)
+        else:
+            values[name] = default
+    obj = model.__new__(model)
+    object.__setattr__(obj, "__dict__", values)
+    object.__setattr__(obj, "__fields_set__", fields_set)
+    return obj
+
+
+class LazyModel(BaseModel):
+    # keeps raw API data and validates fields on first access
+    __slots__ = ("__raw__",)
+
+    def __getattr__(self, name: str) -> Any:
+        try:
+            raw = object.__getattribute__(self, "__raw__")
+            field = self.__fields__[name]
+        except (AttributeError, KeyError):
+            raise AttributeError(
+                "{model!r} object has no attribute {name!r}".format(
+                    model=self.__class__.__name__, name=name
+                )
+            ) from None
+        value = _lazy_field(self.__class__, field, raw)
+        self.__dict__[name] = value
+        return value
+
+    def _materialize(self) -> None:
+        if len(self.__dict__) < len(self.__fields__):
+            values = {name: getattr(self, name) for name in self.__fields__}
+            object.__setattr__(self, "__dict__", values)
+
+    def _iter(self, *args: Any, **kwargs: Any) -> Any:
+        self._materialize()
+        return super()._iter(*args, **kwargs)
+
+    def __repr_args__(self) -> Any:
+        self._materialize()
+        return super().__repr_args__()
+
+    def _copy_and_set_values(self, values: Any, fields_set: Any, *, deep: bool) -> Any:
+        # copies (e.g. made when nested in another model) keep the raw data,
+        # fields not accessed yet stay lazy
+        obj = super()._copy_and_set_values(values, fields_set, deep=deep)
+        raw = object.__getattribute__(self, "__raw__")
+        object.__setattr__(obj, "__raw__", copy.deepcopy(raw) if deep else raw)
+        return obj
+
+    def __reduce__(self) -> Any:
+        # pickled as the plain model
+        self._materialize()
+        model = self.__class__.__bases__[1]
+        return construct, (model, self.__dict__)
+
+
+_lazy_models: Dict[type, Type[BaseModel]] = {}
+_lazy_converters: Dict[Any, Optional[Callable[[Any], Any]]] = {}
+
+
+def _lazy_field(model: type, field: ModelField, raw: Dict[str, Any]) -> Any:
+    if field.alias not in raw:
+        if field.required:
+            raise ValidationError(
+                [ErrorWrapper(MissingError(), loc=field.alias)], model
+            )
+        return field.get_default()
+
+    value = raw[field.alias]
+    if field not in _lazy_converters:
+        _lazy_converters[field] = _converter(field.outer_type_, lazy)
+    converter = _lazy_converters[field]
+    if converter is not None:
+        return converter(value)
+
+    value, errors = field.validate(value, raw, loc=field.alias, cls=model)
+    if errors:
+        raise ValidationError([errors], model)
+    return value
+
+
+def lazy(model: Type[ModelT], data: Dict[str, Any]) -> ModelT:
+    # build model which parses and validates fields from data on first access
+    lazy_model = _lazy_models.get(model)
+    if lazy_model is None:
+        lazy_model = _lazy_models[model] = type(model.__name__, (LazyModel, model), {})
+        lazy_model.__module__ = model.__module__
+        lazy_model.__qualname__ = model.__qualname__
+    obj: Any = lazy_model.__new__(lazy_model)
+    object.__setattr__(obj, "__dict__", {})
+    object.__setattr__(obj, "__fields_set__", set(model.__fields__) & set(data))
+    object.__setattr__(obj, "__raw__", data)
+    return obj
@@ -0,0 +1,100 @@
+import threading
+import time
+import typing as t
+from collections import deque
+
+
+class RateLimiter:
+    # Digital Ocean allows 5000 requests per hour and 250 requests per minute
+    def __init__(
+        self,
+        limit: int = 5000,
+        period: float = 3600.0,
+        burst: int = 250,
+        slowdown: float = 0.1,
+        minute_limit: t.Optional[int] = 250,
+    ) -> None:
+        self.limit = limit
+        self.period = period
+        self.burst = burst
+        # cap of requests in any 60 seconds, the token bucket alone lets
+        # burst plus the refill of a minute through
+        self.minute_limit = minute_limit
+        # share of the limit below which requests are spread until the reset
+        self.slowdown = slowdown
+
+        # limit reported by the API, some endpoints have their own limits
+        self._limit = limit
+        self._remaining: t.Optional[int] = None
+        self._reset: t.Optional[float] = None
+        # theoretical arrival time of the next request (GCRA token bucket)
+        self._tat = 0.0
+        # send times of the last minute_limit requests
+        self._sent: t.Deque[float] = deque(maxlen=minute_limit)
+        self._lock = threading.Lock()
+
+    @property
+    def remaining(self) -> t.Optional[int]:
+        return self._remaining
+
+    def update(
+        self,
+        limit: t.Optional[int] = None,
+        remaining: t.Optional[int] = None,
+        reset: t.Optional[float] = None,
+    ) -> None:
+        with self._lock:
+            if limit is not None and limit > 0:
+                self._limit = limit
+            if remaining is not None:
+                self._remaining = remaining
+            if reset is not None:
+                self._reset = reset
+
+    def reserve(self) -> float:
+        # take one request slot and return how long to wait before sending it
+        with self._lock:
+            now = time.monotonic()
+            interval = self.period / self.limit
+            tolerance = (self.burst - 1) * interval
+            not_before = now
+
+            if self._remaining is not None and self._reset is not None:
+                until_reset = self._reset - time.time()
+                if until_reset <= 0:
+                    # window is over, wait for fresh headers
+                    self._remaining = None
+                    self._reset = None
+                elif self._remaining <= 0:
+                    # budget is exhausted, queue until the window resets
+                    not_before = now + until_reset
+                    tolerance = 0.0
+                elif self._remaining < self._limit * self.slowdown:
+                    # spread the rest of the budget until the reset
+                    interval = max(interval, until_reset / self._remaining)
+                    tolerance = 0.0
+                if self._remaining is not None:
+                    self._remaining -= 1
+
+            tat = max(self._tat, not_before)
+            send_at = max(tat - tolerance, now)
+            self._tat = tat + interval
+            if self.minute_limit:
+                if self._sent:
+                    send_at = max(send_at, self._sent[-1])
+                if len(self._sent) == self.minute_limit:
+                    send_at = max(send_at, self._sent[0] + 60.0)
+                self._sent.append(send_at)
+            return send_at - now
+
+    def wait(self) -> None:
+        delay = self.reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+    async def async_wait(self) -> None:
+        import asyncio
+
+        delay = self.reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
@@ -0,0 +1,67 @@
+import random
+import time
+import typing as t
+from email.utils import parsedate_to_datetime
+
+import httpx
+
+
+class Retry:
+    IDEMPOTENT_METHODS = frozenset(["get", "head", "put", "delete", "options"])
+    RETRY_STATUSES = frozenset([429, 500, 502, 503, 504])
+
+    def __init__(
+        self,
+        total: int = 3,
+        backoff_factor: float = 0.5,
+        max_backoff: float = 60.0,
+        jitter: float = 0.5,
+        methods: t.Iterable[str] = IDEMPOTENT_METHODS,
+        statuses: t.Iterable[int] = RETRY_STATUSES,
+        respect_retry_after: bool = True,
+    ) -> None:
+        self.total = total
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        # part of the backoff which is randomized, from 0 to 1
+        self.jitter = jitter
+        self.methods = frozenset(method.lower() for method in methods)
+        self.statuses = frozenset(statuses)
+        self.respect_retry_after = respect_retry_after
+
+    def is_retryable(
+        self,
+        method: str,
+        attempt: int,
+        response: httpx.Response = None,
+        exc: Exception = None,
+    ) -> bool:
+        if attempt >= self.total or method.lower() not in self.methods:
+            return False
+        if exc is not None:
+            return isinstance(exc, httpx.TransportError)
+        return response is not None and response.status_code in self.statuses
+
+    def get_backoff(self, attempt: int, response: httpx.Response = None) -> float:
+        if self.respect_retry_after and response is not None:
+            retry_after = self.parse_retry_after(response)
+            if retry_after is not None:
+                return min(retry_after, self.max_backoff)
+
+        backoff = min(self.backoff_factor * pow(2, attempt), self.max_backoff)
+        return backoff * (1 - self.jitter * random.random())
+
+    @staticmethod
+    def parse_retry_after(response: httpx.Response) -> t.Optional[float]:
+        value = response.headers.get("Retry-After")
+        if value is None:
+            return None
+        try:
+            return max(float(value), 0.0)
+        except ValueError:
+            pass
+        try:
+            date = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        return max(date.timestamp() - time.time(), 0.0)
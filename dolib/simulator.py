@@ -0,0 +1,391 @@
+import asyncio
+import datetime
+import gzip
+import json
+import math
+import random
+import re
+import threading
+import time
+import typing as t
+import uuid
+from collections import OrderedDict
+
+import httpx
+
+# collection path: (list key, item key, id field, id type)
+COLLECTIONS = {
+    "droplets": ("droplets", "droplet", "id", int),
+    "volumes": ("volumes", "volume", "id", str),
+    "images": ("images", "image", "id", int),
+    "snapshots": ("snapshots", "snapshot", "id", str),
+    "tags": ("tags", "tag", "name", None),
+    "domains": ("domains", "domain", "name", None),
+    "firewalls": ("firewalls", "firewall", "id", str),
+    "floating_ips": ("floating_ips", "floating_ip", "ip", None),
+    "load_balancers": ("load_balancers", "load_balancer", "id", str),
+    "vpcs": ("vpcs", "vpc", "id", str),
+    "certificates": ("certificates", "certificate", "id", str),
+    "cdn/endpoints": ("endpoints", "endpoint", "id", str),
+    "projects": ("projects", "project", "id", str),
+    "account/keys": ("ssh_keys", "ssh_key", "id", int),
+    "kubernetes/clusters": ("kubernetes_clusters", "kubernetes_cluster", "id", str),
+    "databases": ("databases", "database", "id", str),
+    "actions": ("actions", "action", "id", int),
+    "regions": ("regions", "region", "slug", None),
+    "sizes": ("sizes", "size", "slug", None),
+}
+RECORDS = ("domain_records", "domain_record", "id", int)
+
+ROUTE = re.compile(
+    r"^/v2/(?P<collection>{collections}|domains/[^/]+/records)"
+    r"(?:/(?P<id>[^/]+)(?:/(?P<sub>actions|resources)(?:/(?P<sub_id>\d+))?)?)?$".format(
+        collections="|".join(
+            re.escape(name) for name in sorted(COLLECTIONS, key=len, reverse=True)
+        )
+    )
+)
+
+NOT_FOUND = "The resource you were accessing could not be found."
+
+ACCOUNT = {
+    "droplet_limit": 25,
+    "floating_ip_limit": 3,
+    "volume_limit": 10,
+    "email": "simulator@example.com",
+    "uuid": "b6fr89dbf6d9156cace5f3c78dc9851d957381ef",
+    "email_verified": True,
+    "status": "active",
+    "status_message": "",
+}
+
+
+def _now() -> str:
+    return datetime.datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+class Failure:
+    def __init__(
+        self, pattern: str, status_code: int, times: int, retry_after: float = None
+    ) -> None:
+        self.pattern = re.compile(pattern)
+        self.status_code = status_code
+        self.times = times
+        self.retry_after = retry_after
+
+
+class Simulator(httpx.BaseTransport, httpx.AsyncBaseTransport):
+    # in-process DigitalOcean API for load tests, pass it as client transport
+    def __init__(
+        self,
+        latency: t.Union[float, t.Callable[[], float]] = 0.0,
+        ratelimit: t.Optional[int] = 5000,
+        ratelimit_period: float = 3600.0,
+        error_rate: float = 0.0,
+        error_status: int = 503,
+        action_duration: float = 0.0,
+        compression: bool = True,
+        bandwidth: float = None,
+        seed: int = None,
+    ) -> None:
+        self.latency = latency
+        self.ratelimit = ratelimit
+        self.ratelimit_period = ratelimit_period
+        # share of requests which fail randomly with error_status
+        self.error_rate = error_rate
+        self.error_status = error_status
+        # seconds before created actions are completed
+        self.action_duration = action_duration
+        # gzip responses if client accepts it
+        self.compression = compression
+        # bytes per second, adds transfer time of response bodies to latency
+        self.bandwidth = bandwidth
+        self.requests = 0
+        self.bytes_sent = 0
+
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._collections: t.Dict[str, "OrderedDict[t.Any, t.Dict[str, t.Any]]"] = {}
+        self._next_id = 1
+        self._failures: t.List[Failure] = []
+        self._action_done: t.Dict[int, float] = {}
+        self._ratelimit_remaining = ratelimit
+        self._ratelimit_reset = time.time() + ratelimit_period
+
+    def add(self, collection: str, item: t.Dict[str, t.Any]) -> t.Dict[str, t.Any]:
+        # store item in collection like "droplets" or "domains/<name>/records"
+        with self._lock:
+            return self._add(collection, dict(item))
+
+    def items(self, collection: str) -> t.List[t.Dict[str, t.Any]]:
+        with self._lock:
+            return list(self._collections.get(collection, {}).values())
+
+    def fail(
+        self,
+        pattern: str = ".*",
+        status_code: int = 500,
+        times: int = 1,
+        retry_after: float = None,
+    ) -> None:
+        # next requests matching "<METHOD> <path>" fail with status code
+        with self._lock:
+            self._failures.append(Failure(pattern, status_code, times, retry_after))
+
+    def _spec(self, collection: str) -> t.Tuple[str, str, str, t.Any]:
+        return COLLECTIONS.get(collection, RECORDS)
+
+    def _add(self, collection: str, item: t.Dict[str, t.Any]) -> t.Dict[str, t.Any]:
+        _, _, id_field, id_type = self._spec(collection)
+        if item.get(id_field) is None:
+            if id_type is int:
+                item[id_field] = self._next_id
+                self._next_id += 1
+            elif id_type is str:
+                item[id_field] = str(uuid.uuid4())
+        item.setdefault("created_at", _now())
+        self._collections.setdefault(collection, OrderedDict())[
+            str(item[id_field])
+        ] = item
+        return item
+
+    def _action(
+        self, type: str, resource_id: t.Any, resource_type: str
+    ) -> t.Dict[str, t.Any]:
+        action = self._add(
+            "actions",
+            {
+                "status": "in-progress",
+                "type": type,
+                "started_at": _now(),
+                "completed_at": None,
+                "resource_id": resource_id if isinstance(resource_id, int) else None,
+                "resource_type": resource_type,
+                "region_slug": None,
+            },
+        )
+        self._action_done[action["id"]] = time.monotonic() + self.action_duration
+        self._update_action(action)
+        return action
+
+    def _update_action(self, action: t.Dict[str, t.Any]) -> None:
+        done = self._action_done.get(action["id"])
+        if done is not None and time.monotonic() >= done:
+            action["status"] = "completed"
+            action["completed_at"] = _now()
+            del self._action_done[action["id"]]
+
+    def _ratelimit_headers(self) -> t.Dict[str, str]:
+        if self.ratelimit is None:
+            return {}
+        now = time.time()
+        if now >= self._ratelimit_reset:
+            self._ratelimit_remaining = self.ratelimit
+            self._ratelimit_reset = now + self.ratelimit_period
+        self._ratelimit_remaining = max(self._ratelimit_remaining - 1, -1)
+        return {
+            "Ratelimit-Limit": str(self.ratelimit),
+            "Ratelimit-Remaining": str(max(self._ratelimit_remaining, 0)),
+            "Ratelimit-Reset": str(math.ceil(self._ratelimit_reset)),
+        }
+
+    @staticmethod
+    def _error(status_code: int, message: str) -> t.Tuple[int, t.Any]:
+        error_id = {
+            404: "not_found",
+            405: "method_not_allowed",
+            429: "too_many_requests",
+        }.get(status_code, "server_error" if status_code >= 500 else "unprocessable")
+        return status_code, {"id": error_id, "message": message}
+
+    def _failure(self, request: httpx.Request) -> t.Optional[Failure]:
+        target = "{method} {path}".format(method=request.method, path=request.url.path)
+        for failure in self._failures:
+            if failure.pattern.search(target):
+                failure.times -= 1
+                if failure.times <= 0:
+                    self._failures.remove(failure)
+                return failure
+        return None
+
+    def _handle(self, request: httpx.Request) -> httpx.Response:
+        with self._lock:
+            self.requests += 1
+            headers = self._ratelimit_headers()
+            failure = self._failure(request)
+            if failure is not None:
+                if failure.retry_after is not None:
+                    headers["Retry-After"] = str(failure.retry_after)
+                status_code, body = self._error(
+                    failure.status_code, "Injected failure."
+                )
+            elif self.ratelimit is not None and self._ratelimit_remaining < 0:
+                status_code, body = self._error(429, "API Rate limit exceeded.")
+            elif self.error_rate and self._random.random() < self.error_rate:
+                status_code, body = self._error(self.error_status, "Random failure.")
+            else:
+                status_code, body = self._dispatch(request)
+
+        if body is None:
+            return httpx.Response(status_code, headers=headers, request=request)
+        headers["Content-Type"] = "application/json"
+        content = json.dumps(body).encode("utf-8")
+        if self.compression and "gzip" in request.headers.get("Accept-Encoding", ""):
+            headers["Content-Encoding"] = "gzip"
+            content = gzip.compress(content, compresslevel=6)
+        headers["Content-Length"] = str(len(content))
+        with self._lock:
+            self.bytes_sent += len(content)
+        # stream is read by the client, which counts downloaded bytes
+        return httpx.Response(
+            status_code,
+            headers=headers,
+            stream=httpx.ByteStream(content),
+            request=request,
+        )
+
+    def _dispatch(self, request: httpx.Request) -> t.Tuple[int, t.Any]:
+        if request.url.path == "/v2/account":
+            return 200, {"account": ACCOUNT}
+        match = ROUTE.match(request.url.path)
+        if match is None:
+            return self._error(404, NOT_FOUND)
+        collection, id, sub, sub_id = match.group("collection", "id", "sub", "sub_id")
+        list_key, item_key, id_field, _ = self._spec(collection)
+        items = self._collections.setdefault(collection, OrderedDict())
+        method = request.method
+        data = json.loads(request.content) if request.content else {}
+
+        if id is None:
+            if method == "GET":
+                return 200, self._list(
+                    request, collection, list_key, list(items.values())
+                )
+            if method == "POST":
+                return 201, {item_key: self._add(collection, data)}
+            return self._error(405, "Method not allowed.")
+
+        if collection == "droplets" and id == "actions":
+            return self._bulk_action(request, data)
+
+        item = items.get(id)
+        if item is None:
+            return self._error(404, NOT_FOUND)
+
+        if sub == "actions":
+            resource_type = item_key
+            if method == "POST":
+                action = self._action(
+                    data.get("type", "unknown"), item.get(id_field), resource_type
+                )
+                return 201, {"action": action}
+            actions = [
+                action
+                for action in self._collections.get("actions", {}).values()
+                if action["resource_id"] == item.get(id_field)
+                and action["resource_type"] == resource_type
+            ]
+            if sub_id is not None:
+                found = [action for action in actions if str(action["id"]) == sub_id]
+                if not found:
+                    return self._error(404, NOT_FOUND)
+                self._update_action(found[0])
+                return 200, {"action": found[0]}
+            for action in actions:
+                self._update_action(action)
+            return 200, self._list(request, "actions", "actions", actions[::-1])
+        if sub == "resources":
+            return 204, None
+
+        if method == "GET":
+            if collection == "actions":
+                self._update_action(item)
+            return 200, {item_key: item}
+        if method in ("PUT", "PATCH"):
+            item.update(data)
+            return 200, {item_key: item}
+        if method == "DELETE":
+            del items[id]
+            return 204, None
+        return self._error(405, "Method not allowed.")
+
+    def _bulk_action(
+        self, request: httpx.Request, data: t.Dict[str, t.Any]
+    ) -> t.Tuple[int, t.Any]:
+        tag_name = request.url.params.get("tag_name")
+        droplets = [
+            droplet
+            for droplet in self._collections.get("droplets", {}).values()
+            if tag_name in (droplet.get("tags") or [])
+        ]
+        actions = [
+            self._action(data.get("type", "unknown"), droplet["id"], "droplet")
+            for droplet in droplets
+        ]
+        return 201, {"actions": actions}
+
+    def _list(
+        self,
+        request: httpx.Request,
+        collection: str,
+        key: str,
+        items: t.List[t.Dict[str, t.Any]],
+    ) -> t.Dict[str, t.Any]:
+        params = request.url.params
+        if collection == "actions" and request.url.path == "/v2/actions":
+            # newest actions first like the API
+            items = items[::-1]
+            for action in items:
+                self._update_action(action)
+        if "tag_name" in params:
+            items = [
+                item for item in items if params["tag_name"] in (item.get("tags") or [])
+            ]
+        if "type" in params:
+            items = [item for item in items if item.get("type") == params["type"]]
+
+        page = max(int(params.get("page", 1)), 1)
+        per_page = min(max(int(params.get("per_page", 20)), 1), 200)
+        last = max((len(items) - 1) // per_page + 1, 1)
+        pages = {}
+        if page > 1:
+            pages["first"] = str(request.url.copy_set_param("page", 1))
+            pages["prev"] = str(request.url.copy_set_param("page", page - 1))
+        if page < last:
+            pages["next"] = str(request.url.copy_set_param("page", page + 1))
+            pages["last"] = str(request.url.copy_set_param("page", last))
+        start = (page - 1) * per_page
+        end = start + per_page
+        return {
+            key: items[start:end],
+            "links": {"pages": pages},
+            "meta": {"total": len(items)},
+        }
+
+    def _latency(self) -> float:
+        return self.latency() if callable(self.latency) else self.latency
+
+    def _transfer_time(self, response: httpx.Response) -> float:
+        if not self.bandwidth:
+            return 0.0
+        return int(response.headers.get("Content-Length", 0)) / self.bandwidth
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        latency = self._latency()
+        if latency > 0:
+            time.sleep(latency)
+        response = self._handle(request)
+        transfer_time = self._transfer_time(response)
+        if transfer_time > 0:
+            time.sleep(transfer_time)
+        return response
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        latency = self._latency()
+        if latency > 0:
+            await asyncio.sleep(latency)
+        response = self._handle(request)
+        transfer_time = self._transfer_time(response)
+        if transfer_time > 0:
+            await asyncio.sleep(transfer_time)
+        return response
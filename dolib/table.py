@@ -0,0 +1,229 @@
+import calendar
+import time
+import typing as t
+from array import array
+from itertools import compress
+from operator import itemgetter
+
+# columns stored as arrays of numbers
+NUMERIC_COLUMNS = {"id": "q", "memory": "q", "vcpus": "q", "disk": "q"}
+# columns of repeated strings stored as codes in array and a list of values
+CATEGORY_COLUMNS = ("size_slug", "region", "status")
+
+Value = t.Union[str, int, float, None]
+Condition = t.Union[Value, t.Callable[[t.Any], bool]]
+
+
+def _timestamp(value: t.Optional[str]) -> float:
+    if not value:
+        return float("nan")
+    return float(calendar.timegm(time.strptime(value[:19], "%Y-%m-%dT%H:%M:%S")))
+
+
+def _slug(value: t.Any) -> t.Optional[str]:
+    if isinstance(value, dict):
+        return value.get("slug")
+    return value
+
+
+def _picker(rows: t.Sequence[int]) -> t.Callable[[t.Sequence[t.Any]], t.Any]:
+    # values of rows from a column in one call, itemgetter returns a tuple
+    # only for several rows
+    if len(rows) == 0:
+        return lambda column: ()
+    if len(rows) == 1:
+        row = rows[0]
+        return lambda column: (column[row],)
+    return itemgetter(*rows)
+
+
+class Categories:
+    def __init__(self) -> None:
+        self.values: t.List[t.Optional[str]] = []
+        self.codes: t.Dict[t.Optional[str], int] = {}
+
+    def encode(self, value: t.Optional[str]) -> int:
+        code = self.codes.get(value)
+        if code is None:
+            code = self.codes[value] = len(self.values)
+            self.values.append(value)
+        return code
+
+    def match(self, condition: Condition) -> t.Set[int]:
+        # condition is evaluated once per distinct value instead of per row
+        if callable(condition):
+            return {code for code, value in enumerate(self.values) if condition(value)}
+        code = self.codes.get(condition)  # type: ignore
+        return set() if code is None else {code}
+
+    def copy(self) -> "Categories":
+        categories = Categories()
+        categories.values = list(self.values)
+        categories.codes = dict(self.codes)
+        return categories
+
+
+class DropletTable:
+    def __init__(self) -> None:
+        self.numeric: t.Dict[str, array] = {
+            name: array(typecode) for name, typecode in NUMERIC_COLUMNS.items()
+        }
+        self.created_at = array("d")
+        self.categories = {name: Categories() for name in CATEGORY_COLUMNS}
+        self.codes: t.Dict[str, array] = {name: array("I") for name in CATEGORY_COLUMNS}
+        # tags of row i are tag_codes[tag_offsets[i]:tag_offsets[i + 1]]
+        self.tags = Categories()
+        self.tag_codes = array("I")
+        self.tag_offsets = array("I", [0])
+        # rows by value (or code) of a column, built on first use
+        self._indexes: t.Dict[str, t.Dict[t.Any, array]] = {}
+
+    @property
+    def columns(self) -> t.List[str]:
+        return [*NUMERIC_COLUMNS, *CATEGORY_COLUMNS, "created_at", "tags"]
+
+    def __len__(self) -> int:
+        return len(self.numeric["id"])
+
+    def __repr__(self) -> str:
+        return "DropletTable({rows} rows)".format(rows=len(self))
+
+    @classmethod
+    def from_droplets(cls, droplets: t.Iterable[t.Dict[str, t.Any]]) -> "DropletTable":
+        table = cls()
+        table.extend(droplets)
+        return table
+
+    def extend(self, droplets: t.Iterable[t.Dict[str, t.Any]]) -> None:
+        self._indexes.clear()
+        for droplet in droplets:
+            for name, column in self.numeric.items():
+                column.append(droplet.get(name) or 0)
+            self.created_at.append(_timestamp(droplet.get("created_at")))
+            self.codes["size_slug"].append(
+                self.categories["size_slug"].encode(
+                    droplet.get("size_slug") or _slug(droplet.get("size"))
+                )
+            )
+            self.codes["region"].append(
+                self.categories["region"].encode(_slug(droplet.get("region")))
+            )
+            self.codes["status"].append(
+                self.categories["status"].encode(droplet.get("status"))
+            )
+            self.tag_codes.extend(
+                self.tags.encode(tag) for tag in droplet.get("tags") or []
+            )
+            self.tag_offsets.append(len(self.tag_codes))
+
+    def __getitem__(self, column: str) -> t.Sequence[t.Any]:
+        if column in self.numeric:
+            return self.numeric[column]
+        if column == "created_at":
+            return self.created_at
+        if column in self.codes:
+            values = self.categories[column].values
+            return [values[code] for code in self.codes[column]]
+        if column == "tags":
+            return [
+                [self.tags.values[code] for code in self._row_tags(row)]
+                for row in range(len(self))
+            ]
+        raise KeyError(column)
+
+    def _row_tags(self, row: int) -> array:
+        start, end = self.tag_offsets[row], self.tag_offsets[row + 1]
+        return self.tag_codes[start:end]
+
+    def _index(self, column: str) -> t.Dict[t.Any, array]:
+        # rows of every distinct value, codes for category columns and tags
+        if column == "tags":
+            column = "tag"
+        index = self._indexes.get(column)
+        if index is None:
+            index = {}
+            if column == "tag":
+                for row in range(len(self)):
+                    for code in self._row_tags(row):
+                        index.setdefault(code, array("I")).append(row)
+            else:
+                keys = self.codes[column] if column in self.codes else self[column]
+                for row, key in enumerate(keys):
+                    rows = index.get(key)
+                    if rows is None:
+                        rows = index[key] = array("I")
+                    rows.append(row)
+            self._indexes[column] = index
+        return index
+
+    def _rows(self, column: str, condition: Condition) -> t.Set[int]:
+        # condition is evaluated once per distinct value instead of per row
+        index = self._index(column)
+        if column in self.codes:
+            keys: t.Iterable[t.Any] = self.categories[column].match(condition)
+        elif column in ("tag", "tags"):
+            keys = self.tags.match(condition)
+        elif callable(condition):
+            keys = [key for key in index if condition(key)]
+        else:
+            keys = [condition]
+        return set().union(*(index[key] for key in keys if key in index))
+
+    def take(self, rows: t.Sequence[int]) -> "DropletTable":
+        table = DropletTable()
+        table.categories = {
+            name: categories.copy() for name, categories in self.categories.items()
+        }
+        table.tags = self.tags.copy()
+        pick = _picker(rows)
+        for name, column in self.numeric.items():
+            table.numeric[name] = array(column.typecode, pick(column))
+        table.created_at = array("d", pick(self.created_at))
+        for name, codes in self.codes.items():
+            table.codes[name] = array("I", pick(codes))
+        for row in rows:
+            table.tag_codes.extend(self._row_tags(row))
+            table.tag_offsets.append(len(table.tag_codes))
+        return table
+
+    def filter(
+        self, mask: t.Iterable[bool] = None, **conditions: Condition
+    ) -> "DropletTable":
+        # conditions are values or predicates by column, "tag" matches any tag
+        selected = None
+        if mask is not None:
+            selected = set(compress(range(len(self)), mask))
+        for column, condition in conditions.items():
+            rows = self._rows(column, condition)
+            selected = rows if selected is None else selected & rows
+        if selected is None:
+            return self.take(range(len(self)))
+        return self.take(sorted(selected))
+
+    def _group_rows(self, by: str) -> t.Dict[t.Optional[str], array]:
+        if by in self.codes:
+            names = self.categories[by].values
+        elif by in ("tag", "tags"):
+            names = self.tags.values
+        else:
+            raise KeyError(by)
+        index = self._index(by)
+        return {names[code]: index[code] for code in sorted(index)}
+
+    def sum(self, column: str, by: str = None) -> t.Any:
+        values = self.numeric[column]
+        if by is None:
+            return sum(values)
+        return {
+            name: sum(_picker(rows)(values))
+            for name, rows in self._group_rows(by).items()
+        }
+
+    def count(self, by: str = None) -> t.Any:
+        if by is None:
+            return len(self)
+        return {name: len(rows) for name, rows in self._group_rows(by).items()}
+
+    def group_by(self, by: str) -> t.Dict[t.Optional[str], "DropletTable"]:
+        # droplets with several tags are in several groups when grouped by tag
+        return {name: self.take(rows) for name, rows in self._group_rows(by).items()}
@@ -0,0 +1,274 @@
+import io
+import typing as t
+
+from . import models
+
+CLASSES = {"IN", "CH", "HS", "CS"}
+# record types with a domain name in data
+HOSTNAME_TYPES = {"CNAME", "MX", "NS", "SRV", "PTR"}
+TTL_UNITS = {"s": 1, "m": 60, "h": 3600, "d": 86400, "w": 604800}
+# longest character string of a TXT record
+TXT_CHUNK = 255
+
+# token text and whether it was quoted
+Token = t.Tuple[str, bool]
+
+
+def _parse_ttl(value: str) -> t.Optional[int]:
+    # 3600 or 1h30m, None if value isn't a ttl
+    if value.isdigit():
+        return int(value)
+    total = 0
+    number = ""
+    for char in value.lower():
+        if char.isdigit():
+            number += char
+        elif char in TTL_UNITS and number:
+            total += int(number) * TTL_UNITS[char]
+            number = ""
+        else:
+            return None
+    if number or not value:
+        return None
+    return total
+
+
+def _tokenize(line: str, depth: int) -> t.Tuple[t.List[Token], int]:
+    # split a line into tokens, depth counts open parentheses
+    tokens: t.List[Token] = []
+    token = ""
+    quoted = in_quotes = False
+    i = 0
+    while i < len(line):
+        char = line[i]
+        if char == "\\" and i + 1 < len(line):
+            # \DDD is a decimal character code, \X is X
+            digits = line[i:][1:4]
+            if len(digits) == 3 and digits.isdigit():
+                token += chr(int(digits))
+                i += 4
+            else:
+                token += line[i + 1]
+                i += 2
+            continue
+        if in_quotes:
+            if char == '"':
+                in_quotes = False
+            else:
+                token += char
+        elif char == '"':
+            in_quotes = quoted = True
+        elif char == ";":
+            break
+        elif char in " \t\r\n()":
+            if token or quoted:
+                tokens.append((token, quoted))
+            token = ""
+            quoted = False
+            if char == "(":
+                depth += 1
+            elif char == ")":
+                depth -= 1
+        else:
+            token += char
+        i += 1
+    if token or quoted:
+        tokens.append((token, quoted))
+    return tokens, depth
+
+
+def _lines(lines: t.Iterable[str]) -> t.Iterator[t.Tuple[int, bool, t.List[Token]]]:
+    # logical lines: (line number, owner omitted, tokens)
+    tokens: t.List[Token] = []
+    depth = 0
+    number = 0
+    blank_owner = False
+    for i, line in enumerate(lines, 1):
+        if depth == 0:
+            number = i
+            blank_owner = line[:1] in (" ", "\t")
+        line_tokens, depth = _tokenize(line, depth)
+        tokens += line_tokens
+        if depth == 0 and tokens:
+            yield number, blank_owner, tokens
+            tokens = []
+    if tokens:
+        raise ValueError("line {number}: unbalanced parentheses".format(number=number))
+
+
+def _absolute(name: str, origin: t.Optional[str]) -> str:
+    if name == "@":
+        return origin or "@"
+    if name.endswith(".") or origin is None:
+        return name
+    return "{name}.{origin}".format(name=name, origin=origin)
+
+
+def _relative(name: str, zone: t.Optional[str]) -> str:
+    # name relative to the zone as used by the API, "@" for the apex
+    if zone is None or not name.endswith("."):
+        return name
+    if name.lower() == zone.lower():
+        return "@"
+    if name.lower().endswith("." + zone.lower()):
+        return name[: -len(zone) - 1]
+    return name
+
+
+def _record(
+    type: str, rdata: t.List[Token], origin: t.Optional[str], zone: t.Optional[str]
+) -> t.Dict[str, t.Any]:
+    values = [value for value, _ in rdata]
+
+    def hostname(value: str) -> str:
+        name = _absolute(value, origin)
+        return "@" if zone is not None and name.lower() == zone.lower() else name
+
+    if type == "MX":
+        return {"priority": int(values[0]), "data": hostname(values[1])}
+    if type == "SRV":
+        return {
+            "priority": int(values[0]),
+            "weight": int(values[1]),
+            "port": int(values[2]),
+            "data": hostname(values[3]),
+        }
+    if type == "CAA":
+        return {"flags": int(values[0]), "tag": values[1], "data": values[2]}
+    if type in ("TXT", "SPF"):
+        return {"data": "".join(values)}
+    if type in HOSTNAME_TYPES:
+        return {"data": hostname(values[0])}
+    return {"data": " ".join(values)}
+
+
+def parse(
+    source: t.Union[str, t.Iterable[str]], origin: str = None, ttl: int = None
+) -> t.Iterator[models.Domain.Record]:
+    # records of zone text or of an open zone file, one at a time
+    if isinstance(source, str):
+        source = io.StringIO(source)
+    zone = None if origin is None else origin.rstrip(".") + "."
+    current_origin = zone
+    owner: t.Optional[str] = None
+    for number, blank_owner, tokens in _lines(source):
+        first = tokens[0][0]
+        if first.upper() == "$ORIGIN":
+            current_origin = _absolute(tokens[1][0], current_origin)
+            if zone is None:
+                zone = current_origin
+            continue
+        if first.upper() == "$TTL":
+            ttl = _parse_ttl(tokens[1][0])
+            continue
+        if first.startswith("$"):
+            raise ValueError(
+                "line {number}: {directive} is not supported".format(
+                    number=number, directive=first
+                )
+            )
+
+        if not blank_owner:
+            owner = _absolute(first, current_origin)
+            tokens = tokens[1:]
+        if owner is None:
+            raise ValueError("line {number}: missing owner name".format(number=number))
+
+        # [ttl] [class] type or [class] [ttl] type
+        record_ttl = None
+        type = None
+        while tokens and type is None:
+            value = tokens[0][0]
+            tokens = tokens[1:]
+            if value.upper() in CLASSES:
+                continue
+            if record_ttl is None and _parse_ttl(value) is not None:
+                record_ttl = _parse_ttl(value)
+                continue
+            type = value.upper()
+        if type is None:
+            raise ValueError("line {number}: missing record type".format(number=number))
+        try:
+            values = _record(type, tokens, current_origin, zone)
+        except (IndexError, ValueError):
+            raise ValueError(
+                "line {number}: invalid {type} record".format(number=number, type=type)
+            )
+
+        yield models.construct(
+            models.Domain.Record,
+            dict(
+                values,
+                type=type,
+                name=_relative(owner, zone),
+                ttl=record_ttl if record_ttl is not None else ttl,
+            ),
+        )
+
+
+def _quote(value: str) -> str:
+    return '"{value}"'.format(value=value.replace("\\", "\\\\").replace('"', '\\"'))
+
+
+def _hostname(value: t.Optional[str]) -> str:
+    # the API returns names without the final dot
+    if not value or value == "@" or value.endswith("."):
+        return value or "@"
+    return value + "."
+
+
+def format_record(record: models.Domain.Record) -> str:
+    type = record.type.upper()
+    if type == "MX":
+        rdata = "{priority} {data}".format(
+            priority=record.priority, data=_hostname(record.data)
+        )
+    elif type == "SRV":
+        rdata = "{priority} {weight} {port} {data}".format(
+            priority=record.priority,
+            weight=record.weight,
+            port=record.port,
+            data=_hostname(record.data),
+        )
+    elif type == "CAA":
+        rdata = "{flags} {tag} {data}".format(
+            flags=record.flags, tag=record.tag, data=_quote(record.data or "")
+        )
+    elif type in ("TXT", "SPF"):
+        data = record.data or ""
+        rdata = " ".join(
+            _quote(data[start:][:TXT_CHUNK])
+            for start in range(0, max(len(data), 1), TXT_CHUNK)
+        )
+    elif type in HOSTNAME_TYPES:
+        rdata = _hostname(record.data)
+    else:
+        rdata = record.data or ""
+    fields = [record.name or "@", "" if record.ttl is None else str(record.ttl)]
+    return "\t".join(field for field in fields + ["IN", type, rdata] if field)
+
+
+def write_header(file: t.TextIO, origin: str = None, ttl: int = None) -> None:
+    if origin is not None:
+        file.write("$ORIGIN {origin}.\n".format(origin=origin.rstrip(".")))
+    if ttl is not None:
+        file.write("$TTL {ttl}\n".format(ttl=ttl))
+
+
+def write_record(file: t.TextIO, record: models.Domain.Record) -> None:
+    file.write(format_record(record) + "\n")
+
+
+def write(
+    records: t.Iterable[models.Domain.Record],
+    file: t.TextIO,
+    origin: str = None,
+    ttl: int = None,
+) -> int:
+    # write records as they come, returns their number
+    write_header(file, origin, ttl)
+    count = 0
+    for record in records:
+        write_record(file, record)
+        count += 1
+    return count
@@ -1,3 +1,5 @@
+import typing as t
+
 import pytest
 
 from dolib import AsyncClient, Client
@@ -27,12 +29,15 @@ def vcr_config() -> dict:
     }
 
 
+# FIXME: our test lib (vcrpy) for httpx has bugs with gzip and deflate
+# https://github.com/kevin1024/vcrpy/issues/550
 @pytest.fixture
-def client() -> Client:
-    return Client(token="fake_token")
+def client() -> t.Iterator[Client]:
+    with Client(token="fake_token", compression=False) as client:
+        yield client
 
 
 @pytest.fixture
-async def async_client() -> AsyncClient:
-    async with AsyncClient(token="fake_token") as async_client:
-        return async_client
+async def async_client() -> t.AsyncIterator[AsyncClient]:
+    async with AsyncClient(token="fake_token", compression=False) as async_client:
+        yield async_client
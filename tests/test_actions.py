@@ -1,6 +1,10 @@
+import typing as t
+
+import httpx
 import pytest
 
 from dolib.client import AsyncClient, Client
+from dolib.models import Action
 
 
 @pytest.mark.vcr
@@ -30,3 +34,187 @@ async def test_async_actions(async_client: AsyncClient) -> None:
     # read action
     action = await async_client.actions.get(str(actions[0].id))
     assert action.id == actions[0].id
+
+
+def action_data(id: int, status: str) -> t.Dict[str, t.Any]:
+    return {
+        "id": id,
+        "status": status,
+        "type": "reboot",
+        "started_at": "2021-05-25T16:50:47Z",
+        "completed_at": None,
+        "resource_id": id,
+        "resource_type": "droplet",
+        "region_slug": "fra1",
+    }
+
+
+def actions_handler(
+    polls: t.Dict[int, int], requested: t.List[str]
+) -> t.Callable[[httpx.Request], httpx.Response]:
+    # action with id N is completed after N polls, negative ids are errored
+    def status(id: int) -> str:
+        polls[id] = polls.get(id, 0) + 1
+        if polls[id] < abs(id):
+            return "in-progress"
+        return "completed" if id > 0 else "errored"
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requested.append(request.url.path)
+        if request.url.path == "/v2/actions":
+            ids = sorted(polls, reverse=True)
+            return httpx.Response(
+                200,
+                json={
+                    "actions": [action_data(id, status(id)) for id in ids],
+                    "links": {},
+                },
+            )
+        id = int(request.url.path.rsplit("/", 1)[-1])
+        return httpx.Response(200, json={"action": action_data(id, status(id))})
+
+    return handler
+
+
+def test_wait_actions() -> None:
+    requested: t.List[str] = []
+    polls: t.Dict[int, int] = {}
+    with Client(
+        token="fake_token",
+        transport=httpx.MockTransport(actions_handler(polls, requested)),
+    ) as client:
+        action = Action(**action_data(3, "in-progress"))
+        assert client.actions.wait(action, interval=0.001).status == "completed"
+        assert len(requested) == 3
+
+        # already completed actions are not polled
+        assert client.actions.wait(Action(**action_data(1, "completed"))).id == 1
+        assert len(requested) == 3
+
+        actions = [Action(**action_data(id, "in-progress")) for id in [1, 2, -2]]
+        result = client.actions.wait_many(actions, interval=0.001)
+        assert [action.id for action in result.completed] == [1, 2]
+        assert [action.id for action in result.errored] == [-2]
+        assert not result.ok
+
+        with pytest.raises(TimeoutError):
+            client.actions.wait(
+                Action(**action_data(1000, "in-progress")), timeout=0.01
+            )
+
+        # many actions are polled in bulk
+        requested.clear()
+        polls.clear()
+        actions = [Action(**action_data(id, "in-progress")) for id in range(2, 32)]
+        polls.update({id: 0 for id in range(2, 32)})
+        result = client.actions.wait_many(actions, interval=0.001)
+        assert result.ok
+        assert len(result.completed) == 30
+        assert requested[:2] == ["/v2/actions", "/v2/actions"]
+
+
+@pytest.mark.asyncio
+async def test_async_wait_actions() -> None:
+    requested: t.List[str] = []
+    polls: t.Dict[int, int] = {}
+    async with AsyncClient(
+        token="fake_token",
+        transport=httpx.MockTransport(actions_handler(polls, requested)),
+    ) as async_client:
+        action = Action(**action_data(2, "in-progress"))
+        action = await async_client.actions.wait(action, interval=0.001)
+        assert action.status == "completed"
+
+        actions = [Action(**action_data(id, "in-progress")) for id in [3, -1, 1000]]
+        result = await async_client.actions.wait_many(
+            actions, timeout=0.05, interval=0.001, max_interval=0.01
+        )
+        assert [action.id for action in result.completed] == [3]
+        assert [action.id for action in result.errored] == [-1]
+        assert [action.id for action in result.pending] == [1000]
+
+        with pytest.raises(TimeoutError):
+            await async_client.actions.wait(actions[2], timeout=0.01)
+
+        async_client.actions.bulk_threshold = 1
+        requested.clear()
+        polls[4] = 0
+        action = Action(**action_data(4, "in-progress"))
+        assert (await async_client.actions.wait(action, interval=0.001)).id == 4
+        assert set(requested) == {"/v2/actions"}
+
+        # actions missing in the listing are requested directly
+        requested.clear()
+        action = Action(**action_data(5, "in-progress"))
+        assert (await async_client.actions.wait(action, interval=0.001)).id == 5
+        assert requested[:2] == ["/v2/actions", "/v2/actions/5"]
+
+
+def listing_handler(
+    requested: t.List[str],
+) -> t.Callable[[httpx.Request], httpx.Response]:
+    # 450 completed actions listed from the newest one
+    ids = list(range(450, 0, -1))
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path != "/v2/actions":
+            requested.append(request.url.path)
+            id = int(request.url.path.rsplit("/", 1)[-1])
+            return httpx.Response(200, json={"action": action_data(id, "completed")})
+        page = int(request.url.params.get("page", 1))
+        per_page = int(request.url.params.get("per_page", 20))
+        requested.append("/v2/actions?page={page}".format(page=page))
+        links = {}
+        if page * per_page < len(ids):
+            links["next"] = str(request.url.copy_set_param("page", page + 1))
+        start = (page - 1) * per_page
+        items = ids[start:][:per_page]
+        return httpx.Response(
+            200,
+            json={
+                "actions": [action_data(id, "completed") for id in items],
+                "links": {"pages": links},
+            },
+        )
+
+    return handler
+
+
+def test_poll_requests() -> None:
+    requested: t.List[str] = []
+    with Client(
+        token="fake_token", transport=httpx.MockTransport(listing_handler(requested))
+    ) as client:
+        # below bulk_threshold actions are requested by id
+        actions = [Action(**action_data(id, "in-progress")) for id in range(1, 20)]
+        assert client.actions.wait_many(actions, interval=0.001).ok
+        assert sorted(requested) == sorted(
+            "/v2/actions/{id}".format(id=id) for id in range(1, 20)
+        )
+
+        # the listing stops at the page with the oldest action
+        requested.clear()
+        actions = [Action(**action_data(id, "in-progress")) for id in range(260, 290)]
+        assert client.actions.wait_many(actions, interval=0.001).ok
+        assert requested == ["/v2/actions?page=1"]
+
+        requested.clear()
+        actions[0] = Action(**action_data(100, "in-progress"))
+        assert client.actions.wait_many(actions, interval=0.001).ok
+        assert requested == ["/v2/actions?page=1", "/v2/actions?page=2"]
+
+
+@pytest.mark.asyncio
+async def test_async_poll_requests() -> None:
+    requested: t.List[str] = []
+    async with AsyncClient(
+        token="fake_token", transport=httpx.MockTransport(listing_handler(requested))
+    ) as async_client:
+        actions = [Action(**action_data(id, "in-progress")) for id in range(1, 20)]
+        assert (await async_client.actions.wait_many(actions, interval=0.001)).ok
+        assert len(requested) == 19
+
+        requested.clear()
+        actions = [Action(**action_data(id, "in-progress")) for id in range(260, 290)]
+        assert (await async_client.actions.wait_many(actions, interval=0.001)).ok
+        assert requested == ["/v2/actions?page=1"]
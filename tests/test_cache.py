@@ -0,0 +1,143 @@
+import time
+import typing as t
+from pathlib import Path
+
+import httpx
+import pytest
+
+from dolib import AsyncClient, Client
+from dolib.cache import (
+    CacheEntry,
+    FileCacheBackend,
+    MemoryCacheBackend,
+    ResponseCache,
+)
+
+
+def regions_handler(
+    requested: t.List[httpx.Request],
+) -> t.Callable[[httpx.Request], httpx.Response]:
+    def handler(request: httpx.Request) -> httpx.Response:
+        requested.append(request)
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304, headers={"ETag": '"v1"'})
+        return httpx.Response(
+            200,
+            headers={"ETag": '"v1"'},
+            json={
+                "regions": [
+                    {
+                        "name": "Frankfurt 1",
+                        "slug": "fra1",
+                        "sizes": [],
+                        "available": True,
+                        "features": [],
+                    }
+                ],
+                "links": {},
+                "meta": {"total": 1},
+            },
+        )
+
+    return handler
+
+
+def test_cache_ttls() -> None:
+    cache = ResponseCache()
+    assert cache.get_ttl("regions?per_page=200") == 3600
+    assert cache.get_ttl("sizes") == 3600
+    assert cache.get_ttl("kubernetes/options") == 3600
+    assert cache.get_ttl("images?per_page=200&type=distribution") == 3600
+    assert cache.get_ttl("images?per_page=200") is None
+    assert cache.get_ttl("images?private=true") is None
+    assert cache.get_ttl("droplets?per_page=200") is None
+
+    cache = ResponseCache(ttls={r"droplets$": 5})
+    assert cache.get_ttl("droplets?per_page=200") == 5
+    assert cache.get_ttl("regions") is None
+
+
+def test_memory_cache_backend() -> None:
+    backend = MemoryCacheBackend(maxsize=2)
+    for key in ["a", "b"]:
+        backend.set(key, CacheEntry(endpoint=key, content="{}", expires_at=0))
+    backend.get("a")
+    backend.set("c", CacheEntry(endpoint="c", content="{}", expires_at=0))
+    assert sorted(key for key, _ in backend.items()) == ["a", "c"]
+    backend.clear()
+    assert backend.get("a") is None
+
+
+def test_file_cache_backend(tmp_path: Path) -> None:
+    backend = FileCacheBackend(str(tmp_path / "cache"))
+    entry = CacheEntry("regions", '{"regions": []}', time.time() + 10, '"v1"')
+    backend.set("key", entry)
+
+    cached = FileCacheBackend(str(tmp_path / "cache")).get("key")
+    assert cached is not None
+    assert cached.to_dict() == entry.to_dict()
+    assert cached.is_fresh
+    assert [key for key, _ in backend.items()] == ["key"]
+
+    backend.delete("key")
+    backend.delete("key")
+    assert backend.get("key") is None
+
+
+def test_client_cache() -> None:
+    requested: t.List[httpx.Request] = []
+    client = Client(
+        token="fake_token",
+        cache=True,
+        transport=httpx.MockTransport(regions_handler(requested)),
+    )
+
+    assert client.regions.all()[0].slug == "fra1"
+    assert client.regions.all()[0].slug == "fra1"
+    assert len(requested) == 1
+
+    # stale entry is revalidated with etag
+    for _, entry in client.cache.backend.items():
+        entry.expires_at = 0
+    assert client.regions.all()[0].slug == "fra1"
+    assert len(requested) == 2
+    assert requested[-1].headers["If-None-Match"] == '"v1"'
+    assert client.regions.all()[0].slug == "fra1"
+    assert len(requested) == 2
+
+    # explicit invalidation
+    client.cache.invalidate("regions")
+    client.regions.all()
+    assert len(requested) == 3
+    client.cache.invalidate()
+    client.regions.all()
+    assert len(requested) == 4
+
+    # endpoints without ttl are not cached
+    client.request(endpoint="account")
+    client.request(endpoint="account")
+    assert len(requested) == 6
+
+
+@pytest.mark.asyncio
+async def test_async_client_cache(tmp_path: Path) -> None:
+    requested: t.List[httpx.Request] = []
+    cache = ResponseCache(backend=FileCacheBackend(str(tmp_path)))
+    async with AsyncClient(
+        token="fake_token",
+        cache=cache,
+        transport=httpx.MockTransport(regions_handler(requested)),
+    ) as async_client:
+        await async_client.regions.all()
+        regions = await async_client.regions.all()
+        assert regions[0].slug == "fra1"
+        assert len(requested) == 1
+
+    # cache is shared between clients with the same token only
+    async with AsyncClient(
+        token="other_token",
+        cache=cache,
+        transport=httpx.MockTransport(regions_handler(requested)),
+    ) as async_client:
+        await async_client.regions.all()
+        assert len(requested) == 2
@@ -1,27 +1,135 @@
+import subprocess
 import sys
-from unittest.mock import MagicMock, patch
+import typing as t
+from unittest.mock import patch
 
+import httpx
 import pytest
 from httpx import HTTPStatusError
-from pkg_resources import DistributionNotFound
 
 from dolib import AsyncClient, Client
+from dolib import managers as mn
 from dolib.client import BaseClient
+from dolib.simulator import Simulator
 
 
-@patch("pkg_resources.get_distribution", side_effect=DistributionNotFound)
-def test_version(mock: MagicMock) -> None:
-    del sys.modules["dolib.__version__"]
-    from dolib.__version__ import __version__
+def test_version() -> None:
+    # importlib.metadata or the importlib_metadata backport on python < 3.8
+    module = sys.modules["dolib.__version__"]
+    metadata = sys.modules[module.version.__module__]
+    try:
+        with patch.object(metadata, "version", side_effect=module.PackageNotFoundError):
+            del sys.modules["dolib.__version__"]
+            from dolib.__version__ import __version__
+    finally:
+        sys.modules["dolib.__version__"] = module
 
     assert __version__ is None
 
 
+def paginated_handler(
+    total: int, requested: t.List[str]
+) -> t.Callable[[httpx.Request], httpx.Response]:
+    def handler(request: httpx.Request) -> httpx.Response:
+        requested.append(str(request.url))
+        page = int(request.url.params.get("page", 1))
+        per_page = int(request.url.params["per_page"])
+        start = (page - 1) * per_page
+        items = [{"id": i} for i in range(start, min(start + per_page, total))]
+        last = (total - 1) // per_page + 1
+        pages = {}
+        if page < last:
+            pages["next"] = str(request.url.copy_set_param("page", page + 1))
+            pages["last"] = str(request.url.copy_set_param("page", last))
+        return httpx.Response(
+            200,
+            json={"items": items, "links": {"pages": pages}, "meta": {"total": total}},
+        )
+
+    return handler
+
+
 def test_base_client() -> None:
     with pytest.raises(ValueError, match="API token must be specified"):
         BaseClient()
-    with pytest.raises(NotImplementedError):
-        BaseClient(token="fake_token")
+    # managers are declared by subclasses
+    assert not hasattr(BaseClient(token="fake_token"), "droplets")
+
+
+def test_lazy_imports() -> None:
+    script = (
+        "import sys, dolib; dolib.Client(token='fake_token'); "
+        "print(sorted({'asyncio', 'dolib.models', 'pkg_resources'} & set(sys.modules)))"
+    )
+    output = subprocess.check_output([sys.executable, "-c", script])
+    assert output.strip() == b"[]"
+
+
+def test_sync_managers_dont_import_asyncio() -> None:
+    script = (
+        "import sys, dolib; from dolib.client import LazyManager; "
+        "client = dolib.Client(token='fake_token'); "
+        "[getattr(client, name) for name, value in vars(dolib.Client).items() "
+        "if isinstance(value, LazyManager)]; "
+        "print('asyncio' in sys.modules)"
+    )
+    output = subprocess.check_output([sys.executable, "-c", script])
+    assert output.strip() == b"False"
+
+
+def test_lazy_managers() -> None:
+    client = Client(token="fake_token")
+    assert "droplets" not in client.__dict__
+    droplets = client.droplets
+    assert isinstance(droplets, mn.DropletsManager)
+    assert client.droplets is droplets
+    assert client.droplets._client is client
+    assert Client(token="fake_token").droplets is not droplets
+    assert isinstance(AsyncClient(token="fake_token").droplets, mn.AsyncDropletsManager)
+
+    for name in mn.__all__:
+        assert getattr(mn, name).__name__ == name
+    with pytest.raises(AttributeError, match="unknown"):
+        mn.unknown
+
+
+def test_client_connection_pool() -> None:
+    with Client(token="fake_token", max_connections=10, keepalive_expiry=30) as client:
+        http = client.http
+        assert client.http is http
+        assert not http.is_closed
+    assert http.is_closed
+    assert client._http is None
+
+    # closed client reopens pool on demand
+    assert not client.http.is_closed
+    client.close()
+
+
+def test_client_http2() -> None:
+    pytest.importorskip("h2")
+    options = Client(token="fake_token")._http_options()
+    assert options["http1"] and not options["http2"]
+
+    with Client(token="fake_token", http2=True) as client:
+        assert client._http_options()["http1"]
+        assert client._http_options()["http2"]
+        assert not client.http.is_closed
+
+    # plain http has no protocol negotiation
+    client = Client(token="fake_token", http2=True, base_url="http://localhost/v2")
+    assert not client._http_options()["http1"]
+
+
+@pytest.mark.asyncio
+async def test_async_client_connection_pool() -> None:
+    async with AsyncClient(token="fake_token", max_connections=10) as async_client:
+        http = async_client.http
+        assert async_client.http is http
+        assert async_client.droplets._client.http is http
+        assert not http.is_closed
+    assert http.is_closed
+    assert async_client._http is None
 
 
 @pytest.mark.vcr
@@ -79,3 +187,156 @@ async def test_async_client(async_client: AsyncClient) -> None:
 
     with pytest.raises(HTTPStatusError):
         await async_client.fetch_all(endpoint="non_existent_page", key="error")
+
+
+def test_client_parallel_pages() -> None:
+    requested: t.List[str] = []
+    with Client(
+        token="fake_token",
+        transport=httpx.MockTransport(paginated_handler(1001, requested)),
+    ) as client:
+        items = client.fetch_all(endpoint="items", key="items", max_workers=3)
+        assert [item["id"] for item in items] == list(range(1001))
+        assert len(requested) == 6
+
+        # serial mode gives the same result
+        assert client.fetch_all(endpoint="items", key="items") == items
+
+        # page urls are computed from meta.total if there is no last page link
+        result = {
+            "links": {"pages": {"next": "https://x/items?page=2"}},
+            "meta": {"total": 450},
+        }
+        assert client._get_page_urls(result, 200) == [
+            "https://x/items?page=2",
+            "https://x/items?page=3",
+        ]
+        del result["meta"]
+        assert client._get_page_urls(result, 200) is None
+
+
+def test_client_iter_pages() -> None:
+    requested: t.List[str] = []
+    with Client(
+        token="fake_token",
+        transport=httpx.MockTransport(paginated_handler(450, requested)),
+    ) as client:
+        pages = client.iter_pages(endpoint="items", key="items")
+        first_page = next(pages)
+        assert [item["id"] for item in first_page] == list(range(200))
+        items = first_page + [item for page in pages for item in page]
+        assert [item["id"] for item in items] == list(range(450))
+        assert len(requested) == 3
+
+        # stop iteration early
+        requested.clear()
+        for page in client.iter_pages(endpoint="items", key="items"):
+            break
+        assert len(requested) <= 2
+
+
+@pytest.mark.asyncio
+async def test_async_client_iter_pages() -> None:
+    requested: t.List[str] = []
+    async with AsyncClient(
+        token="fake_token",
+        transport=httpx.MockTransport(paginated_handler(450, requested)),
+    ) as async_client:
+        items = []
+        async for page in async_client.iter_pages(endpoint="items", key="items"):
+            items += page
+        assert [item["id"] for item in items] == list(range(450))
+        assert len(requested) == 3
+
+
+@pytest.mark.asyncio
+async def test_async_client_concurrent_pages() -> None:
+    requested: t.List[str] = []
+    async with AsyncClient(
+        token="fake_token",
+        transport=httpx.MockTransport(paginated_handler(1001, requested)),
+    ) as async_client:
+        items = await async_client.fetch_all(
+            endpoint="items", key="items", concurrency=3
+        )
+        assert [item["id"] for item in items] == list(range(1001))
+        assert len(requested) == 6
+
+        # serial mode gives the same result
+        assert await async_client.fetch_all(endpoint="items", key="items") == items
+
+
+def test_merge_pages() -> None:
+    merged = BaseClient._merge_pages(
+        [{"id": 1}, {"id": 2}], [[{"id": 2}, {"id": 3}], [{"id": 4}, "raw"]]
+    )
+    assert merged == [{"id": 1}, {"id": 2}, {"id": 3}, {"id": 4}, "raw"]
+
+
+def droplets_simulator(latency: float = 0.0) -> Simulator:
+    simulator = Simulator(latency=latency)
+    for i in range(5):
+        simulator.add("droplets", {"name": "web-{i}".format(i=i), "region": "nyc1"})
+    return simulator
+
+
+def test_client_get_many() -> None:
+    simulator = droplets_simulator()
+    with Client(token="fake_token", transport=simulator, validate=False) as client:
+        droplets = client.droplets.get_many(["1", "3", "3", "5"], max_workers=2)
+        assert [droplet.name for droplet in droplets] == [
+            "web-0",
+            "web-2",
+            "web-2",
+            "web-4",
+        ]
+        # duplicated ids are fetched once
+        assert simulator.requests == 3
+        assert client.droplets.get_many([]) == []
+        with pytest.raises(HTTPStatusError):
+            client.droplets.get_many(["1", "100"])
+
+
+@pytest.mark.asyncio
+async def test_async_client_get_many() -> None:
+    import asyncio
+
+    simulator = droplets_simulator(latency=0.01)
+    async with AsyncClient(
+        token="fake_token", transport=simulator, validate=False
+    ) as client:
+        droplets = await client.droplets.get_many(["2", "1", "2"], concurrency=2)
+        assert [droplet.name for droplet in droplets] == ["web-1", "web-0", "web-1"]
+        assert simulator.requests == 2
+
+        # identical requests in flight share one response
+        simulator.requests = 0
+        droplets = await asyncio.gather(*[client.droplets.get("4") for _ in range(10)])
+        assert {droplet.name for droplet in droplets} == {"web-3"}
+        assert simulator.requests == 1
+        assert client._inflight == {}
+        await client.droplets.get("4")
+        assert simulator.requests == 2
+
+        # and the error of a failed one
+        results = await asyncio.gather(
+            *[client.droplets.get("100") for _ in range(3)], return_exceptions=True
+        )
+        assert all(isinstance(result, HTTPStatusError) for result in results)
+        assert simulator.requests == 3
+
+        # a cancelled request doesn't cancel the waiters
+        first = asyncio.ensure_future(client.droplets.get("5"))
+        await asyncio.sleep(0)
+        second = asyncio.ensure_future(client.droplets.get("5"))
+        await asyncio.sleep(0)
+        first.cancel()
+        assert (await second).name == "web-4"
+        assert first.cancelled()
+
+    simulator.requests = 0
+    async with AsyncClient(
+        token="fake_token", transport=simulator, validate=False, coalesce=False
+    ) as client:
+        await asyncio.gather(*[client.droplets.get("4") for _ in range(3)])
+    assert simulator.requests == 3
@@ -0,0 +1,76 @@
+import json
+import typing as t
+import uuid
+from datetime import datetime, timezone
+from decimal import Decimal
+
+import httpx
+import pytest
+
+from dolib.client import Client
+from dolib.codec import CODECS, JSONCodec, StdlibCodec, get_codec
+from dolib.models import Tag
+
+INSTALLED = [name for name, (_, module) in CODECS.items() if module is not None]
+
+
+@pytest.mark.parametrize("name", INSTALLED)
+def test_codec(name: str) -> None:
+    codec = get_codec(name)
+    assert codec.name == name
+
+    data = {"droplets": [{"id": 1, "name": "тест", "tags": []}], "meta": None}
+    assert codec.loads(json.dumps(data).encode("utf-8")) == data
+    assert codec.loads(json.dumps(data)) == data
+
+    obj = {
+        "created_at": datetime(2021, 5, 25, 16, 50, 47, tzinfo=timezone.utc),
+        "vpc_uuid": uuid.UUID("b21d4ee5-5e72-4056-b6f2-82e364789990"),
+        "price": Decimal("5.5"),
+        1: "x",
+    }
+    assert json.loads(codec.dumps(obj)) == {
+        "created_at": "2021-05-25T16:50:47+00:00",
+        "vpc_uuid": "b21d4ee5-5e72-4056-b6f2-82e364789990",
+        "price": 5.5,
+        "1": "x",
+    }
+
+
+def test_get_codec() -> None:
+    assert get_codec("auto").name == INSTALLED[0]
+    codec = StdlibCodec()
+    assert get_codec(codec) is codec
+    with pytest.raises(ValueError, match="Unknown JSON codec"):
+        get_codec("unknown")
+    with pytest.raises(NotImplementedError):
+        JSONCodec().loads(b"{}")
+
+
+def test_client_codec() -> None:
+    requests: t.List[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(201, json={"tag": {"name": "test"}})
+
+    class CountingCodec(StdlibCodec):
+        calls = 0
+
+        def loads(self, content: t.Union[bytes, str]) -> t.Any:
+            self.calls += 1
+            return super().loads(content)
+
+    codec = CountingCodec()
+    with Client(
+        token="fake_token", json_codec=codec, transport=httpx.MockTransport(handler)
+    ) as client:
+        assert client.tags.create(Tag(name="test")) == Tag(name="test")
+        client.request(endpoint="tags", method="post", json={"name": "test"})
+
+    assert codec.calls == 2
+    assert [json.loads(request.content) for request in requests] == [
+        {"name": "test"},
+        {"name": "test"},
+    ]
+    assert requests[1].headers["Content-Type"] == "application/json"
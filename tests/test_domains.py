@@ -1,7 +1,10 @@
+import typing as t
+
 import pytest
 
 from dolib.client import AsyncClient, Client
 from dolib.models import Domain
+from dolib.simulator import Simulator
 
 
 @pytest.mark.vcr
@@ -99,3 +102,120 @@ async def test_async_crud_domains(async_client: AsyncClient) -> None:
 
     # delete domain
     await async_client.domains.delete(domain=created_domain)
+
+
+def zone() -> Simulator:
+    simulator = Simulator()
+    simulator.add("domains", {"name": "example.com"})
+    for record in [
+        {"type": "SOA", "name": "@", "data": "1800"},
+        {"type": "NS", "name": "@", "data": "ns1.digitalocean.com"},
+        {"type": "A", "name": "@", "data": "1.1.1.1"},
+        {"type": "A", "name": "www", "data": "1.1.1.1"},
+        {"type": "CNAME", "name": "api", "data": "app.example.com"},
+        {"type": "MX", "name": "@", "data": "mail.example.com", "priority": 10},
+        {"type": "A", "name": "old", "data": "9.9.9.9"},
+    ]:
+        simulator.add("domains/example.com/records", record)
+    return simulator
+
+
+def desired_records() -> t.List[Domain.Record]:
+    return [
+        Domain.Record(type="A", name="@", data="1.1.1.1"),
+        Domain.Record(type="A", name="www", data="2.2.2.2"),
+        Domain.Record(type="CNAME", name="api", data="app.example.com."),
+        Domain.Record(type="MX", name="@", data="mail.example.com.", priority=20),
+        Domain.Record(type="A", name="new", data="3.3.3.3"),
+    ]
+
+
+def records_of(simulator: Simulator) -> t.List[t.Tuple[str, str, str]]:
+    return sorted(
+        (record["type"], record["name"], record["data"])
+        for record in simulator.items("domains/example.com/records")
+    )
+
+
+def test_sync_records() -> None:
+    simulator = zone()
+    before = records_of(simulator)
+    with Client(token="fake_token", transport=simulator) as client:
+        plan = client.domains.sync("example.com", desired_records(), dry_run=True)
+        assert plan.dry_run
+        assert [(r.name, r.data) for r in plan.create] == [("new", "3.3.3.3")]
+        assert [(u.before.data, u.after.data, u.after.id) for u in plan.update] == [
+            ("1.1.1.1", "2.2.2.2", 4),
+            ("mail.example.com", "mail.example.com.", 6),
+        ]
+        assert [r.name for r in plan.delete] == ["old"]
+        assert plan.unchanged == 2
+        assert plan.changes == 4
+        assert records_of(simulator) == before
+
+        result = client.domains.sync("example.com", desired_records())
+        assert result.ok
+        assert not result.dry_run
+        assert result.changes == 4
+        assert records_of(simulator) == [
+            ("A", "@", "1.1.1.1"),
+            ("A", "new", "3.3.3.3"),
+            ("A", "www", "2.2.2.2"),
+            ("CNAME", "api", "app.example.com"),
+            ("MX", "@", "mail.example.com."),
+            ("NS", "@", "ns1.digitalocean.com"),
+            ("SOA", "@", "1800"),
+        ]
+        assert client.domains.sync("example.com", desired_records()).changes == 0
+
+        # failed requests are reported per record, the others are applied
+        simulator.fail("POST .*/records", status_code=422)
+        desired = desired_records() + [
+            Domain.Record(type="A", name="a", data="4.4.4.4"),
+            Domain.Record(type="A", name="b", data="4.4.4.4"),
+        ]
+        result = client.domains.sync("example.com", desired, concurrency=1)
+        assert not result.ok
+        assert [(e.action, e.record.name, e.status_code) for e in result.errors] == [
+            ("create", "a", 422)
+        ]
+        assert ("A", "b", "4.4.4.4") in records_of(simulator)
+
+
+def test_sync_keeps_unset_fields() -> None:
+    simulator = Simulator()
+    simulator.add("domains", {"name": "example.com"})
+    simulator.add(
+        "domains/example.com/records",
+        {
+            "type": "MX",
+            "name": "@",
+            "data": "mail.example.com",
+            "priority": 10,
+            "ttl": 1800,
+        },
+    )
+    desired = [Domain.Record(type="MX", name="@", data="mx.example.com")]
+    with Client(token="fake_token", transport=simulator) as client:
+        result = client.domains.sync("example.com", desired)
+    assert result.ok
+    assert len(result.update) == 1
+    [record] = simulator.items("domains/example.com/records")
+    assert record["data"] == "mx.example.com"
+    assert record["priority"] == 10
+    assert record["ttl"] == 1800
+
+
+@pytest.mark.asyncio
+async def test_async_sync_records() -> None:
+    simulator = zone()
+    async with AsyncClient(token="fake_token", transport=simulator) as client:
+        plan = await client.domains.sync("example.com", desired_records(), dry_run=True)
+        assert plan.changes == 4
+        result = await client.domains.sync(
+            "example.com", desired_records(), ignore_types=["SOA"]
+        )
+        assert result.ok
+        # NS records are managed too
+        assert [r.type for r in result.delete] == ["NS", "A"]
+        assert len(records_of(simulator)) == 6
@@ -1,3 +1,7 @@
+import json
+import typing as t
+
+import httpx
 import pytest
 from httpx import HTTPStatusError
 
@@ -326,3 +330,110 @@ async def test_async_crud_droplets(async_client: AsyncClient) -> None:
 
     # delete droplet
     await async_client.droplets.delete(droplet=read_droplet)
+
+
+def bulk_handler(requested: t.List[str]) -> t.Callable[[httpx.Request], httpx.Response]:
+    def handler(request: httpx.Request) -> httpx.Response:
+        requested.append(request.content.decode())
+        id = int(request.url.path.split("/")[3])
+        if id % 3 == 0:
+            return httpx.Response(
+                422, json={"id": "unprocessable_entity", "message": "locked"}
+            )
+        return httpx.Response(
+            201,
+            json={
+                "action": {
+                    "id": id * 100,
+                    "status": "in-progress",
+                    "type": "reboot",
+                    "started_at": "2021-05-25T16:50:47Z",
+                    "resource_id": id,
+                    "resource_type": "droplet",
+                }
+            },
+        )
+
+    return handler
+
+
+def test_bulk_droplets_actions() -> None:
+    requested: t.List[str] = []
+    with Client(
+        token="fake_token", transport=httpx.MockTransport(bulk_handler(requested))
+    ) as client:
+        result = client.droplets.bulk("reboot", range(1, 8), concurrency=3)
+        assert [action.resource_id for action in result.actions] == [1, 2, 4, 5, 7]
+        assert [(error.id, error.status_code) for error in result.errors] == [
+            ("3", 422),
+            ("6", 422),
+        ]
+        assert result.errors[0].message == "locked"
+        assert not result.ok
+        assert json.loads(requested[0]) == {"type": "reboot"}
+
+
+@pytest.mark.asyncio
+async def test_async_bulk_droplets_actions() -> None:
+    requested: t.List[str] = []
+    async with AsyncClient(
+        token="fake_token", transport=httpx.MockTransport(bulk_handler(requested))
+    ) as async_client:
+        result = await async_client.droplets.bulk(
+            "resize", [1, 2, 4], concurrency=2, size="s-2vcpu-2gb"
+        )
+        assert result.ok
+        assert [action.id for action in result.actions] == [100, 200, 400]
+        assert json.loads(requested[0]) == {"type": "resize", "size": "s-2vcpu-2gb"}
+
+
+def test_droplets_without_validation() -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        droplets = [
+            {"id": i, "name": "test", "region": "nyc1", "size": "s", "image": 1}
+            for i in range(3)
+        ]
+        return httpx.Response(200, json={"droplets": droplets, "meta": {"total": 3}})
+
+    with Client(token="fake_token", transport=httpx.MockTransport(handler)) as client:
+        droplets = client.droplets.all(validate=False)
+        assert [droplet.id for droplet in droplets] == [0, 1, 2]
+        assert all(isinstance(droplet, Droplet) for droplet in droplets)
+
+        client.validate = False
+        assert [droplet.id for droplet in client.droplets.iter_all()] == [0, 1, 2]
+        assert client.droplets.all(validate=True) == client.droplets.all()
+
+
+def test_lazy_droplets() -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        droplets = [
+            {"id": i, "name": "test", "region": "nyc1", "size": "s", "image": 1}
+            for i in range(3)
+        ]
+        return httpx.Response(200, json={"droplets": droplets, "meta": {"total": 3}})
+
+    with Client(token="fake_token", transport=httpx.MockTransport(handler)) as client:
+        client.lazy = True
+        droplets = client.droplets.all()
+        assert [droplet.id for droplet in droplets] == [0, 1, 2]
+        assert droplets[0].__dict__ == {"id": 0}
+        client.lazy = False
+        assert client.droplets.all() == droplets
+
+
+def test_droplets_table() -> None:
+    requested: t.List[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requested.append(str(request.url))
+        droplets = [
+            {"id": i, "vcpus": 2, "region": {"slug": "nyc1"}, "tags": ["web"]}
+            for i in range(3)
+        ]
+        return httpx.Response(200, json={"droplets": droplets, "meta": {"total": 3}})
+
+    with Client(token="fake_token", transport=httpx.MockTransport(handler)) as client:
+        table = client.droplets.table(tag_name="web")
+        assert "tag_name=web" in requested[0]
+        assert table.sum("vcpus", by="region") == {"nyc1": 6}
@@ -0,0 +1,243 @@
+import typing as t
+
+import httpx
+import pytest
+
+from dolib.client import AsyncClient, Client
+from dolib.hooks import (
+    Hooks,
+    PageEvent,
+    RequestEvent,
+    ResponseEvent,
+    RetryEvent,
+    endpoint_template,
+)
+from dolib.metrics import OpenTelemetryHooks, PrometheusCollector
+from dolib.retry import Retry
+from dolib.simulator import Simulator
+
+
+class Recorder(Hooks):
+    def __init__(self) -> None:
+        self.events: t.List[t.Any] = []
+
+    def on_request(self, event: RequestEvent) -> None:
+        self.events.append(event)
+
+    def on_response(self, event: ResponseEvent) -> None:
+        self.events.append(event)
+
+    def on_retry(self, event: RetryEvent) -> None:
+        self.events.append(event)
+
+    def on_page(self, event: PageEvent) -> None:
+        self.events.append(event)
+
+    def of(self, cls: type) -> t.List[t.Any]:
+        return [event for event in self.events if isinstance(event, cls)]
+
+
+class FakeSpan:
+    def __init__(self, name: str, attributes: t.Dict[str, t.Any]) -> None:
+        self.name = name
+        self.attributes = dict(attributes)
+        self.exceptions: t.List[Exception] = []
+        self.status: t.Any = None
+        self.ended = False
+
+    def set_attribute(self, key: str, value: t.Any) -> None:
+        self.attributes[key] = value
+
+    def record_exception(self, exc: Exception) -> None:
+        self.exceptions.append(exc)
+
+    def set_status(self, status: t.Any) -> None:
+        self.status = status
+
+    def end(self) -> None:
+        self.ended = True
+
+
+class FakeTracer:
+    def __init__(self) -> None:
+        self.spans: t.List[FakeSpan] = []
+
+    def start_span(self, name: str, attributes: t.Dict[str, t.Any]) -> FakeSpan:
+        span = FakeSpan(name, attributes)
+        self.spans.append(span)
+        return span
+
+
+def add_droplets(simulator: Simulator, count: int) -> None:
+    for i in range(count):
+        simulator.add(
+            "droplets", {"name": str(i), "region": "nyc1", "size": "s", "image": 1}
+        )
+
+
+def test_endpoint_template() -> None:
+    assert endpoint_template("droplets") == "droplets"
+    assert endpoint_template("droplets/123") == "droplets/{id}"
+    assert (
+        endpoint_template("/droplets/123/actions/456") == "droplets/{id}/actions/{id}"
+    )
+    assert endpoint_template("droplets/actions") == "droplets/actions"
+    assert endpoint_template("domains/example.com/records/7") == (
+        "domains/{id}/records/{id}"
+    )
+    assert endpoint_template("tags/web/resources") == "tags/{id}/resources"
+    assert endpoint_template("volumes/8c6b6e4a-0e1b-11ea-8c4a-0a58ac14d123") == (
+        "volumes/{id}"
+    )
+    assert endpoint_template("kubernetes/clusters/options") == (
+        "kubernetes/clusters/options"
+    )
+    assert endpoint_template("account/keys/512190") == "account/keys/{id}"
+
+
+def test_hooks_events() -> None:
+    simulator = Simulator()
+    add_droplets(simulator, 450)
+    simulator.fail("droplets/1$", status_code=503)
+    recorder = Recorder()
+    retry = Retry(backoff_factor=0, jitter=0)
+    with Client(
+        token="fake_token", transport=simulator, retry=retry, hooks=[recorder]
+    ) as client:
+        client.droplets.get("1")
+        requests = recorder.of(RequestEvent)
+        assert [(e.method, e.endpoint, e.attempt) for e in requests] == [
+            ("GET", "droplets/{id}", 0),
+            ("GET", "droplets/{id}", 1),
+        ]
+        responses = recorder.of(ResponseEvent)
+        assert [e.status_code for e in responses] == [503, 200]
+        assert responses[1].request is requests[1]
+        assert responses[1].elapsed >= 0
+        assert responses[1].response_bytes > 0
+        assert responses[1].ratelimit_remaining == 4998
+        [retry_event] = recorder.of(RetryEvent)
+        assert retry_event.reason == "503"
+        assert retry_event.request is requests[0]
+
+        recorder.events.clear()
+        client.droplets.all(max_workers=2)
+        pages = recorder.of(PageEvent)
+        assert sorted((e.endpoint, e.page, e.items) for e in pages) == [
+            ("droplets", 1, 200),
+            ("droplets", 2, 200),
+            ("droplets", 3, 50),
+        ]
+
+        recorder.events.clear()
+        list(client.iter_pages(endpoint="droplets", key="droplets"))
+        assert [e.page for e in recorder.of(PageEvent)] == [1, 2, 3]
+
+
+def test_hooks_transport_error() -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        raise httpx.ConnectError("refused", request=request)
+
+    recorder = Recorder()
+    with Client(
+        token="fake_token",
+        transport=httpx.MockTransport(handler),
+        retry=Retry(total=1, backoff_factor=0, jitter=0),
+        hooks=[recorder],
+    ) as client:
+        with pytest.raises(httpx.ConnectError):
+            client.request_raw(endpoint="account")
+    responses = recorder.of(ResponseEvent)
+    assert [e.status_code for e in responses] == [None, None]
+    assert isinstance(responses[0].error, httpx.ConnectError)
+    assert [e.reason for e in recorder.of(RetryEvent)] == ["ConnectError"]
+
+
+@pytest.mark.asyncio
+async def test_async_hooks_events() -> None:
+    simulator = Simulator()
+    add_droplets(simulator, 250)
+    recorder = Recorder()
+    async with AsyncClient(
+        token="fake_token", transport=simulator, hooks=[recorder]
+    ) as client:
+        await client.fetch_all(endpoint="droplets", key="droplets", concurrency=2)
+        assert sorted(e.page for e in recorder.of(PageEvent)) == [1, 2]
+        assert [e.status_code for e in recorder.of(ResponseEvent)] == [200, 200]
+
+        recorder.events.clear()
+        async for _ in client.iter_pages(endpoint="droplets", key="droplets"):
+            pass
+        assert [e.page for e in recorder.of(PageEvent)] == [1, 2]
+
+
+def test_prometheus_collector() -> None:
+    simulator = Simulator()
+    add_droplets(simulator, 250)
+    simulator.fail("droplets$", status_code=429, retry_after=0)
+    collector = PrometheusCollector()
+    with Client(
+        token="fake_token",
+        transport=simulator,
+        retry=Retry(backoff_factor=0, jitter=0),
+        hooks=[collector],
+    ) as client:
+        client.droplets.all()
+        client.droplets.get("1")
+        client.account.get()
+
+    assert collector.requests() == 5
+    assert collector.requests(endpoint="droplets") == 3
+    assert collector.requests(endpoint="droplets", status=429) == 1
+
+    text = collector.expose()
+    assert (
+        'dolib_requests_total{endpoint="droplets",method="GET",status="200"} 2.0'
+        in text
+    )
+    assert (
+        'dolib_requests_total{endpoint="droplets/{id}",method="GET",status="200"} 1.0'
+        in text
+    )
+    assert (
+        'dolib_retries_total{endpoint="droplets",method="GET",reason="429"} 1.0' in text
+    )
+    assert 'dolib_pages_total{endpoint="droplets"} 2.0' in text
+    assert 'dolib_page_items_total{endpoint="droplets"} 250.0' in text
+    assert (
+        'dolib_request_duration_seconds_bucket{endpoint="account",method="GET",'
+        'le="+Inf"} 1' in text
+    )
+    assert (
+        'dolib_request_duration_seconds_count{endpoint="account",method="GET"} 1'
+        in text
+    )
+    assert "# TYPE dolib_request_duration_seconds histogram" in text
+    assert "dolib_ratelimit_remaining 4995" in text
+    assert text.endswith("\n")
+    assert PrometheusCollector().expose() == ""
+
+
+def test_opentelemetry_hooks() -> None:
+    simulator = Simulator()
+    simulator.fail("droplets/1$", status_code=404)
+    tracer = FakeTracer()
+    with Client(
+        token="fake_token",
+        transport=simulator,
+        hooks=[OpenTelemetryHooks(tracer=tracer)],
+    ) as client:
+        client.account.get()
+        with pytest.raises(httpx.HTTPStatusError):
+            client.droplets.get("1")
+
+    account, droplet = tracer.spans
+    assert account.name == "GET account"
+    assert account.ended
+    assert account.attributes["http.status_code"] == 200
+    assert account.attributes["http.route"] == "account"
+    assert account.attributes["dolib.ratelimit_remaining"] == 4999
+    assert account.attributes["http.response_content_length"] > 0
+    assert droplet.name == "GET droplets/{id}"
+    assert droplet.attributes["http.status_code"] == 404
+    assert droplet.ended
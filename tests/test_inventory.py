@@ -0,0 +1,122 @@
+import os
+import typing as t
+
+import pytest
+
+from dolib.client import AsyncClient, Client
+from dolib.inventory import ADDED, CHANGED, REMOVED, InventoryStore
+from dolib.models import Domain, Droplet
+from dolib.simulator import Simulator
+
+
+def account() -> Simulator:
+    simulator = Simulator()
+    for i in range(3):
+        simulator.add(
+            "droplets",
+            {
+                "name": "web-{i}".format(i=i),
+                "region": "nyc1",
+                "size": "s",
+                "image": 1,
+                "tags": ["web"],
+            },
+        )
+    simulator.add("tags", {"name": "web"})
+    for name in ["example.com", "example.org"]:
+        simulator.add("domains", {"name": name})
+        simulator.add(
+            "domains/{name}/records".format(name=name),
+            {"type": "A", "name": "www", "data": "1.1.1.1"},
+        )
+    return simulator
+
+
+def kinds(changes: t.List[t.Any]) -> t.List[t.Tuple[str, str, str]]:
+    return [(change.type, change.id, change.kind) for change in changes]
+
+
+def test_inventory_store(tmp_path: t.Any) -> None:
+    simulator = account()
+    path = os.path.join(str(tmp_path), "inventory.db")
+    with Client(token="fake_token", transport=simulator) as client:
+        with InventoryStore(path) as store:
+            changes = store.refresh(client)
+            assert kinds(changes) == [
+                ("droplets", "1", ADDED),
+                ("droplets", "2", ADDED),
+                ("droplets", "3", ADDED),
+                ("tags", "web", ADDED),
+                ("domains", "example.com", ADDED),
+                ("domains", "example.org", ADDED),
+                ("domain_records", "example.com/4", ADDED),
+                ("domain_records", "example.org/5", ADDED),
+            ]
+            assert changes[0].data["name"] == "web-0"
+            assert store.last_seq == 8
+            requests = simulator.requests
+
+            # nothing changed
+            assert store.refresh(client) == []
+            assert simulator.requests == requests * 2
+
+            droplet = store.get("droplets", 1)
+            assert isinstance(droplet, Droplet)
+            assert droplet.name == "web-0"
+            assert store.get("droplets", 100) is None
+            assert [d.name for d in store.all("droplets")] == [
+                "web-0",
+                "web-1",
+                "web-2",
+            ]
+            records = store.all("domain_records", parent="example.org")
+            assert [(r.id, r.data) for r in records] == [(5, "1.1.1.1")]
+            assert isinstance(records[0], Domain.Record)
+            assert store.count("droplets") == 3
+            assert store.synced_at("droplets") is not None
+            assert store.synced_at("volumes") is not None
+            assert store.synced_at("unknown") is None
+
+            simulator.items("droplets")[0]["name"] = "renamed"
+            client.droplets.delete(client.droplets.get("2"))
+            client.domains.create_record(
+                "example.com", Domain.Record(type="A", name="api", data="2.2.2.2")
+            )
+            changes = store.refresh(client, types=["droplets", "domain_records"])
+            assert kinds(changes) == [
+                ("droplets", "1", CHANGED),
+                ("droplets", "2", REMOVED),
+                ("domain_records", "example.com/6", ADDED),
+            ]
+            assert changes[0].data["name"] == "renamed"
+            assert changes[1].data is None
+            assert store.get("droplets", 1).name == "renamed"
+
+        # store is persistent, the feed continues after sequence number
+        with InventoryStore(path) as store:
+            assert store.count("droplets") == 2
+            assert kinds(store.changes(since=8)) == kinds(changes)
+            assert kinds(store.changes(types=["domain_records"], since=8)) == [
+                ("domain_records", "example.com/6", ADDED)
+            ]
+            assert len(store.changes(limit=2)) == 2
+            store.prune(before=store.last_seq)
+            assert store.changes() == []
+            assert store.last_seq == 11
+
+    with pytest.raises(ValueError, match="unknown"):
+        InventoryStore().refresh(client, types=["unknown"])
+
+
+@pytest.mark.asyncio
+async def test_async_inventory_store() -> None:
+    simulator = account()
+    store = InventoryStore()
+    async with AsyncClient(token="fake_token", transport=simulator) as client:
+        changes = await store.async_refresh(client)
+        assert len(changes) == 8
+        assert await store.async_refresh(client) == []
+        simulator.items("domains/example.org/records")[0]["data"] = "3.3.3.3"
+        changes = await store.async_refresh(client, types=["domain_records"])
+        assert kinds(changes) == [("domain_records", "example.org/5", CHANGED)]
+    store.close()
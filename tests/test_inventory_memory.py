@@ -0,0 +1,172 @@
+import typing as t
+
+import pytest
+
+from dolib.client import AsyncClient, Client
+from dolib.inventory import Inventory, InventoryStore
+from dolib.simulator import Simulator
+
+VPC = "5a4981aa-9653-4bd1-bef5-d6bff52042e4"
+
+
+def network(ip: str, type: str) -> t.Dict[str, str]:
+    return {"ip_address": ip, "netmask": "255.255.0.0", "gateway": "", "type": type}
+
+
+def region(slug: str) -> t.Dict[str, t.Any]:
+    return {"name": slug, "slug": slug, "sizes": [], "available": True, "features": []}
+
+
+def account() -> Simulator:
+    simulator = Simulator()
+    for i in range(4):
+        simulator.add(
+            "droplets",
+            {
+                "name": "web-{i}".format(i=i),
+                "region": region("fra1" if i % 2 else "nyc1"),
+                "size": "s-1vcpu-1gb",
+                "image": 1,
+                "vpc_uuid": VPC,
+                "tags": ["web"] if i < 2 else ["db"],
+                "networks": {
+                    "v4": [
+                        network("10.10.0.{i}".format(i=i + 1), "private"),
+                        network("203.0.113.{i}".format(i=i + 1), "public"),
+                    ],
+                    "v6": [],
+                },
+                "volume_ids": [],
+            },
+        )
+    simulator.add(
+        "volumes",
+        {
+            "id": "vol-1",
+            "name": "data",
+            "region": region("fra1"),
+            "size_gigabytes": 10,
+            "droplet_ids": [2],
+        },
+    )
+    simulator.add(
+        "volumes",
+        {"id": "vol-2", "name": "spare", "region": "fra1", "size_gigabytes": 10},
+    )
+    simulator.add(
+        "firewalls",
+        {"name": "web", "tags": ["web"], "droplet_ids": []},
+    )
+    simulator.add(
+        "firewalls",
+        {"name": "db", "tags": [], "droplet_ids": [3]},
+    )
+    simulator.add(
+        "load_balancers",
+        {
+            "id": "lb-1",
+            "name": "lb",
+            "region": "nyc1",
+            "forwarding_rules": [],
+            "ip": "198.51.100.1",
+            "droplet_ids": [1, 2],
+        },
+    )
+    droplet = simulator.items("droplets")[3]
+    simulator.add("floating_ips", {"ip": "198.51.100.2", "droplet": dict(droplet)})
+    return simulator
+
+
+def names(items: t.List[t.Any]) -> t.List[str]:
+    return [item.name for item in items]
+
+
+def test_inventory() -> None:
+    simulator = account()
+    with Client(token="fake_token", transport=simulator) as client:
+        inventory = Inventory.from_client(client)
+
+        assert inventory.count("droplets") == 4
+        assert inventory.get("droplets", 1).name == "web-0"
+        assert inventory.get("volumes", "vol-1").name == "data"
+        assert inventory.find_one("droplets", ip="10.10.0.3").name == "web-2"
+        assert inventory.find_one("droplets", ip="10.10.0.99") is None
+        assert names(inventory.find("droplets", tag="web")) == ["web-0", "web-1"]
+        assert names(inventory.find("droplets", region="fra1")) == ["web-1", "web-3"]
+        assert names(inventory.find("droplets", region="fra1", tag="web")) == ["web-1"]
+        assert names(inventory.find("droplets", vpc=VPC, id=4)) == ["web-3"]
+        assert names(inventory.find("droplets", name="web-2")) == ["web-2"]
+        assert names(inventory.find("volumes", region="fra1")) == ["data", "spare"]
+        assert inventory.find_one("load_balancers", ip="198.51.100.1").name == "lb"
+        assert inventory.find_one("floating_ips", droplet=4).ip == "198.51.100.2"
+        with pytest.raises(ValueError, match="Unknown index"):
+            inventory.find("droplets", size="s")
+        with pytest.raises(ValueError, match="Unknown resource type"):
+            inventory.get("domains", "example.com")
+
+        web_1 = inventory.get("droplets", 2)
+        assert names(inventory.volumes_of(web_1)) == ["data"]
+        assert names(inventory.firewalls_of(web_1)) == ["web"]
+        assert names(inventory.load_balancers_of(web_1)) == ["lb"]
+        assert names(inventory.firewalls_of(inventory.get("droplets", 3))) == ["db"]
+        assert names(
+            inventory.droplets_of(inventory.find_one("firewalls", name="web"))
+        ) == [
+            "web-0",
+            "web-1",
+        ]
+        assert names(inventory.droplets_of(inventory.get("volumes", "vol-1"))) == [
+            "web-1"
+        ]
+
+        # volumes in fra1 attached to tagged droplets
+        assert [
+            volume.name
+            for droplet in inventory.find("droplets", tag="web")
+            for volume in inventory.volumes_of(droplet)
+            if inventory.find("volumes", region="fra1", id=volume.id)
+        ] == ["data"]
+
+        # incremental refresh
+        simulator.items("droplets")[2]["networks"]["v4"][0]["ip_address"] = "10.10.1.1"
+        client.request_raw("droplets/4", method="delete")
+        assert inventory.update("droplets", client.droplets.all()) == (0, 1, 1)
+        assert inventory.find("droplets", ip="10.10.0.3") == []
+        assert inventory.find_one("droplets", ip="10.10.1.1").name == "web-2"
+        assert inventory.find("droplets", ip="10.10.0.4") == []
+        assert inventory.count("droplets") == 3
+        assert names(inventory.find("droplets", region="fra1")) == ["web-1"]
+
+
+def test_inventory_change_feed() -> None:
+    simulator = account()
+    store = InventoryStore()
+    inventory = Inventory()
+    with Client(token="fake_token", transport=simulator) as client:
+        inventory.apply(store.refresh(client))
+        assert inventory.count("droplets") == 4
+        assert inventory.find_one("droplets", ip="10.10.0.2").name == "web-1"
+        assert inventory.find_one("floating_ips", droplet=4).ip == "198.51.100.2"
+
+        seq = store.last_seq
+        simulator.items("droplets")[0]["tags"] = ["db"]
+        client.request_raw("volumes/vol-2", method="delete")
+        store.refresh(client)
+        inventory.apply(store.changes(since=seq))
+        assert names(inventory.find("droplets", tag="db")) == [
+            "web-2",
+            "web-3",
+            "web-0",
+        ]
+        assert inventory.get("volumes", "vol-2") is None
+    store.close()
+
+
+@pytest.mark.asyncio
+async def test_async_inventory() -> None:
+    inventory = Inventory()
+    async with AsyncClient(token="fake_token", transport=account()) as client:
+        await inventory.async_refresh(client, types=["droplets", "volumes"])
+    assert inventory.count("droplets") == 4
+    assert inventory.count("firewalls") == 0
+    assert names(inventory.volumes_of(inventory.get("droplets", 2))) == ["data"]
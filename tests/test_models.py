@@ -1,6 +1,19 @@
+import pickle
+
 import pytest
+from pydantic import ValidationError
 
-from dolib.models import Certificate, Network, Region
+from dolib.models import (
+    Action,
+    BulkActionResult,
+    Certificate,
+    Domain,
+    Droplet,
+    Network,
+    Region,
+    construct,
+    lazy,
+)
 
 
 def test_repr() -> None:
@@ -19,3 +32,105 @@ def test_validators() -> None:
 
     with pytest.raises(ValueError, match="must be specified if type"):
         Certificate(name="test", type="lets_encrypt")
+
+
+def test_construct() -> None:
+    data = {
+        "id": 1,
+        "name": "test",
+        "region": {
+            "name": "test",
+            "slug": "tst",
+            "sizes": ["s-1vcpu-1gb"],
+            "available": True,
+            "features": [],
+        },
+        "size": "s-1vcpu-1gb",
+        "image": 1,
+        "networks": {
+            "v4": [
+                {
+                    "ip_address": "1.1.1.1",
+                    "netmask": "255.255.255.0",
+                    "gateway": "1.1.1.254",
+                    "type": "public",
+                }
+            ],
+            "v6": [],
+        },
+        "tags": ["test"],
+        "created_at": "2021-05-25T16:50:47Z",
+    }
+    droplet = construct(Droplet, data)
+    assert isinstance(droplet, Droplet)
+    assert droplet.region == Region(**data["region"])
+    assert droplet.networks.v4[0].ip_address == "1.1.1.1"
+    assert droplet.tags == ["test"]
+    assert droplet.user_data is None
+    # values aren't converted
+    assert droplet.created_at == "2021-05-25T16:50:47Z"
+    assert droplet.dict(exclude_unset=True).keys() == data.keys()
+
+
+def test_lazy() -> None:
+    data = {
+        "id": "1",
+        "name": "test",
+        "region": {
+            "name": "test",
+            "slug": "tst",
+            "sizes": [],
+            "available": True,
+            "features": [],
+        },
+        "size": "s-1vcpu-1gb",
+        "image": 1,
+        "networks": {"v4": [], "v6": []},
+        "created_at": "2021-05-25T16:50:47Z",
+    }
+    droplet = lazy(Droplet, data)
+    assert isinstance(droplet, Droplet)
+    assert droplet.__dict__ == {}
+    assert droplet.id == 1
+    assert droplet.__dict__ == {"id": 1}
+    assert droplet.region.slug == "tst"
+    assert isinstance(droplet.region, Region)
+    assert droplet.created_at.year == 2021
+    assert droplet.user_data is None
+
+    validated = Droplet(**data)
+    assert droplet == validated
+    assert droplet.dict() == validated.dict()
+    assert repr(droplet) == repr(validated)
+    assert pickle.loads(pickle.dumps(droplet)) == validated
+
+    with pytest.raises(AttributeError):
+        droplet.unknown
+
+    record = lazy(Domain.Record, {"id": "x", "type": "A"})
+    assert record.type == "A"
+    with pytest.raises(ValidationError, match="id"):
+        record.id
+
+
+def test_lazy_nested() -> None:
+    # pydantic copies models validated inside another model
+    data = {
+        "id": 1,
+        "status": "in-progress",
+        "type": "reboot",
+        "started_at": "2021-05-25T16:50:47Z",
+        "resource_type": "droplet",
+    }
+    action = lazy(Action, data)
+    assert action.id == 1
+    result = BulkActionResult(actions=[action], errors=[])
+    nested = result.actions[0]
+    assert nested is not action
+    assert nested.status == "in-progress"
+    assert nested.started_at.year == 2021
+    assert nested == Action(**data)
+
+    copied = lazy(Action, data).copy(update={"status": "completed"}, deep=True)
+    assert copied.status == "completed"
+    assert copied.type == "reboot"
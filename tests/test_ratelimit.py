@@ -0,0 +1,70 @@
+import time
+
+import pytest
+
+from dolib import Client
+from dolib.ratelimit import RateLimiter
+
+
+def test_rate_limiter_burst() -> None:
+    limiter = RateLimiter(limit=10, period=1, burst=3)
+    delays = [limiter.reserve() for _ in range(5)]
+    assert delays[:3] == [0, 0, 0]
+    assert delays[3] == pytest.approx(0.1, abs=0.01)
+    assert delays[4] == pytest.approx(0.2, abs=0.01)
+
+
+def test_rate_limiter_minute_limit() -> None:
+    limiter = RateLimiter()
+    now = time.monotonic()
+    times = [now + limiter.reserve() for _ in range(600)]
+    assert times[249] - now < 1
+    assert times[250] - now == pytest.approx(60, abs=1)
+    # no 60 seconds window has more than 250 requests
+    assert all(later - earlier >= 59.99 for earlier, later in zip(times, times[250:]))
+
+    limiter = RateLimiter(minute_limit=None)
+    assert max(limiter.reserve() for _ in range(300)) < 60
+
+
+def test_rate_limiter_headers() -> None:
+    # exhausted budget waits until reset
+    limiter = RateLimiter()
+    limiter.update(limit=5000, remaining=0, reset=time.time() + 5)
+    assert limiter.reserve() == pytest.approx(5, abs=0.1)
+
+    # low budget is spread until reset
+    limiter = RateLimiter()
+    limiter.update(limit=5000, remaining=2, reset=time.time() + 10)
+    assert limiter.reserve() == 0
+    assert limiter.reserve() == pytest.approx(5, abs=0.1)
+    assert limiter.remaining == 0
+
+    # expired window doesn't slow down requests
+    limiter = RateLimiter()
+    limiter.update(limit=5000, remaining=0, reset=time.time() - 1)
+    assert limiter.reserve() == 0
+    assert limiter.remaining is None
+
+    # endpoint limits don't change base pacing
+    limiter = RateLimiter(limit=10, period=1, burst=1)
+    limiter.update(limit=20, remaining=10, reset=time.time() + 1)
+    limiter.reserve()
+    assert limiter.reserve() == pytest.approx(0.1, abs=0.01)
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_async_wait() -> None:
+    limiter = RateLimiter(limit=100, period=1, burst=1)
+    start = time.monotonic()
+    for _ in range(3):
+        await limiter.async_wait()
+    assert time.monotonic() - start >= 0.015
+
+
+def test_client_rate_limiter() -> None:
+    assert isinstance(Client(token="fake_token").rate_limiter, RateLimiter)
+    assert Client(token="fake_token", rate_limiter=False).rate_limiter is None
+
+    limiter = RateLimiter()
+    assert Client(token="fake_token", rate_limiter=limiter).rate_limiter is limiter
@@ -0,0 +1,112 @@
+import typing as t
+from email.utils import formatdate
+
+import httpx
+import pytest
+
+from dolib import AsyncClient, Client
+from dolib.retry import Retry
+
+
+def flaky_handler(
+    failures: t.List[httpx.Response],
+) -> t.Callable[[httpx.Request], httpx.Response]:
+    def handler(request: httpx.Request) -> httpx.Response:
+        if failures:
+            failure = failures.pop(0)
+            if isinstance(failure, Exception):
+                raise failure
+            return failure
+        return httpx.Response(200, json={"account": {"uuid": "fake"}})
+
+    return handler
+
+
+def test_retry_policy() -> None:
+    retry = Retry(total=2, backoff_factor=1, jitter=0)
+    assert retry.is_retryable("get", 0, response=httpx.Response(503))
+    assert retry.is_retryable("DELETE", 1, response=httpx.Response(429))
+    assert not retry.is_retryable("get", 2, response=httpx.Response(503))
+    assert not retry.is_retryable("post", 0, response=httpx.Response(503))
+    assert not retry.is_retryable("get", 0, response=httpx.Response(404))
+    assert retry.is_retryable("get", 0, exc=httpx.ConnectError("reset"))
+    assert not retry.is_retryable("get", 0, exc=ValueError())
+
+    assert retry.get_backoff(0) == 1
+    assert retry.get_backoff(3) == 8
+    assert Retry(max_backoff=2, jitter=0).get_backoff(10) == 2
+    assert 0.5 <= Retry(backoff_factor=1, jitter=0.5).get_backoff(0) <= 1
+
+    response = httpx.Response(429, headers={"Retry-After": "7"})
+    assert retry.get_backoff(0, response) == 7
+    response = httpx.Response(429, headers={"Retry-After": formatdate(usegmt=True)})
+    assert retry.get_backoff(0, response) == 0
+    response = httpx.Response(429, headers={"Retry-After": "soon"})
+    assert Retry.parse_retry_after(response) is None
+
+
+def test_client_retry() -> None:
+    failures = [httpx.Response(503), httpx.ConnectError("reset"), httpx.Response(502)]
+    client = Client(
+        token="fake_token",
+        rate_limiter=False,
+        retry=Retry(backoff_factor=0.001),
+        transport=httpx.MockTransport(flaky_handler(failures)),
+    )
+    assert client.request(endpoint="account")["account"]["uuid"] == "fake"
+    assert failures == []
+
+    # retries are exhausted
+    failures += [httpx.Response(503)] * 4
+    with pytest.raises(httpx.HTTPStatusError):
+        client.request(endpoint="account")
+    assert failures == []
+
+    # non idempotent methods are not retried
+    failures += [httpx.Response(503)]
+    with pytest.raises(httpx.HTTPStatusError):
+        client.request(endpoint="account", method="post")
+
+    # retries are disabled
+    client.retry = None
+    failures += [httpx.ConnectError("reset")]
+    with pytest.raises(httpx.ConnectError):
+        client.request(endpoint="account")
+
+
+@pytest.mark.asyncio
+async def test_async_client_retry() -> None:
+    failures = [httpx.Response(429, headers={"Retry-After": "0"}), httpx.Response(500)]
+    async with AsyncClient(
+        token="fake_token",
+        rate_limiter=False,
+        retry=Retry(backoff_factor=0.001),
+        transport=httpx.MockTransport(flaky_handler(failures)),
+    ) as async_client:
+        res = await async_client.request(endpoint="account")
+        assert res["account"]["uuid"] == "fake"
+        assert failures == []
+
+
+def test_fetch_all_resumes_failed_page() -> None:
+    requested: t.List[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requested.append(request.url.params.get("page", "1"))
+        if request.url.params.get("page") == "2":
+            if requested.count("2") == 1:
+                return httpx.Response(502)
+            return httpx.Response(200, json={"items": [2], "links": {}})
+        next_url = str(request.url.copy_set_param("page", "2"))
+        return httpx.Response(
+            200, json={"items": [1], "links": {"pages": {"next": next_url}}}
+        )
+
+    client = Client(
+        token="fake_token",
+        rate_limiter=False,
+        retry=Retry(backoff_factor=0.001),
+        transport=httpx.MockTransport(handler),
+    )
+    assert client.fetch_all(endpoint="items", key="items") == [1, 2]
+    assert requested == ["1", "2", "2"]
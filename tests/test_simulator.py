@@ -0,0 +1,151 @@
+import time
+
+import httpx
+import pytest
+
+from dolib.client import AsyncClient, Client
+from dolib.models import Domain, Droplet, Tag
+from dolib.retry import Retry
+from dolib.simulator import Simulator
+
+
+def test_simulator_crud() -> None:
+    simulator = Simulator()
+    with Client(token="fake_token", transport=simulator) as client:
+        droplet = client.droplets.create(
+            Droplet(name="test", region="nyc1", size="s-1vcpu-1gb", image=1)
+        )
+        assert droplet.id is not None
+        assert client.droplets.get(str(droplet.id)) == droplet
+        assert client.droplets.all() == [droplet]
+
+        client.tags.create(Tag(name="web"))
+        assert [tag.name for tag in client.tags.all()] == ["web"]
+
+        client.domains.create(Domain(name="example.com"))
+        record = client.domains.create_record(
+            "example.com", Domain.Record(type="A", name="www", data="1.1.1.1")
+        )
+        assert client.domains.records("example.com") == [record]
+
+        client.droplets.delete(droplet)
+        with pytest.raises(httpx.HTTPStatusError) as exc:
+            client.droplets.get(str(droplet.id))
+        assert exc.value.response.status_code == 404
+        assert exc.value.response.json()["id"] == "not_found"
+
+    assert simulator.requests == 10
+    assert simulator.items("droplets") == []
+
+
+def test_simulator_pagination() -> None:
+    simulator = Simulator()
+    for i in range(450):
+        simulator.add(
+            "droplets", {"name": str(i), "region": "nyc1", "size": "s", "image": 1}
+        )
+    with Client(token="fake_token", transport=simulator) as client:
+        droplets = client.droplets.all(max_workers=3)
+        assert [droplet.name for droplet in droplets] == [str(i) for i in range(450)]
+        assert simulator.requests == 3
+        assert len(client.droplets.all(validate=False)) == 450
+
+
+def test_simulator_actions() -> None:
+    simulator = Simulator(action_duration=0.05)
+    droplet = simulator.add(
+        "droplets", {"name": "test", "region": "nyc1", "size": "s", "image": 1}
+    )
+    with Client(token="fake_token", transport=simulator) as client:
+        action = client.droplets.reboot(str(droplet["id"]))
+        assert action.status == "in-progress"
+        assert action.resource_id == droplet["id"]
+        action = client.actions.wait(action, timeout=5, interval=0.01)
+        assert action.status == "completed"
+        assert client.droplets.actions(str(droplet["id"])) == [action]
+        assert client.actions.all() == [action]
+
+
+def test_simulator_failures() -> None:
+    simulator = Simulator(ratelimit=3, ratelimit_period=60)
+    retry = Retry(backoff_factor=0, jitter=0)
+    with Client(
+        token="fake_token", transport=simulator, rate_limiter=False, retry=retry
+    ) as client:
+        simulator.fail("GET /v2/account", status_code=503, times=2)
+        assert client.account.get().status == "active"
+        assert simulator.requests == 3
+        assert client._ratelimit_remaining == 0
+
+        with pytest.raises(httpx.HTTPStatusError) as exc:
+            client.request_raw("regions", method="post")
+        assert exc.value.response.status_code == 429
+        assert exc.value.response.headers["Ratelimit-Remaining"] == "0"
+
+    simulator = Simulator(error_rate=1.0, error_status=500, seed=1)
+    with Client(token="fake_token", transport=simulator, retry=False) as client:
+        with pytest.raises(httpx.HTTPStatusError, match="500"):
+            client.regions.all()
+
+
+def test_simulator_latency() -> None:
+    simulator = Simulator(latency=lambda: 0.02)
+    with Client(token="fake_token", transport=simulator) as client:
+        start = time.monotonic()
+        client.droplets.all()
+        assert time.monotonic() - start >= 0.02
+
+
+def test_simulator_compression() -> None:
+    simulator = Simulator(bandwidth=1e6)
+    for i in range(200):
+        simulator.add(
+            "droplets", {"name": str(i), "region": "nyc1", "size": "s", "image": 1}
+        )
+    with Client(token="fake_token", transport=simulator) as client:
+        response = client.request_raw("droplets", params={"per_page": 200})
+        assert "gzip" in response.request.headers["Accept-Encoding"]
+        assert response.headers["Content-Encoding"] == "gzip"
+        assert len(client.droplets.all()) == 200
+        compressed = response.num_bytes_downloaded
+        assert compressed == int(response.headers["Content-Length"])
+        assert compressed * 5 < len(response.content)
+
+    with Client(token="fake_token", transport=simulator, compression=False) as client:
+        start = time.monotonic()
+        response = client.request_raw("droplets", params={"per_page": 200})
+        assert time.monotonic() - start >= len(response.content) / 1e6
+        assert response.request.headers["Accept-Encoding"] == "identity"
+        assert "Content-Encoding" not in response.headers
+        assert response.num_bytes_downloaded == len(response.content)
+    assert simulator.bytes_sent == 2 * compressed + len(response.content)
+
+
+def test_base_url() -> None:
+    requested = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requested.append(str(request.url))
+        return httpx.Response(200, json={"regions": []})
+
+    transport = httpx.MockTransport(handler)
+    with Client(
+        token="fake_token", base_url="http://localhost:8080/v2/", transport=transport
+    ) as client:
+        assert client.regions.all() == []
+    assert requested == ["http://localhost:8080/v2/regions?per_page=200"]
+
+
+@pytest.mark.asyncio
+async def test_async_simulator() -> None:
+    simulator = Simulator(latency=0.001)
+    for i in range(450):
+        simulator.add("tags", {"name": "tag-{i}".format(i=i)})
+    async with AsyncClient(
+        token="fake_token", transport=simulator, page_concurrency=3
+    ) as client:
+        tags = await client.tags.all()
+        assert len(tags) == 450
+        tag = await client.tags.get("tag-1")
+        assert tag.name == "tag-1"
+    assert simulator.requests == 4
@@ -0,0 +1,104 @@
+import math
+
+import pytest
+
+from dolib.table import DropletTable
+
+DROPLETS = [
+    {
+        "id": 1,
+        "memory": 1024,
+        "vcpus": 1,
+        "disk": 25,
+        "status": "active",
+        "size_slug": "s-1vcpu-1gb",
+        "region": {"slug": "fra1"},
+        "created_at": "2021-05-25T16:50:47Z",
+        "tags": ["web", "prod"],
+    },
+    {
+        "id": 2,
+        "memory": 2048,
+        "vcpus": 2,
+        "disk": 50,
+        "status": "off",
+        "size": {"slug": "s-2vcpu-2gb"},
+        "region": "nyc1",
+        "created_at": "2021-05-26T16:50:47Z",
+        "tags": [],
+    },
+    {
+        "id": 3,
+        "memory": 2048,
+        "vcpus": 2,
+        "disk": 50,
+        "status": "active",
+        "size_slug": "s-2vcpu-2gb",
+        "region": {"slug": "fra1"},
+        "created_at": None,
+        "tags": ["web"],
+    },
+]
+
+
+def test_table_columns() -> None:
+    table = DropletTable.from_droplets(DROPLETS)
+    assert len(table) == 3
+    assert list(table["id"]) == [1, 2, 3]
+    assert table["region"] == ["fra1", "nyc1", "fra1"]
+    assert table["size_slug"] == ["s-1vcpu-1gb", "s-2vcpu-2gb", "s-2vcpu-2gb"]
+    assert table["tags"] == [["web", "prod"], [], ["web"]]
+    assert table["created_at"][0] == 1621961447.0
+    assert math.isnan(table["created_at"][2])
+    with pytest.raises(KeyError):
+        table["unknown"]
+
+
+def test_table_filter() -> None:
+    table = DropletTable.from_droplets(DROPLETS)
+    assert list(table.filter(region="fra1")["id"]) == [1, 3]
+    assert list(table.filter(region="fra1", status="off")["id"]) == []
+    assert list(table.filter(region="ams3")["id"]) == []
+    assert list(table.filter(tag="web", memory=2048)["id"]) == [3]
+    assert list(table.filter(vcpus=lambda vcpus: vcpus > 1)["id"]) == [2, 3]
+    assert list(table.filter(status=lambda s: s != "off")["id"]) == [1, 3]
+    assert list(table.filter([True, False, True], tag="prod")["id"]) == [1]
+    assert table.filter(tag="web")["tags"] == [["web", "prod"], ["web"]]
+
+
+def test_table_aggregate() -> None:
+    table = DropletTable.from_droplets(DROPLETS)
+    assert table.sum("vcpus") == 5
+    assert table.sum("vcpus", by="region") == {"fra1": 3, "nyc1": 2}
+    assert table.sum("memory", by="tag") == {"web": 3072, "prod": 1024}
+    assert table.count() == 3
+    assert table.count(by="size_slug") == {"s-1vcpu-1gb": 1, "s-2vcpu-2gb": 2}
+    assert table.filter(status="active").count(by="region") == {"fra1": 2}
+
+    groups = table.group_by("region")
+    assert list(groups) == ["fra1", "nyc1"]
+    assert list(groups["fra1"]["id"]) == [1, 3]
+    assert list(table.group_by("tags")["prod"]["id"]) == [1]
+
+
+def test_table_indexes() -> None:
+    table = DropletTable.from_droplets(DROPLETS)
+    assert list(table.filter(memory=2048)["id"]) == [2, 3]
+    assert list(table.filter(id=lambda id: id != 2, disk=50)["id"]) == [3]
+    assert list(table.filter(created_at=1621961447.0)["id"]) == [1]
+    assert len(table.filter(memory=4096)) == 0
+
+    # indexes are rebuilt after new rows are added
+    table.extend([dict(DROPLETS[0], id=4, region="ams3", tags=["db"])])
+    assert list(table.filter(memory=1024)["id"]) == [1, 4]
+    assert list(table.filter(tag="db")["id"]) == [4]
+    assert table.count(by="region") == {"fra1": 2, "nyc1": 1, "ams3": 1}
+
+    # tables made by take don't share categories with the source
+    subset = table.filter(region="nyc1")
+    subset.extend([dict(DROPLETS[1], id=5, region="sgp1", tags=["new"])])
+    assert subset["region"] == ["nyc1", "sgp1"]
+    assert subset["tags"] == [[], ["new"]]
+    assert "sgp1" not in table.categories["region"].values
+    assert "new" not in table.tags.values
+    assert table["region"] == ["fra1", "nyc1", "fra1", "ams3"]
@@ -0,0 +1,177 @@
+import io
+import typing as t
+
+import pytest
+
+from dolib import zonefile
+from dolib.client import AsyncClient, Client
+from dolib.models import Domain
+from dolib.simulator import Simulator
+
+ZONE = """$ORIGIN example.com.
+$TTL 1800
+example.com. IN SOA ns1.digitalocean.com. hostmaster.example.com. (
+    1622404940 ; serial
+    10800 3600 604800 1800 )
+example.com. 1800 IN NS ns1.digitalocean.com.
+@ 60 IN A 203.0.113.10
+    IN AAAA 2001:db8::10 ; same owner
+www 1h CNAME @
+@ MX 10 mail
+mail.example.com. A 203.0.113.20
+txt IN 300 TXT "v=spf1 \\"quoted\\"" " and; more"
+_sip._tcp SRV 10 5 5060 sip.example.net.
+@ CAA 0 issue "letsencrypt.org"
+$ORIGIN sub.example.com.
+api A 203.0.113.30
+"""
+
+
+def fields(record: Domain.Record) -> t.Dict[str, t.Any]:
+    return {key: value for key, value in record.dict().items() if value is not None}
+
+
+def test_parse() -> None:
+    records = list(zonefile.parse(ZONE))
+    assert [fields(record) for record in records[2:]] == [
+        {"type": "A", "name": "@", "data": "203.0.113.10", "ttl": 60},
+        {"type": "AAAA", "name": "@", "data": "2001:db8::10", "ttl": 1800},
+        {"type": "CNAME", "name": "www", "data": "@", "ttl": 3600},
+        {
+            "type": "MX",
+            "name": "@",
+            "data": "mail.example.com.",
+            "priority": 10,
+            "ttl": 1800,
+        },
+        {"type": "A", "name": "mail", "data": "203.0.113.20", "ttl": 1800},
+        {"type": "TXT", "name": "txt", "data": 'v=spf1 "quoted" and; more', "ttl": 300},
+        {
+            "type": "SRV",
+            "name": "_sip._tcp",
+            "data": "sip.example.net.",
+            "priority": 10,
+            "weight": 5,
+            "port": 5060,
+            "ttl": 1800,
+        },
+        {
+            "type": "CAA",
+            "name": "@",
+            "data": "letsencrypt.org",
+            "flags": 0,
+            "tag": "issue",
+            "ttl": 1800,
+        },
+        {"type": "A", "name": "api.sub", "data": "203.0.113.30", "ttl": 1800},
+    ]
+    assert records[0].type == "SOA"
+    assert records[0].data.endswith("604800 1800")
+    assert fields(records[1]) == {
+        "type": "NS",
+        "name": "@",
+        "data": "ns1.digitalocean.com.",
+        "ttl": 1800,
+    }
+
+    # names stay relative without an origin
+    assert fields(next(zonefile.parse("www CNAME app\n"))) == {
+        "type": "CNAME",
+        "name": "www",
+        "data": "app",
+    }
+    assert next(zonefile.parse("www A 1.1.1.1", origin="example.com")).ttl is None
+
+    for text, message in [
+        ("$INCLUDE other.zone\n", "line 1: \\$INCLUDE is not supported"),
+        ("@ A 1.1.1.1\n  60 IN\n", "line 2: missing record type"),
+        ("  A 1.1.1.1\n", "line 1: missing owner name"),
+        ("@ MX ten mail\n", "line 1: invalid MX record"),
+        ("@ SOA ns1 ( 1 2\n", "unbalanced parentheses"),
+    ]:
+        with pytest.raises(ValueError, match=message):
+            list(zonefile.parse(text))
+
+
+def test_parse_is_lazy() -> None:
+    read = []
+
+    def lines() -> t.Iterator[str]:
+        for i in range(100000):
+            read.append(i)
+            yield "host-{i} A 10.0.0.1\n".format(i=i)
+
+    records = zonefile.parse(lines(), origin="example.com")
+    assert next(records).name == "host-0"
+    assert len(read) == 1
+
+
+def test_write() -> None:
+    records = list(zonefile.parse(ZONE))
+    file = io.StringIO()
+    assert zonefile.write(records, file, origin="example.com") == len(records)
+    text = file.getvalue()
+    assert text.startswith("$ORIGIN example.com.\n@\t1800\tIN\tSOA\tns1.")
+    assert 'txt\t300\tIN\tTXT\t"v=spf1 \\"quoted\\" and; more"\n' in text
+    assert list(zonefile.parse(text)) == records
+
+    # long TXT data is split into strings of 255 characters
+    record = Domain.Record(type="TXT", name="dkim", data="k" * 300)
+    assert zonefile.format_record(record) == 'dkim\tIN\tTXT\t"{0}" "{1}"'.format(
+        "k" * 255, "k" * 45
+    )
+    assert next(zonefile.parse(zonefile.format_record(record))) == record
+    # the API returns host names without the final dot
+    record = Domain.Record(type="CNAME", name="www", data="app.example.net", ttl=60)
+    assert zonefile.format_record(record) == "www\t60\tIN\tCNAME\tapp.example.net."
+
+
+def account() -> Simulator:
+    simulator = Simulator()
+    simulator.add("domains", {"name": "example.com"})
+    for i in range(450):
+        simulator.add(
+            "domains/example.com/records",
+            {"type": "A", "name": "host-{i}".format(i=i), "data": "10.0.0.1"},
+        )
+    simulator.add(
+        "domains/example.com/records",
+        {"type": "MX", "name": "@", "data": "mail.example.com", "priority": 10},
+    )
+    return simulator
+
+
+def test_export_zone() -> None:
+    file = io.StringIO()
+    with Client(token="fake_token", transport=account()) as client:
+        assert client.domains.export_zone("example.com", file) == 451
+    lines = file.getvalue().splitlines()
+    assert lines[:2] == ["$ORIGIN example.com.", "host-0\tIN\tA\t10.0.0.1"]
+    assert lines[-1] == "@\tIN\tMX\t10 mail.example.com."
+
+    # migrate the zone to another account
+    target = Simulator()
+    target.add("domains", {"name": "example.com"})
+    file.seek(0)
+    with Client(token="fake_token", transport=target, rate_limiter=False) as client:
+        result = client.domains.sync(
+            "example.com", zonefile.parse(file, origin="example.com")
+        )
+    assert result.ok
+    assert len(result.create) == 451
+    assert len(target.items("domains/example.com/records")) == 451
+
+
+@pytest.mark.asyncio
+async def test_async_export_zone() -> None:
+    file = io.StringIO()
+    async with AsyncClient(token="fake_token", transport=account()) as client:
+        assert await client.domains.export_zone("example.com", file, ttl=600) == 451
+    with Client(token="fake_token", transport=account()) as client:
+        expected = io.StringIO()
+        client.domains.export_zone("example.com", expected, ttl=600)
+    assert file.getvalue() == expected.getvalue()
+    assert file.getvalue().startswith("$ORIGIN example.com.\n$TTL 600\n")
+    records = list(zonefile.parse(file.getvalue()))
+    assert len(records) == 451
+    assert records[-1].data == "mail.example.com."